@@ -0,0 +1,105 @@
+"""Single entry point for the scripts: python ballknowers.py <command> [options].
+
+Only argparse is imported here. A command's module, and the heavy libraries it needs
+(requests, NumPy, pandas, bs4, cloudscraper), are imported when that command runs, so
+--help and the cache-only commands start in roughly the time of a bare interpreter.
+
+--metrics FILE writes per-stage timings and counters (rows parsed, cache hits, HTTP retries,
+bytes) as JSON lines; --profile FILE runs the command under cProfile and saves the stats.
+"""
+import argparse
+import importlib
+import os
+import sys
+
+# command -> (module with a main(argv) function, one-line help)
+COMMANDS = {
+    'report': ('fantasy_report', 'Daily fantasy report, or a season backfill into the store'),
+    'draft': ('draft_report', 'Draft picks with their managers for one or more leagues, in one CSV'),
+    'league': ('main', 'League overview: members, standings and draft picks'),
+    'awards': ('league_metrics', 'Season awards for a Sleeper league'),
+    'trends': ('weekly_trends', "Who's hot: rolling fantasy point trends from the season store"),
+    'batch': ('league_batch', 'Nightly summaries and draft reports for every league in leagues.json'),
+    'live': ('live_scoring', "Live standings for the current week's matchups, printing only what changed"),
+    'values': ('draft_value', 'Pick-vs-ADP value, reaches, steals and draft grades across leagues'),
+    'serve': ('read_api', 'Local HTTP API over the stored box scores, league summaries and draft reports'),
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='ballknowers', description="Fantasy basketball tools for Sleeper leagues")
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument('--record', metavar='DIR', help='Save every HTTP response the command receives to DIR')
+    fixtures.add_argument('--replay', metavar='DIR', help='Serve HTTP from the responses recorded in DIR, offline')
+    parser.add_argument('--latency', type=float, default=0.0, metavar='MS',
+                        help='Milliseconds the replay server waits before each response')
+    parser.add_argument('--metrics', metavar='FILE',
+                        help="Append stage timings and counters to FILE as JSON lines ('-' for stderr)")
+    parser.add_argument('--profile', metavar='FILE',
+                        help='Profile the command with cProfile, save the stats to FILE and print the top calls')
+    commands = parser.add_subparsers(dest='command', metavar='command', required=True)
+    for name, (_, help_text) in COMMANDS.items():
+        # Each command's own parser handles its options, including --help
+        commands.add_parser(name, help=help_text, add_help=False)
+    return parser
+
+
+def profiled(fn, path, top=25):
+    """Runs fn() under cProfile, dumps the stats to path (for snakeviz/pstats) and prints the top calls."""
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(fn)
+    finally:
+        profiler.dump_stats(path)
+        stats = pstats.Stats(profiler, stream=sys.stderr)
+        stats.sort_stats('cumulative').print_stats(top)
+        print(f"✓ Profile saved to: {path}", file=sys.stderr)
+
+
+def run_command(module, rest, args):
+    if not (args.record or args.replay):
+        return module.main(rest)
+
+    import http_fixtures
+
+    store = http_fixtures.FixtureStore(args.record or args.replay)
+    if args.record:
+        http_fixtures.record(store)
+        try:
+            return module.main(rest)
+        finally:
+            http_fixtures.uninstall()
+            print(f"✓ {len(store)} recorded response(s) in {store.path}", file=sys.stderr)
+
+    with http_fixtures.StandInServer(store, latency=args.latency / 1000) as server:
+        http_fixtures.replay(server.url)
+        try:
+            return module.main(rest)
+        finally:
+            http_fixtures.uninstall()
+            if server.misses:
+                print(f"⚠️  {len(server.misses)} request(s) had no fixture, e.g. {server.misses[0]}", file=sys.stderr)
+
+
+def main(argv=None):
+    args, rest = build_parser().parse_known_args(sys.argv[1:] if argv is None else argv)
+    import metrics  # stdlib only; also picks up BALLKNOWERS_METRICS
+
+    if args.metrics:
+        metrics.configure(args.metrics)
+    module = importlib.import_module(COMMANDS[args.command][0])
+    # The command's parser takes its prog from argv[0]; include the command so usage lines read correctly
+    sys.argv[0] = f"{os.path.basename(sys.argv[0])} {args.command}"
+
+    def run():
+        with metrics.stage('command', command=args.command):
+            return run_command(module, rest, args)
+
+    return profiled(run, args.profile) if args.profile else run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
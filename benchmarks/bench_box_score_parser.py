@@ -0,0 +1,137 @@
+"""Benchmarks the header-driven box-score parser against the original BeautifulSoup parser.
+
+Usage: python benchmarks/bench_box_score_parser.py [debug_response_*.html ...]
+
+With no arguments it uses every debug_response_*.html in the working directory, or, if there are
+none, synthetic daily leaders pages rebuilt from the committed fantasy_report_*.json files.
+Each page is also parsed again with its columns shuffled to check the fast parser is unaffected.
+"""
+import glob
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from box_score_parser import _CELL_RE, _ROW_RE, find_stats_table, parse_box_scores  # noqa: E402
+from fantasy_report import parse_box_scores_soup  # noqa: E402
+
+# Column order of the live daily leaders table
+DAILY_LEADERS_COLUMNS = [
+    ('ranker', 'Rk'), ('player', 'Player'), ('team_id', 'Tm'), ('game_location', ''), ('opp_id', 'Opp'),
+    ('game_result', ''), ('mp', 'MP'), ('fg', 'FG'), ('fga', 'FGA'), ('fg_pct', 'FG%'), ('fg3', '3P'),
+    ('fg3a', '3PA'), ('fg3_pct', '3P%'), ('ft', 'FT'), ('fta', 'FTA'), ('ft_pct', 'FT%'), ('orb', 'ORB'),
+    ('drb', 'DRB'), ('trb', 'TRB'), ('ast', 'AST'), ('stl', 'STL'), ('blk', 'BLK'), ('tov', 'TOV'),
+    ('pf', 'PF'), ('pts', 'PTS'), ('plus_minus', '+/-'),
+]
+REPEATS = 5
+
+
+def _pct(made, attempted):
+    return f"{made / attempted:.3f}".lstrip('0') if attempted else ''
+
+
+def synthetic_page(players):
+    """Renders box-score dicts as a Basketball-Reference style daily leaders page."""
+    header = ''.join(f'<th aria-label="{label}" data-stat="{stat}" scope="col">{label}</th>'
+                     for stat, label in DAILY_LEADERS_COLUMNS)
+    rows = []
+    for rank, p in enumerate(players, 1):
+        values = {
+            'ranker': rank,
+            'player': f'<a href="/players/x/x01.html">{p["name"]}</a>',
+            'team_id': f'<a href="/teams/{p["team"]}/2026.html">{p["team"]}</a>',
+            'game_location': '@' if p['location'] == 'AWAY' else '',
+            'opp_id': f'<a href="/teams/{p["opponent"]}/2026.html">{p["opponent"]}</a>',
+            'game_result': 'W' if p['outcome'] == 'WIN' else 'L',
+            'mp': f'{p["minutes_played"]}:00',
+            'fg': p['made_field_goals'], 'fga': p['attempted_field_goals'],
+            'fg_pct': _pct(p['made_field_goals'], p['attempted_field_goals']),
+            'fg3': p['made_three_point_field_goals'], 'fg3a': p['attempted_three_point_field_goals'],
+            'fg3_pct': _pct(p['made_three_point_field_goals'], p['attempted_three_point_field_goals']),
+            'ft': p['made_free_throws'], 'fta': p['attempted_free_throws'],
+            'ft_pct': _pct(p['made_free_throws'], p['attempted_free_throws']),
+            'orb': p['offensive_rebounds'], 'drb': p['defensive_rebounds'], 'trb': p['total_rebounds'],
+            'ast': p['assists'], 'stl': p['steals'], 'blk': p['blocks'], 'tov': p['turnovers'],
+            'pf': p['personal_fouls'], 'pts': p['points'], 'plus_minus': p['plus_minus'],
+        }
+        cells = ''.join(
+            f'<th data-stat="ranker" scope="row">{values[stat]}</th>' if stat == 'ranker'
+            else f'<td class="right" data-stat="{stat}">{values[stat]}</td>'
+            for stat, _ in DAILY_LEADERS_COLUMNS
+        )
+        rows.append(f'<tr>{cells}</tr>')
+        if rank % 20 == 0:
+            rows.append(f'<tr class="thead">{header}</tr>')
+    return ('<html><head><title>NBA Daily Leaders</title></head><body><div id="content">'
+            '<table class="sortable stats_table" id="stats"><thead><tr>' + header + '</tr></thead>'
+            '<tbody>' + ''.join(rows) + '</tbody></table></div></body></html>')
+
+
+def load_pages(paths):
+    if paths:
+        return [(path, open(path, encoding='utf-8').read()) for path in paths]
+    pages = [(path, open(path, encoding='utf-8').read()) for path in sorted(glob.glob('debug_response_*.html'))]
+    if pages:
+        return pages
+    for path in sorted(glob.glob('fantasy_report_*.json')):
+        with open(path) as f:
+            players = json.load(f)['top_players']
+        # A real slate has ~250 rows; repeat the saved top 20 to match
+        pages.append((f'synthetic:{path}', synthetic_page((players * 13)[:260])))
+    return pages
+
+
+def shuffle_columns(page, seed=0):
+    """Returns page with the stats table's columns in a random (but consistent) order."""
+    table = find_stats_table(page)
+    order = None
+
+    def reorder(match):
+        nonlocal order
+        cells = [m.group(0) for m in _CELL_RE.finditer(match.group(2))]
+        if order is None:
+            order = list(range(len(cells)))
+            random.Random(seed).shuffle(order)
+        if len(cells) != len(order):
+            return match.group(0)
+        return f'<tr{match.group(1)}>' + ''.join(cells[i] for i in order) + '</tr>'
+
+    return page.replace(table, _ROW_RE.sub(reorder, table))
+
+
+def best_time(fn, page):
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn(page)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(paths):
+    pages = load_pages(paths)
+    if not pages:
+        print("No debug_response_*.html or fantasy_report_*.json files found")
+        return 1
+
+    ok = True
+    print(f"{'page':45s} {'rows':>5s} {'soup ms':>9s} {'fast ms':>9s} {'speedup':>8s}  checks")
+    for name, page in pages:
+        reference = parse_box_scores_soup(page)
+        fast = parse_box_scores(page)
+        shuffled = parse_box_scores(shuffle_columns(page))
+        soup_t = best_time(parse_box_scores_soup, page)
+        fast_t = best_time(parse_box_scores, page)
+        same = fast == reference
+        reordered = shuffled == fast
+        ok &= same and reordered
+        print(f"{name[-45:]:45s} {len(fast):5d} {soup_t * 1e3:9.2f} {fast_t * 1e3:9.2f} {soup_t / fast_t:7.1f}x  "
+              f"{'match' if same else 'MISMATCH'}, {'reorder-safe' if reordered else 'REORDER MISMATCH'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,143 @@
+"""Memory and throughput of decoding a season of Sleeper payloads into the model classes.
+
+Usage: python benchmarks/bench_models.py [--leagues N]
+
+Compares the original path (json.loads, then Model(**dict) into classes with a per-instance
+__dict__) against models.decoding (orjson when installed, then slotted models) on synthetic
+draft picks, rosters and 25 weeks of matchups for N 16-team leagues.
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import decoding  # noqa: E402
+from models.draft_pick import DraftPick, PlayerMetadata  # noqa: E402
+from models.matchup import Matchup  # noqa: E402
+from models.roster import Roster  # noqa: E402
+
+TEAMS = 16
+ROUNDS = 13
+WEEKS = 25
+REPEATS = 5
+
+
+def _dict_class(cls, extra_globals=None):
+    """Copy of a model class without __slots__, i.e. how the models were before."""
+    init = cls.__init__
+    if extra_globals:
+        init = types.FunctionType(init.__code__, {**init.__globals__, **extra_globals}, init.__name__,
+                                  init.__defaults__, init.__closure__)
+    return type(f"Dict{cls.__name__}", (), {'__init__': init, '__repr__': cls.__repr__})
+
+
+DictPlayerMetadata = _dict_class(PlayerMetadata)
+DictDraftPick = _dict_class(DraftPick, {'PlayerMetadata': DictPlayerMetadata})
+DictRoster = _dict_class(Roster)
+DictMatchup = _dict_class(Matchup)
+
+
+def synthetic_league(rng, league_no):
+    players = [str(1000 + i) for i in range(TEAMS * ROUNDS)]
+    picks = []
+    for pick_no, pid in enumerate(players, 1):
+        picks.append({
+            "draft_id": f"draft{league_no}", "draft_slot": (pick_no - 1) % TEAMS + 1, "is_keeper": None,
+            "metadata": {
+                "first_name": f"First{pid}", "last_name": f"Last{pid}", "injury_status": rng.choice(["", "Out", "DTD"]),
+                "news_updated": "1728750357037", "number": str(rng.randint(0, 99)), "player_id": pid,
+                "position": rng.choice(["PG", "SG", "SF", "PF", "C"]), "sport": "nba", "status": "ACT",
+                "team": "SAS", "team_abbr": "", "team_changed_at": "", "years_exp": str(rng.randint(0, 15)),
+            },
+            "pick_no": pick_no, "picked_by": str(rng.getrandbits(60)), "player_id": pid, "reactions": None,
+            "roster_id": (pick_no - 1) % TEAMS + 1, "round": (pick_no - 1) // TEAMS + 1,
+        })
+    rosters = []
+    for r in range(1, TEAMS + 1):
+        owned = players[r - 1::TEAMS]
+        rosters.append({
+            "roster_id": r, "owner_id": str(rng.getrandbits(60)), "league_id": f"league{league_no}",
+            "metadata": {"record": "WLWWL", "streak": "1W"}, "players": owned, "starters": owned[:9],
+            "reserve": [], "settings": {"wins": rng.randint(0, 20), "losses": rng.randint(0, 20), "fpts": 2000},
+        })
+    weeks = []
+    for _ in range(WEEKS):
+        week = []
+        for roster in rosters:
+            pts = {pid: round(rng.uniform(0, 60) * 2) / 2 for pid in roster["players"]}
+            week.append({
+                "points": sum(pts[p] for p in roster["starters"]), "players": roster["players"],
+                "roster_id": roster["roster_id"], "custom_points": None, "matchup_id": (roster["roster_id"] + 1) // 2,
+                "starters": roster["starters"], "starters_points": [pts[p] for p in roster["starters"]],
+                "players_points": pts,
+            })
+        weeks.append(week)
+    return json.dumps(picks).encode(), json.dumps(rosters).encode(), [json.dumps(w).encode() for w in weeks]
+
+
+def decode_with_dicts(picks, rosters, weeks):
+    return (
+        {pick["pick_no"]: DictDraftPick(**pick) for pick in json.loads(picks)},
+        [DictRoster(r["roster_id"], r["owner_id"], r["league_id"], r.get("metadata", {}), r.get("players", []),
+                    r.get("starters", []), r.get("reserve", []), r.get("settings", {})) for r in json.loads(rosters)],
+        [[DictMatchup(**m) for m in json.loads(week)] for week in weeks],
+    )
+
+
+def decode_with_slots(picks, rosters, weeks):
+    return (
+        decoding.decode_draft_picks(picks),
+        decoding.decode_rosters(rosters),
+        [decoding.decode_matchups(week) for week in weeks],
+    )
+
+
+def measure(decode, leagues):
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for league in leagues:
+            decode(*league)
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    kept = [decode(*league) for league in leagues]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return best, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--leagues', type=int, default=4, help='Synthetic 16-team leagues to decode')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    leagues = [synthetic_league(rng, i) for i in range(args.leagues)]
+    payload_bytes = sum(len(p) + len(r) + sum(map(len, w)) for p, r, w in leagues)
+    objects = args.leagues * (TEAMS * ROUNDS * 2 + TEAMS + TEAMS * WEEKS)
+    print(f"{args.leagues} league(s), {payload_bytes / 1e6:.1f} MB of JSON, {objects} model objects "
+          f"(json backend: {decoding.loads.__module__})")
+
+    results = {}
+    for label, decode in (('dict models + json', decode_with_dicts), ('slotted models + decoder', decode_with_slots)):
+        seconds, retained = measure(decode, leagues)
+        results[label] = (seconds, retained)
+        print(f"  {label:26s} {seconds * 1e3:8.1f} ms  {payload_bytes / seconds / 1e6:7.1f} MB/s  "
+              f"{retained / 1e6:7.2f} MB retained")
+
+    (base_t, base_m), (new_t, new_m) = results.values()
+    print(f"  speedup {base_t / new_t:.2f}x, memory {new_m / base_m:.0%} of baseline")
+
+
+if __name__ == "__main__":
+    main()
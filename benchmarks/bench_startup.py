@@ -0,0 +1,87 @@
+"""Start-up time of the CLI and import cost of each command module, as a regression check.
+
+Usage: python benchmarks/bench_startup.py [--repeats N] [--budget-ms MS] [--importtime]
+
+For each command this times `ballknowers.py <command> --help` in a fresh interpreter and
+checks that importing the command's module pulls in none of the heavy libraries. It also
+runs `trends` against an empty temporary store as a cache-only command. Times are reported
+as overhead on top of a bare `python -c pass`, which is what the budget applies to. The exit
+status is 1 if any command goes over the budget or imports a heavy library eagerly.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ballknowers import COMMANDS  # noqa: E402
+
+HEAVY_MODULES = ('requests', 'numpy', 'pandas', 'bs4', 'cloudscraper', 'orjson')
+
+
+def best_time(args, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def eager_imports(module):
+    """Heavy modules present in sys.modules right after importing module."""
+    code = f"import sys, {module}; print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def slowest_imports(module, limit=5):
+    """[(cumulative microseconds, module)] of the most expensive imports under module, from -X importtime."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative_us, name = line.replace('import time:', '').split('|')
+        rows.append((int(cumulative_us), name.strip()))
+    return sorted(rows, reverse=True)[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeats', type=int, default=5, help='Runs per measurement; the best is reported')
+    parser.add_argument('--budget-ms', type=float, default=50.0, help='Allowed start-up overhead over a bare interpreter')
+    parser.add_argument('--importtime', action='store_true', help='Also list the slowest imports of each module')
+    args = parser.parse_args()
+
+    baseline = best_time(['-c', 'pass'], args.repeats)
+    print(f"bare interpreter: {baseline * 1e3:.1f} ms (budget: +{args.budget_ms:.0f} ms)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = [('--help', ['ballknowers.py', '--help'])]
+        runs += [(f'{name} --help', ['ballknowers.py', name, '--help']) for name in COMMANDS]
+        runs.append(('trends (empty store)', ['ballknowers.py', 'trends', '--store', os.path.join(tmp, 'store.db'),
+                                               '--state', os.path.join(tmp, 'state.json')]))
+        failed = False
+        for label, command in runs:
+            overhead = (best_time(command, args.repeats) - baseline) * 1e3
+            over = overhead > args.budget_ms
+            failed |= over
+            print(f"  {label:22s} +{overhead:6.1f} ms  {'❌ over budget' if over else '✓'}")
+
+    for name, (module, _) in COMMANDS.items():
+        heavy = eager_imports(module)
+        failed |= bool(heavy)
+        print(f"  import {module:16s} {'❌ eagerly imports ' + ', '.join(heavy) if heavy else '✓ no heavy imports'}")
+        if args.importtime:
+            for cumulative_us, name in slowest_imports(module):
+                print(f"      {cumulative_us / 1e3:7.1f} ms  {name}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,354 @@
+"""Offline benchmark suite for the report pipeline, with machine-readable results.
+
+Usage: python benchmarks/run_benchmarks.py [--output FILE] [--baseline FILE] [--threshold 0.25]
+                                           [--repeats N] [--only PREFIX ...]
+
+Every case runs without network, on data rebuilt from the committed fantasy_report_*.json files
+(or debug_response_*.html pages when present):
+
+  parse.*      box-score parsing of daily leaders pages, fast and BeautifulSoup parsers
+  scoring.*    fantasy points over a season-sized stat table: per row, vectorized, multi-league
+  matching.*   trending name matching of Sleeper names against a day's box scores
+  decode.*     Sleeper draft picks, rosters and matchups into models, dict-backed vs slotted
+  serialize.*  report JSON, season store writes/exports and the draft CSV
+  api.*        read API queries over a season-sized store, encoded fresh and from its response cache
+
+Results (best and median seconds per case, plus throughput) are written as JSON to --output.
+With --baseline, each case is compared to an earlier results file and the exit status is 1 if
+any case got slower than baseline by more than --threshold (0.25 = 25%).
+"""
+import argparse
+import datetime
+import glob
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+RESULTS_PATH = 'bench_results.json'
+SEASON_DAYS = 165  # regular season game days
+PLAYERS_PER_DAY = 160
+
+CASES = {}
+
+
+def case(name):
+    """Registers a setup function that returns (fn, items): fn is timed, items is the work it does per call."""
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+def report_players():
+    players = []
+    for path in sorted(glob.glob(os.path.join(ROOT, 'fantasy_report_*.json'))):
+        with open(path) as f:
+            players.extend(json.load(f)['top_players'])
+    return players
+
+
+def season_box_scores(seed=0):
+    """SEASON_DAYS x PLAYERS_PER_DAY box scores: the committed players' lines with random jitter."""
+    rng = random.Random(seed)
+    base = report_players()
+    int_keys = [key for key, value in base[0].items() if isinstance(value, int) and key != 'plus_minus']
+    season = []
+    for day in range(SEASON_DAYS):
+        for i in range(PLAYERS_PER_DAY):
+            stat = dict(base[(day * 7 + i) % len(base)])
+            for key in int_keys:
+                stat[key] = max(0, stat[key] + rng.randint(-3, 3))
+            stat['name'] = f"{stat['name']} {i // len(base)}" if i >= len(base) else stat['name']
+            season.append(stat)
+    return season
+
+
+@case('parse.fast')
+def parse_fast():
+    from bench_box_score_parser import load_pages
+    from box_score_parser import parse_box_scores
+
+    pages = [page for _, page in load_pages([])]
+    return (lambda: [parse_box_scores(page) for page in pages]), len(pages)
+
+
+@case('parse.soup')
+def parse_soup():
+    from bench_box_score_parser import load_pages
+    from fantasy_report import parse_box_scores_soup
+
+    pages = [page for _, page in load_pages([])]
+    return (lambda: [parse_box_scores_soup(page) for page in pages]), len(pages)
+
+
+@case('scoring.per_row')
+def scoring_per_row():
+    from fantasy_scoring import calculate_fantasy_points, scoring
+
+    stats = season_box_scores()
+    return (lambda: [calculate_fantasy_points(stat, scoring) for stat in stats]), len(stats)
+
+
+@case('scoring.vectorized')
+def scoring_vectorized():
+    from fantasy_scoring import score_rows, scoring
+
+    stats = season_box_scores()
+    return (lambda: score_rows(stats, scoring)), len(stats)
+
+
+@case('scoring.matrix_4_leagues')
+def scoring_matrix():
+    from fantasy_scoring import scoring
+    from league_scoring import default_matrix
+
+    stats = season_box_scores()
+    variants = {f'league{i}': {**scoring, 'pts': 0.5 + i * 0.25, 'to': -1.0 - i * 0.5} for i in range(3)}
+    matrix = default_matrix(variants)
+    return (lambda: matrix.score_rows(stats)), len(stats)
+
+
+@case('matching.trending')
+def matching_trending():
+    from names import Crosswalk, NameIndex
+
+    day = season_box_scores()[:PLAYERS_PER_DAY]
+    rng = random.Random(1)
+    queries = []
+    for stat in rng.sample(day, 25):
+        name = stat['name']
+        variant = rng.choice(['exact', 'suffix', 'typo', 'case'])
+        if variant == 'suffix':
+            name += ' Jr.'
+        elif variant == 'typo' and len(name) > 6:
+            i = rng.randrange(1, len(name) - 1)
+            name = name[:i] + name[i + 1:]
+        elif variant == 'case':
+            name = name.upper()
+        queries.append((f"pid{len(queries)}", name))
+    crosswalk_path = os.path.join(tempfile.mkdtemp(), 'crosswalk.json')
+
+    def match_day():
+        # What fetch_trending does per report: index the day's box scores, resolve 25 trending adds
+        index = NameIndex(day)
+        crosswalk = Crosswalk(crosswalk_path)
+        return [crosswalk.resolve(index, pid, name) for pid, name in queries]
+
+    return match_day, len(queries)
+
+
+def _decode_case(decoder_name):
+    import bench_models
+
+    rng = random.Random(0)
+    league = bench_models.synthetic_league(rng, 0)
+    decode = getattr(bench_models, decoder_name)
+    items = bench_models.TEAMS * bench_models.ROUNDS + bench_models.TEAMS + bench_models.TEAMS * bench_models.WEEKS
+    return (lambda: decode(*league)), items
+
+
+@case('decode.dict_models')
+def decode_dicts():
+    return _decode_case('decode_with_dicts')
+
+
+@case('decode.slotted_models')
+def decode_slotted():
+    return _decode_case('decode_with_slots')
+
+
+@case('serialize.report_json')
+def serialize_report_json():
+    from fantasy_scoring import score_rows, scoring
+
+    stats = season_box_scores()
+    reports = []
+    for day in range(SEASON_DAYS):
+        rows = stats[day * PLAYERS_PER_DAY:(day + 1) * PLAYERS_PER_DAY]
+        for stat, fp in zip(rows, score_rows(rows, scoring)):
+            stat['fantasy_points'] = fp
+        top = sorted(rows, key=lambda x: x['fantasy_points'], reverse=True)[:20]
+        reports.append({'date': str(day), 'top_players': top, 'trending': [], 'total_players': len(rows)})
+
+    def dump_all():
+        # Same json.dump call generate_report makes, into memory so disk speed is not measured
+        for report in reports:
+            json.dump(report, io.StringIO(), indent=4)
+
+    return dump_all, len(reports)
+
+
+@case('serialize.season_store')
+def serialize_season_store():
+    from fantasy_scoring import score_rows, scoring
+    from season_store import SeasonStore
+
+    days = 30
+    stats = season_box_scores()[:days * PLAYERS_PER_DAY]
+    for stat, fp in zip(stats, score_rows(stats, scoring)):
+        stat['fantasy_points'] = fp
+    tmp = tempfile.mkdtemp()
+
+    def write_and_export():
+        with SeasonStore(os.path.join(tmp, 'season.db')) as store:
+            for day in range(days):
+                date = (datetime.date(2025, 10, 21) + datetime.timedelta(days=day)).isoformat()
+                store.write_day(date, stats[day * PLAYERS_PER_DAY:(day + 1) * PLAYERS_PER_DAY])
+            for date in store.dates():
+                store.export_json_report(date, os.path.join(tmp, f'{date}.json'))
+
+    return write_and_export, days
+
+
+@case('serialize.draft_csv')
+def serialize_draft_csv():
+    import bench_models
+    from draft_report import build_report
+
+    rng = random.Random(0)
+    picks_payload, rosters_payload, _ = bench_models.synthetic_league(rng, 0)
+    picks, rosters = json.loads(picks_payload), json.loads(rosters_payload)
+    users = [{'user_id': r['owner_id'], 'display_name': f"user{r['roster_id']}",
+              'metadata': {'team_name': f"Team {r['roster_id']}"}} for r in rosters]
+
+    def build_and_write():
+        build_report('league', 'draft', picks, users, rosters).to_csv(io.StringIO(), index=False)
+
+    return build_and_write, len(picks)
+
+
+def _api_case(cached):
+    from fantasy_scoring import score_rows, scoring
+    from read_api import ReadAPI
+    from season_store import SeasonStore
+
+    stats = season_box_scores()
+    for stat, fp in zip(stats, score_rows(stats, scoring)):
+        stat['fantasy_points'] = fp
+    tmp = tempfile.mkdtemp()
+    with SeasonStore(os.path.join(tmp, 'season.db')) as store:
+        for day in range(SEASON_DAYS):
+            date = (datetime.date(2025, 10, 21) + datetime.timedelta(days=day)).isoformat()
+            store.write_day(date, stats[day * PLAYERS_PER_DAY:(day + 1) * PLAYERS_PER_DAY])
+    api = ReadAPI(os.path.join(tmp, 'season.db'), os.path.join(tmp, 'reports'), ())
+    names = sorted({stat['name'] for stat in stats[:PLAYERS_PER_DAY]})[:50]
+    urls = [f"/players/{name}?days=14" for name in names] + [f"/teams/{stat['team']}?days=14" for stat in stats[:50]]
+
+    def query():
+        if not cached:
+            api._state[2].clear()
+        for url in urls:
+            api.respond(url)
+
+    return query, len(urls)
+
+
+@case('api.query_uncached')
+def api_uncached():
+    return _api_case(cached=False)
+
+
+@case('api.query_cached')
+def api_cached():
+    return _api_case(cached=True)
+
+
+def run_case(setup, repeats):
+    fn, items = setup()
+    fn()  # warm-up: imports, caches, first-call allocations
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    best = min(times)
+    return {
+        'best_s': best,
+        'median_s': statistics.median(times),
+        'repeats': repeats,
+        'items': items,
+        'items_per_s': items / best if best else None,
+    }
+
+
+def metadata():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Names of cases whose best time regressed past threshold relative to baseline."""
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get('results', {}).get(name)
+        if not before or not before['best_s'] or before['items'] != result['items']:
+            continue  # new case, or its workload changed, so the times are not comparable
+        ratio = result['best_s'] / before['best_s']
+        result['baseline_ratio'] = ratio
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--output', type=str, default=RESULTS_PATH, help='Where to write the JSON results')
+    parser.add_argument('--baseline', type=str, help='Earlier results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Allowed slowdown vs baseline (0.25 = 25%%)')
+    parser.add_argument('--repeats', type=int, default=5, help='Timed runs per case')
+    parser.add_argument('--only', nargs='*', default=[], help='Run only cases whose name starts with one of these')
+    args = parser.parse_args()
+    output = os.path.abspath(args.output)
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+    os.chdir(ROOT)  # the parse cases look for debug_response_*.html next to the reports
+
+    results = {}
+    for name, setup in CASES.items():
+        if args.only and not any(name.startswith(prefix) for prefix in args.only):
+            continue
+        results[name] = run_case(setup, args.repeats)
+
+    regressions = []
+    if baseline_path:
+        with open(baseline_path) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+
+    print(f"{'case':28s} {'best ms':>10s} {'median ms':>10s} {'items/s':>12s} {'vs base':>8s}")
+    for name, result in results.items():
+        ratio = result.get('baseline_ratio')
+        flag = ' ❌' if name in regressions else ''
+        print(f"{name:28s} {result['best_s'] * 1e3:10.2f} {result['median_s'] * 1e3:10.2f} "
+              f"{result['items_per_s']:12,.0f} {f'{ratio:.2f}x' if ratio else '':>8s}{flag}")
+
+    with open(output, 'w') as f:
+        json.dump({'meta': metadata(), 'results': results}, f, indent=4)
+    print(f"\n✓ Results written to {output}")
+    if regressions:
+        print(f"❌ {len(regressions)} case(s) slower than baseline by more than {args.threshold:.0%}: "
+              f"{', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+import html as html_lib
+import re
+
+# Basketball-Reference has renamed a few data-stat keys over the years, so each field lists every known alias
+FIELD_STATS = {
+    'name': ('player', 'name_display'),
+    'team': ('team_id', 'team_name_abbr'),
+    'location': ('game_location',),
+    'opponent': ('opp_id', 'opp_name_abbr'),
+    'outcome': ('game_result',),
+    'minutes_played': ('mp',),
+    'made_field_goals': ('fg',),
+    'attempted_field_goals': ('fga',),
+    'made_three_point_field_goals': ('fg3',),
+    'attempted_three_point_field_goals': ('fg3a',),
+    'made_free_throws': ('ft',),
+    'attempted_free_throws': ('fta',),
+    'offensive_rebounds': ('orb',),
+    'defensive_rebounds': ('drb',),
+    'assists': ('ast',),
+    'steals': ('stl',),
+    'blocks': ('blk',),
+    'turnovers': ('tov',),
+    'personal_fouls': ('pf',),
+    'points': ('pts',),
+    'plus_minus': ('plus_minus',),
+}
+INT_FIELDS = [
+    'made_field_goals', 'attempted_field_goals', 'made_three_point_field_goals',
+    'attempted_three_point_field_goals', 'made_free_throws', 'attempted_free_throws',
+    'offensive_rebounds', 'defensive_rebounds', 'assists', 'steals', 'blocks',
+    'turnovers', 'personal_fouls', 'points',
+]
+
+_TABLE_RE = re.compile(r'<table\b[^>]*\bid="(?:dailyleaders|stats)"[^>]*>(.*?)</table>', re.S)
+_THEAD_RE = re.compile(r'<thead\b[^>]*>(.*?)</thead>', re.S)
+_TBODY_RE = re.compile(r'<tbody\b[^>]*>(.*?)</tbody>', re.S)
+_ROW_RE = re.compile(r'<tr\b([^>]*)>(.*?)</tr>', re.S)
+_CELL_RE = re.compile(r'<t[hd]\b([^>]*)>(.*?)</t[hd]>', re.S)
+_STAT_RE = re.compile(r'data-stat="([^"]*)"')
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def find_stats_table(page):
+    """Returns the inner HTML of the daily leaders table, or None if the page does not have one."""
+    match = _TABLE_RE.search(page)
+    return match.group(1) if match else None
+
+
+def _cell_text(raw):
+    if '<' in raw:
+        raw = _TAG_RE.sub('', raw)
+    if '&' in raw:
+        raw = html_lib.unescape(raw)
+    return raw.strip()
+
+
+def header_columns(table):
+    """Returns the data-stat key of every column, taken from the last header row that has them."""
+    thead = _THEAD_RE.search(table)
+    columns = []
+    for attrs, row in _ROW_RE.findall(thead.group(1) if thead else ''):
+        stats = [_STAT_RE.search(cell_attrs) for cell_attrs, _ in _CELL_RE.findall(row)]
+        if stats and all(stats):
+            columns = [m.group(1) for m in stats]
+    return columns
+
+
+def _field_positions(columns):
+    positions = {}
+    for field, aliases in FIELD_STATS.items():
+        for alias in aliases:
+            if alias in columns:
+                positions[field] = columns.index(alias)
+                break
+    return positions
+
+
+def _parse_row(values, positions):
+    def text(field):
+        pos = positions.get(field)
+        return values[pos] if pos is not None and pos < len(values) else ''
+
+    minutes_str = text('minutes_played')
+    stat = {
+        'name': text('name'),
+        'team': text('team').upper(),
+        'location': 'AWAY' if text('location') == '@' else 'HOME',
+        'opponent': text('opponent').upper(),
+        'outcome': 'WIN' if text('outcome').startswith('W') else 'LOSS',
+        # Handle both "33" and "33:36" formats
+        'minutes_played': int(minutes_str.split(':')[0] or 0),
+    }
+    for field in INT_FIELDS:
+        stat[field] = int(text(field) or 0)
+        if field == 'defensive_rebounds':
+            # Same place as the BeautifulSoup parser and the saved reports put it
+            stat['total_rebounds'] = stat['offensive_rebounds'] + stat['defensive_rebounds']
+    plus_minus = text('plus_minus')
+    stat['plus_minus'] = int(plus_minus) if plus_minus else 0
+    return stat
+
+
+def iter_box_scores(page, errors=None):
+    """Yields one box-score dict per player row of a Basketball-Reference daily leaders page.
+
+    Columns are located by their header data-stat keys, so reordered or added columns do not
+    shift values. Rows that fail to parse are skipped and, if errors is a list, described there.
+    """
+    table = find_stats_table(page)
+    if table is None:
+        return
+    columns = header_columns(table)
+    positions = _field_positions(columns)
+    points_pos = positions.get('points')
+    tbody = _TBODY_RE.search(table)
+
+    for idx, (attrs, row) in enumerate(_ROW_RE.findall(tbody.group(1) if tbody else '')):
+        if 'thead' in attrs:
+            continue  # Header rows repeated inside the body
+        cells = _CELL_RE.findall(row)
+        # "Did Not Play" rows collapse into a single colspan cell and never reach the points column
+        if points_pos is None or len(cells) <= points_pos:
+            continue
+        values = [_cell_text(raw) for _, raw in cells]
+        try:
+            yield _parse_row(values, positions)
+        except ValueError as e:
+            if errors is not None:
+                name_pos = positions.get('name')
+                name = values[name_pos] if name_pos is not None else 'unknown'
+                errors.append(f"Row {idx+1} ({name}): {e}")
+
+
+def parse_box_scores(page, errors=None):
+    return list(iter_box_scores(page, errors))
@@ -1,48 +1,122 @@
 # analytics/draft_report.py
-import requests
-import pandas as pd
-
-def fetch_draft_picks(draft_id):
-    url = f'https://api.sleeper.app/v1/draft/{draft_id}/picks'
-    return requests.get(url).json()
-
-def fetch_users(league_id):
-    url = f'https://api.sleeper.app/v1/league/{league_id}/users'
-    return requests.get(url).json()
-
-def fetch_rosters(league_id):
-    url = f'https://api.sleeper.app/v1/league/{league_id}/rosters'
-    return requests.get(url).json()
-
-def generate_report(league_id, draft_id):
-    picks = fetch_draft_picks(draft_id)
-    users = fetch_users(league_id)
-    rosters = fetch_rosters(league_id)
-    
-    # Map owner_id to display_name and team_name
-    user_map = {u['user_id']: {'display_name': u['display_name'], 'team_name': u.get('metadata', {}).get('team_name', 'N/A')} for u in users}
-    
-    # Map roster_id to owner details
-    roster_map = {r['roster_id']: user_map.get(r['owner_id'], {'display_name': 'Unknown', 'team_name': 'N/A'}) for r in rosters}
-    
-    # Process picks
-    df_picks = pd.DataFrame(picks)
-    df_picks['player_name'] = df_picks['metadata'].apply(lambda m: f"{m['first_name']} {m['last_name']}")
-    df_picks['team_pos'] = df_picks['metadata'].apply(lambda m: f"{m.get('team', 'N/A')}, {m.get('position', 'N/A')}")
-    df_picks['username'] = df_picks['roster_id'].map(lambda rid: roster_map.get(rid, {})['display_name'])
-    df_picks['team_name'] = df_picks['roster_id'].map(lambda rid: roster_map.get(rid, {})['team_name'])
-    
-    # Clean: Drop unwanted columns
-    drop_cols = ['draft_id', 'is_keeper', 'metadata', 'player_id']
-    df_picks = df_picks.drop(columns=drop_cols, errors='ignore')
-    
-    # Sort and save
-    df_picks = df_picks.sort_values('pick_no')
-    df_picks.to_csv('draft_report.csv', index=False)
-    return df_picks
-
-# Run
-league_id = '1229352720222134272'
-draft_id = '1229352720230514688'
-report = generate_report(league_id, draft_id)
-print(report.head(144))  # First 3 rounds for console check
\ No newline at end of file
+import argparse
+
+from sleeper_client import get_client
+
+LEAGUE_ID = '1229352720222134272'
+DRAFT_ID = '1229352720230514688'
+REPORT_PATH = 'draft_report.csv'
+
+PICK_COLUMNS = ['draft_slot', 'pick_no', 'picked_by', 'reactions', 'roster_id', 'round']
+# league_id and draft_id lead so the combined file is partitioned by league, one contiguous block each
+REPORT_COLUMNS = ['league_id', 'draft_id'] + PICK_COLUMNS + ['player_name', 'team_pos', 'username', 'team_name']
+
+def parse_draft(value):
+    """'LEAGUE_ID:DRAFT_ID' -> (league_id, draft_id); a bare 'LEAGUE_ID' gives draft_id None."""
+    league_id, _, draft_id = value.partition(':')
+    return league_id, draft_id or None
+
+def resolve_drafts(pairs, client=None):
+    """Fills in missing draft IDs from each league's settings, fetched concurrently."""
+    client = client or get_client()
+    missing = [league_id for league_id, draft_id in pairs if not draft_id]
+    found = {}
+    for league_id, response in zip(missing, client.get_many(f'/league/{league_id}' for league_id in missing)):
+        if response.status_code == 200 and response.json().get('draft_id'):
+            found[league_id] = response.json()['draft_id']
+        else:
+            print(f"❌ No draft found for league {league_id}, Status Code: {response.status_code}")
+    return [(league_id, draft_id or found[league_id]) for league_id, draft_id in pairs
+            if draft_id or league_id in found]
+
+def fetch_draft_data(pairs, client=None):
+    """Fetches picks, users and rosters for every (league_id, draft_id) pair in one concurrent batch.
+
+    Returns [(league_id, draft_id, picks, users, rosters)], skipping pairs where any request failed.
+    """
+    client = client or get_client()
+    paths = []
+    for league_id, draft_id in pairs:
+        paths += [f'/draft/{draft_id}/picks', f'/league/{league_id}/users', f'/league/{league_id}/rosters']
+    responses = client.get_many(paths)
+
+    results = []
+    for i, (league_id, draft_id) in enumerate(pairs):
+        batch = responses[3 * i:3 * i + 3]
+        failed = [r for r in batch if r.status_code != 200]
+        if failed:
+            print(f"❌ Failed to fetch league {league_id} / draft {draft_id}, Status Code: {failed[0].status_code}")
+            continue
+        results.append((league_id, draft_id, *(r.json() or [] for r in batch)))
+    return results
+
+def _column(df, name, default):
+    """df[name] with missing values (or a missing column) replaced by default."""
+    import pandas as pd
+
+    if name in df:
+        return df[name].fillna(default)
+    return pd.Series(default, index=df.index, dtype=object)
+
+def build_report(league_id, draft_id, picks, users, rosters):
+    """One league's picks joined to their managers, as a DataFrame with REPORT_COLUMNS."""
+    import pandas as pd
+
+    if not picks:
+        return pd.DataFrame(columns=REPORT_COLUMNS)
+
+    # Flatten the nested metadata once into metadata_* columns instead of a lambda per row
+    df_picks = pd.json_normalize(picks, sep='_')
+    df_picks['player_name'] = _column(df_picks, 'metadata_first_name', '') + ' ' + _column(df_picks, 'metadata_last_name', '')
+    df_picks['team_pos'] = _column(df_picks, 'metadata_team', 'N/A') + ', ' + _column(df_picks, 'metadata_position', 'N/A')
+
+    # roster_id -> owner_id -> user, as two merge joins
+    df_users = pd.json_normalize(users, sep='_') if users else pd.DataFrame(columns=['user_id'])
+    owners = pd.DataFrame({
+        'owner_id': df_users['user_id'],
+        'username': _column(df_users, 'display_name', 'Unknown'),
+        'team_name': _column(df_users, 'metadata_team_name', 'N/A'),
+    })
+    df_rosters = pd.DataFrame(rosters, columns=['roster_id', 'owner_id'])
+    managers = df_rosters.merge(owners, on='owner_id', how='left').drop(columns='owner_id')
+    df_picks = df_picks.merge(managers, on='roster_id', how='left')
+    df_picks['username'] = df_picks['username'].fillna('Unknown')
+    df_picks['team_name'] = df_picks['team_name'].fillna('N/A')
+
+    df_picks['league_id'] = league_id
+    df_picks['draft_id'] = draft_id
+    return df_picks.reindex(columns=REPORT_COLUMNS).sort_values('pick_no', kind='stable')
+
+def generate_report(pairs, path=REPORT_PATH, client=None):
+    """Builds and saves one combined report for every (league_id, draft_id) pair, in the order given."""
+    import pandas as pd
+
+    frames = [build_report(*data) for data in fetch_draft_data(resolve_drafts(pairs, client), client)]
+    report = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=REPORT_COLUMNS)
+    report.to_csv(path, index=False)
+    return report
+
+def load_report(path=REPORT_PATH):
+    """Reads a saved report; files from before the league_id column are the default league's draft."""
+    import pandas as pd
+
+    report = pd.read_csv(path, dtype=str, keep_default_na=False)
+    for column, default in (('league_id', LEAGUE_ID), ('draft_id', DRAFT_ID)):
+        if column not in report:
+            report[column] = default
+    return report.reindex(columns=REPORT_COLUMNS)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Draft report: every pick with its manager, for one or more leagues")
+    parser.add_argument('drafts', nargs='*', default=[f'{LEAGUE_ID}:{DRAFT_ID}'],
+                        help="LEAGUE_ID:DRAFT_ID pairs; a bare LEAGUE_ID uses that league's draft")
+    parser.add_argument('--output', type=str, default=REPORT_PATH, help='Combined CSV, partitioned by league_id')
+    args = parser.parse_args(argv)
+
+    report = generate_report([parse_draft(value) for value in args.drafts], args.output)
+    for league_id, picks in report.groupby('league_id', sort=False).size().items():
+        print(f"✓ League {league_id}: {picks} picks")
+    print(report.head(144))  # First 3 rounds for console check
+
+if __name__ == "__main__":
+    main()
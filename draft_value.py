@@ -0,0 +1,199 @@
+"""Draft value against FantasyPros ADP, for every league and season in the draft reports.
+
+ADP snapshots are scraped at most once per date into the season store's adp table. Each draft is
+joined to a snapshot (by default the latest one; a leagues.json entry's "adp_date" picks an older
+one for a past season) through a NameIndex over the snapshot, with exact names taking priority
+and only near-certain fuzzy matches remembered in a crosswalk file. Every pick is then scored in
+one pass over the combined table:
+
+  value         ADP - pick number; positive is a steal (taken later than ADP), negative a reach
+  value_rounds  value divided by the draft's team count, so leagues of different sizes compare
+
+Managers are graded A-F on their mean value_rounds, ranked against the rest of their league.
+"""
+import argparse
+import datetime
+import os
+import re
+
+from names import Crosswalk, NameIndex
+from season_store import STORE_PATH, SeasonStore
+
+ADP_URL = "https://www.fantasypros.com/nba/adp/overall.php"
+ADP_CROSSWALK_PATH = os.path.join('.cache', 'adp_crosswalk.json')
+VALUES_PATH = 'draft_values.csv'
+GRADES = ['F', 'D', 'C', 'B', 'A']  # by league percentile of mean value, in fifths
+GRADE_BINS = [0, .2, .4, .6, .8, 1]
+
+
+def parse_adp(page):
+    """[{'name', 'rank', 'adp'}] from the FantasyPros ADP table (rank, player, ADP columns)."""
+    from bs4 import BeautifulSoup
+
+    table = BeautifulSoup(page, "html.parser").find("table", {"id": "data"})
+    rows = []
+    for row in table.find_all("tr")[1:] if table else ():
+        cols = row.find_all("td")
+        if len(cols) < 3:
+            continue
+        link = cols[1].find("a")
+        # The player cell also carries team and position, e.g. "Nikola Jokic (DEN - C)"
+        name = re.sub(r'\s*\(.*\)\s*$', '', (link or cols[1]).get_text(' ', strip=True))
+        try:
+            adp = float(cols[2].get_text(strip=True))
+        except ValueError:
+            continue
+        rank = cols[0].get_text(strip=True)
+        rows.append({'name': name, 'rank': int(rank) if rank.isdigit() else None, 'adp': adp})
+    return rows
+
+
+def fetch_adp(scraper=None):
+    from scrape_client import get_scraper
+
+    response = (scraper or get_scraper()).get(ADP_URL)
+    response.raise_for_status()
+    return parse_adp(response.text)
+
+
+def adp_snapshot(store, date=None, refresh=False, scraper=None):
+    """(date, rows) of the snapshot taken on date (default today), scraping it only if none is stored."""
+    date = date or datetime.date.today().isoformat()
+    rows = [] if refresh else store.read_adp(date)
+    if not rows:
+        rows = fetch_adp(scraper)
+        if rows:
+            store.write_adp(date, rows)
+    return date, rows
+
+
+def snapshot_for(adp_dates, date=None):
+    """The latest snapshot date on or before date (any date when None), or None."""
+    eligible = [d for d in adp_dates if date is None or d <= date]
+    return eligible[-1] if eligible else None
+
+
+def match_players(names, snapshot_rows, crosswalk):
+    """{pick name: ADP row index} for the names that resolve against the snapshot."""
+    index = NameIndex(range(len(snapshot_rows)), name=lambda i: snapshot_rows[i]['name'])
+    matched = {}
+    for name in names:
+        i = crosswalk.resolve(index, name, name)
+        if i is not None:
+            matched[name] = i
+    return matched
+
+
+def score_picks(picks, snapshots, crosswalk):
+    """Adds adp, value and value_rounds to picks (a draft report with an adp_date column).
+
+    snapshots maps each adp_date to its rows. Names are resolved once per distinct (snapshot,
+    player) rather than per pick, and the scoring itself is column arithmetic over all leagues.
+    """
+    import numpy as np
+    import pandas as pd
+
+    lookup = []
+    for date, group in picks.groupby('adp_date', sort=False):
+        rows = snapshots[date]
+        for name, i in match_players(group['player_name'].unique(), rows, crosswalk).items():
+            lookup.append((date, name, rows[i]['name'], rows[i]['adp']))
+    lookup = pd.DataFrame(lookup, columns=['adp_date', 'player_name', 'adp_name', 'adp'])
+    lookup['adp'] = lookup['adp'].astype(float)  # an empty lookup would otherwise leave value as object dtype
+
+    scored = picks.merge(lookup, on=['adp_date', 'player_name'], how='left')
+    pick_no = scored['pick_no'].astype(float)
+    teams = scored['draft_slot'].astype(float).groupby([scored['league_id'], scored['draft_id']]).transform('max')
+    scored['value'] = scored['adp'] - pick_no
+    scored['value_rounds'] = scored['value'] / teams.replace(0, np.nan)
+    return scored
+
+
+def grade_managers(scored):
+    """Per-manager draft summary with a letter grade relative to the rest of the league."""
+    import pandas as pd
+
+    matched = scored.dropna(subset=['adp'])
+    grades = (matched.groupby(['league_id', 'roster_id', 'username'], sort=False)
+              .agg(picks=('value', 'size'), total_value=('value', 'sum'), mean_value_rounds=('value_rounds', 'mean'),
+                   steals=('value', lambda v: int((v > 0).sum())))
+              .reset_index())
+    percentile = grades.groupby('league_id')['mean_value_rounds'].rank(pct=True)
+    # Fixed fifths of the percentile, so a grade means the same in every league
+    grades['grade'] = pd.cut(percentile, bins=GRADE_BINS, labels=GRADES, include_lowest=True)
+    return grades.sort_values(['league_id', 'mean_value_rounds'], ascending=[True, False], ignore_index=True)
+
+
+def league_adp_dates(config_path):
+    """league_id -> the adp_date its leagues.json entry asks for, if any."""
+    from league_batch import load_leagues
+
+    if not os.path.exists(config_path):
+        return {}
+    return {league['league_id']: league['adp_date'] for league in load_leagues(config_path) if league.get('adp_date')}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pick-vs-ADP value, reaches, steals and manager draft grades")
+    parser.add_argument('--picks', nargs='*', help='Draft report CSVs (default: draft_report.csv and the batch output)')
+    parser.add_argument('--store', type=str, default=STORE_PATH, help='SQLite store holding the ADP snapshots')
+    parser.add_argument('--config', type=str, default='leagues.json', help='Leagues, with an optional adp_date each')
+    parser.add_argument('--adp-date', type=str, help='Use the latest snapshot on or before this date for every league')
+    parser.add_argument('--refresh-adp', action='store_true', help="Scrape today's ADP even if it is already stored")
+    parser.add_argument('--top', type=int, default=10, help='How many reaches and steals to show')
+    parser.add_argument('--output', type=str, default=VALUES_PATH, help='Where to write every scored pick')
+    args = parser.parse_args(argv)
+
+    import pandas as pd
+
+    from draft_report import REPORT_PATH, load_report
+
+    paths = args.picks or [path for path in (REPORT_PATH, os.path.join('league_reports', 'draft_report.csv'))
+                           if os.path.exists(path)]
+    if not paths:
+        print(f"❌ No draft report found ({REPORT_PATH}); run 'ballknowers draft' or pass --picks")
+        return 1
+    picks = pd.concat([load_report(path) for path in paths], ignore_index=True)
+    picks = picks.drop_duplicates(subset=['league_id', 'draft_id', 'pick_no'], keep='last')
+    picks = picks[picks['player_name'].str.strip() != '']
+
+    with SeasonStore(args.store) as store:
+        adp_dates = store.adp_dates()
+        if args.refresh_adp or not adp_dates:
+            date, rows = adp_snapshot(store, refresh=args.refresh_adp)
+            print(f"✓ Saved {len(rows)} ADP entries for {date}")
+            adp_dates = store.adp_dates()
+        requested = league_adp_dates(args.config)
+        picks = picks.assign(adp_date=[snapshot_for(adp_dates, args.adp_date or requested.get(league_id))
+                                       for league_id in picks['league_id']])
+        picks = picks.dropna(subset=['adp_date'])
+        if picks.empty:
+            print("❌ No picks to score: no ADP snapshot on or before their draft's adp_date")
+            return 1
+        snapshots = {date: store.read_adp(date) for date in picks['adp_date'].unique()}
+
+    crosswalk = Crosswalk(ADP_CROSSWALK_PATH)
+    scored = score_picks(picks, snapshots, crosswalk)
+    crosswalk.save()
+    scored.to_csv(args.output, index=False)
+
+    matched = scored.dropna(subset=['adp'])
+    if matched.empty:
+        print(f"❌ None of the {len(scored)} picks matched a player in the ADP snapshots "
+              f"({', '.join(sorted(snapshots))})")
+        return 1
+    print(f"✓ Matched {len(matched)}/{len(scored)} picks across {scored['league_id'].nunique()} league(s) to ADP "
+          f"({', '.join(sorted(snapshots))})")
+    columns = ['league_id', 'round', 'pick_no', 'player_name', 'adp', 'value', 'username']
+    print(f"\n🚀 Biggest steals:\n{matched.nlargest(args.top, 'value')[columns].to_string(index=False)}")
+    print(f"\n🤦 Biggest reaches:\n{matched.nsmallest(args.top, 'value')[columns].to_string(index=False)}")
+    for league_id, grades in grade_managers(scored).groupby('league_id', sort=False):
+        print(f"\n📝 Draft grades, league {league_id}:")
+        for row in grades.itertuples():
+            print(f"  {row.grade}  {row.username:20s} {row.mean_value_rounds:+.2f} rounds/pick  "
+                  f"({row.steals}/{row.picks} steals)")
+    print(f"\n✓ Scored picks saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
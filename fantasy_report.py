@@ -1,73 +1,28 @@
 import datetime
 from datetime import timedelta
-import cloudscraper
-from bs4 import BeautifulSoup
-import requests
 import json
-import difflib
 import argparse
-import time
-
-# Hardcoded scoring based on your league's settings
-scoring = {
-    'pts': 0.5,
-    'reb': 1.0,
-    'ast': 1.0,
-    'stl': 2.0,
-    'blk': 2.0,
-    'to': -1.0,
-    'fg3m': 0.5,
-    'ff': -2.0,
-    'bonus_dd': 1.0,
-    'bonus_td': 2.0,
-    'bonus_40p': 2.0,
-    'bonus_50p': 2.0,
-    'bonus_15a': 0.0,
-    'bonus_20r': 0.0,
-}
-
-stat_mapping = {
-    'points': 'pts',
-    'total_rebounds': 'reb',
-    'assists': 'ast',
-    'steals': 'stl',
-    'blocks': 'blk',
-    'turnovers': 'to',
-    'made_three_point_field_goals': 'fg3m',
-    'personal_fouls': 'pf',
-}
-
-def calculate_fantasy_points(stat, scoring):
-    fp = 0.0
-    for box_key, score_key in stat_mapping.items():
-        if box_key in stat and score_key in scoring:
-            fp += stat[box_key] * scoring[score_key]
-    
-    doubles_count = sum(1 for key in ['points', 'total_rebounds', 'assists', 'steals', 'blocks'] if stat.get(key, 0) >= 10)
-    if doubles_count >= 2:
-        fp += scoring.get('bonus_dd', 0)
-    if doubles_count >= 3:
-        fp += scoring.get('bonus_td', 0)
-    
-    if stat.get('points', 0) >= 40:
-        fp += scoring.get('bonus_40p', 0)
-    if stat.get('points', 0) >= 50:
-        fp += scoring.get('bonus_50p', 0)
-    if stat.get('assists', 0) >= 15:
-        fp += scoring.get('bonus_15a', 0)
-    if stat.get('total_rebounds', 0) >= 20:
-        fp += scoring.get('bonus_20r', 0)
-    
-    return fp
+import os
+import hashlib
+import threading
+import metrics
+from player_index import load_index
+from sleeper_client import get_client
+from names import Crosswalk, NameIndex
+from box_score_parser import find_stats_table, parse_box_scores
+from fantasy_scoring import scoring, score_rows
+from season_store import STORE_PATH, SeasonStore
+from scrape_client import DEFAULT_MIN_INTERVAL, CircuitOpenError, ScrapeClient, ScrapeError, get_scraper
+
+
+BACKFILL_PROGRESS_FILE = 'backfill_progress.json'
 
-def normalize_name(name):
-    suffixes = [' Jr.', ' Sr.', ' II', ' III', ' IV', ' V', ' Jr', ' Sr', '.']
-    for suffix in suffixes:
-        if name.endswith(suffix):
-            name = name[:-len(suffix)].strip()
-    return name
 
-def custom_player_box_scores(day, month, year, debug=True):
+def fetch_daily_leaders(day, month, year, debug=True, scraper=None):
+    """Downloads the Basketball-Reference daily leaders page and returns its HTML.
+
+    Raises ScrapeError if the page could not be fetched, or CircuitOpenError while the site is blocking us.
+    """
     url = f"https://www.basketball-reference.com/friv/dailyleaders.cgi?month={month}&day={day}&year={year}"
     
     print(f"\n{'='*60}")
@@ -75,119 +30,122 @@ def custom_player_box_scores(day, month, year, debug=True):
     print(f"{'='*60}")
     print(f"URL: {url}")
     
-    try:
-        # Try with cloudscraper first
-        print("\n[1] Attempting with cloudscraper...")
-        scraper = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'mobile': False
-            }
-        )
-        
-        response = scraper.get(url, allow_redirects=True, timeout=30)
-        print(f"Status Code: {response.status_code}")
-        print(f"Final URL after redirects: {response.url}")
-        print(f"Response length: {len(response.text)} characters")
-        
-        # Check for common blocking indicators
-        if "Access Denied" in response.text or "403 Forbidden" in response.text:
-            print("⚠️  Detected access denied message")
-        if "cf-browser-verification" in response.text:
-            print("⚠️  Detected Cloudflare browser verification")
-        if len(response.text) < 1000:
-            print("⚠️  Response is suspiciously short")
-        
-        # Save debug file
-        if debug:
-            debug_file = f'debug_response_{year}-{month:02d}-{day:02d}.html'
-            with open(debug_file, 'w', encoding='utf-8') as f:
-                f.write(response.text)
-            print(f"✓ Saved raw response to: {debug_file}")
-        
-        response.raise_for_status()
-        
-    except Exception as e:
-        print(f"❌ Cloudscraper failed: {e}")
-        
-        # Fallback to regular requests with headers
-        print("\n[2] Attempting with requests + headers...")
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
-        
-        try:
-            response = requests.get(url, headers=headers, timeout=30)
-            print(f"Status Code: {response.status_code}")
-            print(f"Response length: {len(response.text)} characters")
-            response.raise_for_status()
-        except Exception as e2:
-            print(f"❌ Regular requests also failed: {e2}")
-            return []
+    # One shared session with rate limiting, retries and circuit breaking (see scrape_client)
+    print("\n[1] Fetching with the shared scraping session...")
+    scraper = scraper or get_scraper()
+    with metrics.stage('fetch.daily_leaders', date=f"{year}-{month:02d}-{day:02d}") as timing:
+        response = scraper.get(url)
+        timing['status'] = response.status_code
+        timing['bytes'] = len(response.content)
+    print(f"Status Code: {response.status_code}")
+    print(f"Final URL after redirects: {response.url}")
+    print(f"Response length: {len(response.text)} characters")
+    
+    # Check for common blocking indicators
+    if len(response.text) < 1000:
+        print("⚠️  Response is suspiciously short")
+    
+    # Save debug file
+    if debug:
+        debug_file = f'debug_response_{year}-{month:02d}-{day:02d}.html'
+        with open(debug_file, 'w', encoding='utf-8') as f:
+            f.write(response.text)
+        print(f"✓ Saved raw response to: {debug_file}")
     
+    if response.status_code != 200:
+        raise ScrapeError(f"{url} returned status {response.status_code}")
+    return response.text
+
+
+def parse_daily_leaders(page, parser='fast'):
     print("\n[3] Parsing HTML...")
-    soup = BeautifulSoup(response.text, 'html.parser')
+    if find_stats_table(page) is None:
+        print_missing_table_diagnostics(page)
+        return []
+    print("✓ Found stats table")
+
+    errors = []
+    with metrics.stage('parse.box_scores', parser=parser, bytes=len(page)) as timing:
+        if parser == 'soup':
+            box_scores = parse_box_scores_soup(page, errors)
+        else:
+            box_scores = parse_box_scores(page, errors)
+        timing['rows'] = len(box_scores)
+        timing['errors'] = len(errors)
+    metrics.count('parse.rows', len(box_scores))
+    metrics.count('parse.errors', len(errors))
+    print(f"✓ Successfully parsed {len(box_scores)} player stats")
     
-    # Debug: Look for the table (try both old and new IDs)
-    table = soup.find('table', id='dailyleaders')
-    if not table:
-        table = soup.find('table', id='stats')
+    if errors and len(errors) <= 5:
+        print(f"\nParsing errors:")
+        for err in errors:
+            print(f"  {err}")
+    elif len(errors) > 5:
+        print(f"\n⚠️  {len(errors)} parsing errors (showing first 5):")
+        for err in errors[:5]:
+            print(f"  {err}")
     
-    if not table:
-        print("❌ Table with id='dailyleaders' or 'stats' not found")
-        
-        # Check what tables exist
-        all_tables = soup.find_all('table')
-        print(f"\nFound {len(all_tables)} total tables on page:")
-        for i, t in enumerate(all_tables[:5]):  # Show first 5
-            table_id = t.get('id', 'no-id')
-            table_class = t.get('class', 'no-class')
-            print(f"  Table {i+1}: id='{table_id}', class='{table_class}'")
-        
-        # Check for error messages
-        error_div = soup.find('div', class_='error')
-        if error_div:
-            print(f"\n⚠️  Found error message: {error_div.get_text(strip=True)}")
-        
-        # Check page title
-        title = soup.find('title')
-        if title:
-            print(f"\nPage title: {title.get_text(strip=True)}")
-        
+    print(f"{'='*60}\n")
+    
+    return box_scores
+
+
+def custom_player_box_scores(day, month, year, debug=True, scraper=None, parser='fast'):
+    try:
+        page = fetch_daily_leaders(day, month, year, debug=debug, scraper=scraper)
+    except ScrapeError as e:
+        print(f"❌ Fetch failed: {e}")
         return []
+    return parse_daily_leaders(page, parser)
+
+
+def print_missing_table_diagnostics(page):
+    """Explains what Basketball-Reference returned when the stats table is missing."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(page, 'html.parser')
+    print("❌ Table with id='dailyleaders' or 'stats' not found")
+    
+    # Check what tables exist
+    all_tables = soup.find_all('table')
+    print(f"\nFound {len(all_tables)} total tables on page:")
+    for i, t in enumerate(all_tables[:5]):  # Show first 5
+        table_id = t.get('id', 'no-id')
+        table_class = t.get('class', 'no-class')
+        print(f"  Table {i+1}: id='{table_id}', class='{table_class}'")
     
-    print(f"✓ Found stats table (id='{table.get('id')}')")
+    # Check for error messages
+    error_div = soup.find('div', class_='error')
+    if error_div:
+        print(f"\n⚠️  Found error message: {error_div.get_text(strip=True)}")
     
-    tbody = table.find('tbody')
+    # Check page title
+    title = soup.find('title')
+    if title:
+        print(f"\nPage title: {title.get_text(strip=True)}")
+
+
+def parse_box_scores_soup(page, errors=None):
+    """Original BeautifulSoup parser that reads cells by fixed index. Kept as a reference backend."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(page, 'html.parser')
+    table = soup.find('table', id='dailyleaders') or soup.find('table', id='stats')
+    tbody = table.find('tbody') if table else None
     if not tbody:
-        print("❌ No tbody found in table")
         return []
     
-    rows = tbody.find_all('tr')
-    print(f"✓ Found {len(rows)} rows in table")
-    
     box_scores = []
-    errors = []
-    
-    for idx, row in enumerate(rows):
+    for idx, row in enumerate(tbody.find_all('tr')):
         cells = row.find_all(['th', 'td'])
         
         if len(cells) < 25:
-            if idx < 3:  # Only show first few skipped rows
-                print(f"  Row {idx+1}: Skipped (only {len(cells)} cells)")
             continue
         
         try:
             name = cells[1].text.strip()
             team = cells[2].text.strip().upper()
-            location = 'HOME' if cells[3].text.strip() == 'vs.' else 'AWAY'
+            location = 'AWAY' if cells[3].text.strip() == '@' else 'HOME'
             opponent = cells[4].text.strip().upper()
             outcome = 'WIN' if cells[5].text.strip().startswith('W') else 'LOSS'
             
@@ -240,154 +198,350 @@ def custom_player_box_scores(day, month, year, debug=True):
             })
             
         except (ValueError, IndexError) as e:
-            errors.append(f"Row {idx+1} ({cells[1].text.strip() if len(cells) > 1 else 'unknown'}): {e}")
+            if errors is not None:
+                errors.append(f"Row {idx+1} ({cells[1].text.strip() if len(cells) > 1 else 'unknown'}): {e}")
             continue
     
-    print(f"✓ Successfully parsed {len(box_scores)} player stats")
-    
-    if errors and len(errors) <= 5:
-        print(f"\nParsing errors:")
-        for err in errors:
-            print(f"  {err}")
-    elif len(errors) > 5:
-        print(f"\n⚠️  {len(errors)} parsing errors (showing first 5):")
-        for err in errors[:5]:
-            print(f"  {err}")
-    
-    print(f"{'='*60}\n")
-    
     return box_scores
 
-# Parse command-line arguments
-parser = argparse.ArgumentParser(description="Fantasy Basketball Report Generator")
-parser.add_argument('--date', type=str, default='yesterday',
-                    help="Date for the report: 'today', 'yesterday', 'day_before', or 'YYYY-MM-DD'")
-parser.add_argument('--debug', action='store_true', help='Enable debug output')
-args = parser.parse_args()
-
-# Determine the target date
-if args.date == 'today':
-    target_date = datetime.date.today()
-elif args.date == 'yesterday':
-    target_date = datetime.date.today() - timedelta(days=1)
-elif args.date == 'day_before':
-    target_date = datetime.date.today() - timedelta(days=2)
-else:
-    try:
-        target_date = datetime.date.fromisoformat(args.date)
-    except ValueError:
-        print("Invalid date format. Using yesterday's date.")
-        target_date = datetime.date.today() - timedelta(days=1)
+def resolve_date(value):
+    """Turns 'today', 'yesterday', 'day_before' or 'YYYY-MM-DD' into a date."""
+    if value == 'today':
+        return datetime.date.today()
+    if value == 'yesterday':
+        return datetime.date.today() - timedelta(days=1)
+    if value == 'day_before':
+        return datetime.date.today() - timedelta(days=2)
+    return datetime.date.fromisoformat(value)
 
-day, month, year = target_date.day, target_date.month, target_date.year
-
-print(f"\nFetching NBA stats for: {target_date.strftime('%A, %B %d, %Y')}")
-
-# Fetch box scores with debugging
-box_scores = custom_player_box_scores(day, month, year, debug=args.debug)
-
-# Filter players who played
-box_scores = [s for s in box_scores if s.get('minutes_played', 0) > 0]
-
-if not box_scores:
-    print("\n❌ No player data available. Check the debug output above.")
-    print("\nTroubleshooting tips:")
-    print("1. Check if there were actually NBA games on this date")
-    print("2. Look at the saved debug HTML file to see what Basketball-Reference returned")
-    print("3. Try visiting the URL directly in your browser")
-    print("4. Basketball-Reference may be blocking automated requests")
-    exit(1)
-
-print(f"\n✓ Loaded stats for {len(box_scores)} players who played\n")
-
-# Calculate fantasy points
-for stat in box_scores:
-    stat['fantasy_points'] = calculate_fantasy_points(stat, scoring)
-
-# Sort and get top 20
-top_players = sorted(box_scores, key=lambda x: x['fantasy_points'], reverse=True)[:20]
-
-# Output top fantasy players
-print(f"{'='*60}")
-print(f"Top Fantasy Players for {target_date.strftime('%Y-%m-%d')}:")
-print(f"{'='*60}")
-for i, player in enumerate(top_players, 1):
-    pts = player.get('points', 0)
-    reb = player.get('total_rebounds', 0)
-    ast = player.get('assists', 0)
-    stl = player.get('steals', 0)
-    blk = player.get('blocks', 0)
-    print(f"{i:2d}. {player['name']:5s} - {player['fantasy_points']:6.2f} FP")
-    print(f"     {pts}pts, {reb}reb, {ast}ast")
-
-# Sleeper API parts
-print(f"\n{'='*60}")
-print("Fetching Sleeper trending data...")
-print(f"{'='*60}")
-
-try:
-    players_url = "https://api.sleeper.app/v1/players/nba"
-    players_response = requests.get(players_url, timeout=10)
-    players_response.raise_for_status()
-    players = players_response.json()
-    
-    id_to_name = {}
-    for pid, info in players.items():
-        if isinstance(info, dict) and 'full_name' in info:
-            id_to_name[pid] = info['full_name']
+
+def report_filename(target_date):
+    return f"fantasy_report_{target_date.strftime('%Y-%m-%d')}.json"
+
+
+def content_hash(*parts):
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else json.dumps(part, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def fetch_trending(box_scores, target_date, players_ttl):
+    """Prints Sleeper's trending adds matched against the day's box scores and returns the raw list."""
+    print(f"\n{'='*60}")
+    print("Fetching Sleeper trending data...")
+    print(f"{'='*60}")
+
+    with metrics.stage('players.load_index'):
+        player_index = load_index(ttl=players_ttl * 3600)
     
-    trending_url = "https://api.sleeper.app/v1/players/nba/trending/add?lookback_hours=24&limit=25"
-    trending_response = requests.get(trending_url, timeout=10)
-    trending_response.raise_for_status()
-    trending = trending_response.json()
+    with metrics.stage('fetch.trending') as timing:
+        trending_response = get_client().get("/players/nba/trending/add", params={'lookback_hours': 24, 'limit': 25})
+        trending_response.raise_for_status()
+        trending = trending_response.json()
+        timing['bytes'] = len(trending_response.content)
     
-    box_names_lower = [normalize_name(s['name']).lower() for s in box_scores]
-    name_to_fp = {normalize_name(s['name']).lower(): (s['name'], s['fantasy_points']) for s in box_scores}
+    with metrics.stage('match.trending', players=len(trending)) as timing:
+        box_index = NameIndex(box_scores)
+        crosswalk = Crosswalk()
     
-    print(f"\nSleeper Trending Players {target_date.strftime('%m-%d-%Y')}:")
-    matched = 0
-    for t in trending:
-        pid = t['player_id']
-        name = id_to_name.get(pid, "Unknown")
-        adds = t['count']
-        normalized_name = normalize_name(name).lower()
-        
-        if normalized_name not in name_to_fp:
-            close_matches = difflib.get_close_matches(normalized_name, box_names_lower, n=1, cutoff=0.75)
-            if close_matches:
-                normalized_name = close_matches[0]
+        print(f"\nSleeper Trending Players {target_date.strftime('%m-%d-%Y')}:")
+        matched = 0
+        for t in trending:
+            pid = t['player_id']
+            name = player_index.name(pid, "Unknown")
+            adds = t['count']
         
-        if normalized_name in name_to_fp:
-            original_name, fp = name_to_fp[normalized_name]
-            # Find the full stat line for this player
-            player_stat = next((s for s in box_scores if normalize_name(s['name']).lower() == normalized_name), None)
+            player_stat = crosswalk.resolve(box_index, pid, name)
             if player_stat:
+                original_name, fp = player_stat['name'], player_stat['fantasy_points']
                 pts = player_stat.get('points', 0)
                 reb = player_stat.get('total_rebounds', 0)
                 ast = player_stat.get('assists', 0)
-                stl = player_stat.get('steals', 0)
-                blk = player_stat.get('blocks', 0)
-                team = player_stat.get('team', 'UNK')
-                print(f"{matched + 1:2d}. {original_name:5s} - {fp:6.2f} FP")
+                print(f"{matched + 1:2d}. {original_name:5s} - {fp:6.2f} FP - Adds: {adds:5d}")
                 print(f"     {pts}pts, {reb}reb, {ast}ast")
-            else:
-                print(f"{matched + 1:2d}. {original_name:25s} - {fp:6.2f} FP - Adds: {adds:5d}")
-            matched += 1
+                matched += 1
     
+        crosswalk.save()
+        timing['matched'] = matched
+    metrics.count('match.trending.matched', matched)
+    metrics.count('match.trending.unmatched', len(trending) - matched)
     print(f"\n✓ Matched {matched}/{len(trending)} trending players with game data")
-    
+    return trending
+
+
+def generate_report(target_date, debug=False, players_ttl=24, include_trending=True, scraper=None,
+                    scoring_matrix=None, store=None, write_json=True, incremental=False):
+    """Builds and saves the fantasy report for one date. Returns the report dict, or None if no games were found.
+
+    Raises ScrapeError when the page could not be fetched, so callers can tell a failed day from an empty one.
+    """
+    day, month, year = target_date.day, target_date.month, target_date.year
+
+    print(f"\nFetching NBA stats for: {target_date.strftime('%A, %B %d, %Y')}")
+
+    date_str = target_date.strftime('%Y-%m-%d')
+
+    # Fetch box scores with debugging
+    page = fetch_daily_leaders(day, month, year, debug=debug, scraper=scraper)
+
+    # The rest of the page (ads, timestamps) changes on every fetch, so only the stats table and
+    # the scoring settings decide whether the day needs re-parsing and re-scoring
+    table = find_stats_table(page)
+    league_weights = scoring_matrix.weights.tolist() if scoring_matrix is not None else None
+    stats_hash = content_hash(table.encode('utf-8'), scoring, league_weights) if table is not None else None
+    if incremental and store is not None and stats_hash and store.content_hash(date_str, 'daily_leaders') == stats_hash:
+        print(f"\n✓ {date_str} is unchanged since it was last ingested, skipping")
+        metrics.count('store.days_unchanged')
+        return {'date': date_str, 'unchanged': True}
+
+    box_scores = parse_daily_leaders(page)
+
+    # Filter players who played
+    box_scores = [s for s in box_scores if s.get('minutes_played', 0) > 0]
+
+    if not box_scores:
+        print("\n❌ No player data available. Check the debug output above.")
+        print("\nTroubleshooting tips:")
+        print("1. Check if there were actually NBA games on this date")
+        print("2. Look at the saved debug HTML file to see what Basketball-Reference returned")
+        print("3. Try visiting the URL directly in your browser")
+        print("4. Basketball-Reference may be blocking automated requests")
+        return None
+
+    print(f"\n✓ Loaded stats for {len(box_scores)} players who played\n")
+
+    # Calculate fantasy points
+    with metrics.stage('score', rows=len(box_scores),
+                       leagues=len(scoring_matrix.names) if scoring_matrix is not None else 0):
+        for stat, fp in zip(box_scores, score_rows(box_scores, scoring)):
+            stat['fantasy_points'] = fp
+
+        # Score every configured league in one matrix product
+        if scoring_matrix is not None:
+            for stat, league_fp in zip(box_scores, scoring_matrix.score_rows(box_scores)):
+                stat['league_fantasy_points'] = league_fp
+
+    # Sort and get top 20
+    top_players = sorted(box_scores, key=lambda x: x['fantasy_points'], reverse=True)[:20]
+
+    # Output top fantasy players
+    print(f"{'='*60}")
+    print(f"Top Fantasy Players for {target_date.strftime('%Y-%m-%d')}:")
+    print(f"{'='*60}")
+    for i, player in enumerate(top_players, 1):
+        pts = player.get('points', 0)
+        reb = player.get('total_rebounds', 0)
+        ast = player.get('assists', 0)
+        stl = player.get('steals', 0)
+        blk = player.get('blocks', 0)
+        print(f"{i:2d}. {player['name']:5s} - {player['fantasy_points']:6.2f} FP")
+        print(f"     {pts}pts, {reb}reb, {ast}ast")
+
+    # Sleeper trending only reflects the last 24 hours, so it is skipped for past dates in a backfill
+    trending = []
+    if include_trending:
+        try:
+            trending = fetch_trending(box_scores, target_date, players_ttl)
+        except Exception as e:
+            print(f"❌ Error with Sleeper API: {e}")
+            print("Continuing without trending data...")
+
+    report = {
+        'date': date_str,
+        'top_players': top_players,
+        'trending': trending,
+        'total_players': len(box_scores)
+    }
+
+    # Keep every box score, not just the top 20, in the season store
+    if store is not None:
+        trending_hash = content_hash(trending) if include_trending else None
+        if trending_hash and trending_hash == store.content_hash(date_str, 'trending'):
+            trending_hash = None  # Trending adds unchanged, keep the stored copy
+        with metrics.stage('store.write_day', rows=len(box_scores)):
+            store.write_day(date_str, box_scores, trending if trending_hash else None)
+            store.record_hash(date_str, 'daily_leaders', stats_hash)
+            if trending_hash:
+                store.record_hash(date_str, 'trending', trending_hash)
+        print(f"\n✓ Stored {len(box_scores)} box scores in: {store.path}")
+
     # Save to file
-    filename = f"fantasy_report_{target_date.strftime('%Y-%m-%d')}.json"
-    with open(filename, 'w') as f:
-        report = {
-            'date': target_date.strftime('%Y-%m-%d'),
-            'top_players': top_players,
-            'trending': trending,
-            'total_players': len(box_scores)
-        }
-        json.dump(report, f, indent=4)
-    print(f"\n✓ Report saved to: {filename}")
-    
-except Exception as e:
-    print(f"❌ Error with Sleeper API: {e}")
-    print("Continuing without trending data...")
\ No newline at end of file
+    if write_json:
+        filename = report_filename(target_date)
+        with metrics.stage('write.report_json') as timing:
+            with open(filename, 'w') as f:
+                json.dump(report, f, indent=4)
+            timing['bytes'] = os.path.getsize(filename)
+        print(f"\n✓ Report saved to: {filename}")
+    return report
+
+
+def season_range(season):
+    """Returns (start, end) for the NBA season that tips off in October of the given year."""
+    start = datetime.date(season, 10, 1)
+    end = min(datetime.date(season + 1, 6, 30), datetime.date.today() - timedelta(days=1))
+    return start, end
+
+
+def load_progress(path=BACKFILL_PROGRESS_FILE):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'completed': [], 'empty': []}
+
+
+def save_progress(progress, path=BACKFILL_PROGRESS_FILE):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(progress, f, indent=4)
+    os.replace(tmp_path, path)
+
+
+def pending_dates(start, end, progress, stored_dates=()):
+    """Dates in [start, end] that have no saved report, stored box scores or recorded result in progress."""
+    done = set(progress.get('completed', [])) | set(progress.get('empty', [])) | set(stored_dates)
+    dates = []
+    day = start
+    while day <= end:
+        if day.isoformat() not in done and not os.path.exists(report_filename(day)):
+            dates.append(day)
+        day += timedelta(days=1)
+    return dates
+
+
+def backfill(start, end, workers=4, min_interval=DEFAULT_MIN_INTERVAL, debug=False, progress_path=BACKFILL_PROGRESS_FILE,
+             scoring_matrix=None, store=None, write_json=True, incremental=False, burst=1):
+    """Generates reports for every missing date in [start, end] with a bounded worker pool.
+
+    All workers share one ScrapeClient, whose token bucket lets each host average one request per
+    min_interval seconds (Basketball-Reference blocks clients that exceed ~20 requests a minute).
+    Throttled and failed fetches are retried with backoff; if the site keeps blocking, its circuit
+    breaker opens and the backfill stops rather than extending the ban. Progress is saved after
+    every day, so an interrupted run picks up at the first missing date. With incremental, every
+    date in the range is fetched again but only days whose stats table changed are re-parsed and
+    re-scored.
+    """
+    progress = load_progress(progress_path)
+    if incremental:
+        dates = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    else:
+        dates = pending_dates(start, end, progress, store.dates() if store is not None else ())
+    print(f"\nBackfilling {len(dates)} missing day(s) between {start} and {end} with {workers} worker(s)")
+    if not dates:
+        return progress
+
+    scraper = ScrapeClient(min_interval=min_interval, burst=burst)
+    lock = threading.Lock()
+
+    def run(day):
+        with metrics.stage('report.day', date=day.isoformat()) as timing:
+            report = generate_report(day, debug=debug, include_trending=False, scraper=scraper,
+                                     scoring_matrix=scoring_matrix, store=store, write_json=write_json,
+                                     incremental=incremental)
+            timing['players'] = report.get('total_players', 0) if report else 0
+        with lock:
+            progress.setdefault('completed' if report else 'empty', []).append(day.isoformat())
+            save_progress(progress, progress_path)
+        return report
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    failed = []
+    circuit_open = None
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run, day): day for day in dates}
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            try:
+                future.result()
+            except CircuitOpenError as e:
+                failed.append(futures[future])
+                if circuit_open is None:
+                    circuit_open = e
+                    for pending in futures:
+                        pending.cancel()
+            except Exception as e:
+                failed.append(futures[future])
+                print(f"❌ {futures[future]} failed: {e}")
+
+    skipped = sum(future.cancelled() for future in futures)
+    print(f"\n✓ Backfill finished: {len(dates) - len(failed) - skipped}/{len(dates)} day(s) processed")
+    if circuit_open:
+        print(f"🛑 Stopped early, the site is blocking us: {circuit_open}")
+    if failed or skipped:
+        print(f"⚠️  {len(failed) + skipped} day(s) not processed will be retried on the next run")
+    return progress
+
+
+def main(argv=None):
+    # Parse command-line arguments
+    parser = argparse.ArgumentParser(description="Fantasy Basketball Report Generator")
+    parser.add_argument('--date', type=str, default='yesterday',
+                        help="Date for the report: 'today', 'yesterday', 'day_before', or 'YYYY-MM-DD'")
+    parser.add_argument('--debug', action='store_true', help='Enable debug output')
+    parser.add_argument('--players-ttl', type=float, default=24,
+                        help='Hours to reuse the cached Sleeper player dump before revalidating')
+    parser.add_argument('--start', type=str, help='Backfill start date (YYYY-MM-DD)')
+    parser.add_argument('--end', type=str, default='yesterday', help="Backfill end date (default: 'yesterday')")
+    parser.add_argument('--season', type=int, help='Backfill the season that tips off in this year, e.g. 2025 for 2025-26')
+    parser.add_argument('--workers', type=int, default=4, help='Parallel backfill workers')
+    parser.add_argument('--min-interval', type=float, default=DEFAULT_MIN_INTERVAL,
+                        help='Average seconds between requests to the same host during a backfill')
+    parser.add_argument('--burst', type=int, default=1,
+                        help='Requests a host may receive back to back before --min-interval spacing applies')
+    parser.add_argument('--scoring', action='append', default=[],
+                        help='Scoring config JSON file or directory of them; repeat for more leagues')
+    parser.add_argument('--league', action='append', default=[],
+                        help="Sleeper league ID whose scoring_settings should also be scored; repeatable")
+    parser.add_argument('--store', type=str, default=STORE_PATH, help='SQLite season store for all box scores')
+    parser.add_argument('--json', action=argparse.BooleanOptionalAction, default=True,
+                        help='Also export the dated fantasy_report_YYYY-MM-DD.json file')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Re-fetch dates already stored but only re-parse and re-score ones whose source changed')
+    args = parser.parse_args(argv)
+
+    scoring_matrix = None
+    if args.scoring or args.league:
+        from league_scoring import ScoringMatrix, fetch_league_scorings, load_scoring_configs
+
+        configs = load_scoring_configs(args.scoring)
+        configs.update(fetch_league_scorings(args.league))
+        scoring_matrix = ScoringMatrix(configs)
+        if scoring_matrix.unsupported:
+            print(f"⚠️  Not in box scores, scored as 0: {', '.join(scoring_matrix.unsupported)}")
+
+    if args.season or args.start:
+        if args.season:
+            start, end = season_range(args.season)
+        else:
+            start, end = resolve_date(args.start), resolve_date(args.end)
+        with SeasonStore(args.store) as store:
+            backfill(start, end, workers=args.workers, min_interval=args.min_interval, debug=args.debug,
+                     scoring_matrix=scoring_matrix, store=store, write_json=args.json,
+                     incremental=args.incremental, burst=args.burst)
+        return
+
+    # Determine the target date
+    try:
+        target_date = resolve_date(args.date)
+    except ValueError:
+        print("Invalid date format. Using yesterday's date.")
+        target_date = datetime.date.today() - timedelta(days=1)
+
+    try:
+        with SeasonStore(args.store) as store:
+            report = generate_report(target_date, debug=args.debug, players_ttl=args.players_ttl,
+                                     scoring_matrix=scoring_matrix, store=store, write_json=args.json,
+                                     incremental=args.incremental)
+    except ScrapeError as e:
+        print(f"❌ Could not fetch Basketball-Reference: {e}")
+        report = None
+    if report is None:
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
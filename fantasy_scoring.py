@@ -0,0 +1,98 @@
+# Hardcoded scoring based on your league's settings
+scoring = {
+    'pts': 0.5,
+    'reb': 1.0,
+    'ast': 1.0,
+    'stl': 2.0,
+    'blk': 2.0,
+    'to': -1.0,
+    'fg3m': 0.5,
+    'ff': -2.0,
+    'bonus_dd': 1.0,
+    'bonus_td': 2.0,
+    'bonus_40p': 2.0,
+    'bonus_50p': 2.0,
+    'bonus_15a': 0.0,
+    'bonus_20r': 0.0,
+}
+
+stat_mapping = {
+    'points': 'pts',
+    'total_rebounds': 'reb',
+    'assists': 'ast',
+    'steals': 'stl',
+    'blocks': 'blk',
+    'turnovers': 'to',
+    'made_three_point_field_goals': 'fg3m',
+    'personal_fouls': 'pf',
+}
+
+DOUBLE_STATS = ['points', 'total_rebounds', 'assists', 'steals', 'blocks']
+
+# (bonus key, stat, threshold) in the order calculate_fantasy_points applies them
+THRESHOLD_BONUSES = [
+    ('bonus_40p', 'points', 40),
+    ('bonus_50p', 'points', 50),
+    ('bonus_15a', 'assists', 15),
+    ('bonus_20r', 'total_rebounds', 20),
+]
+
+def calculate_fantasy_points(stat, scoring):
+    fp = 0.0
+    for box_key, score_key in stat_mapping.items():
+        if box_key in stat and score_key in scoring:
+            fp += stat[box_key] * scoring[score_key]
+    
+    doubles_count = sum(1 for key in DOUBLE_STATS if stat.get(key, 0) >= 10)
+    if doubles_count >= 2:
+        fp += scoring.get('bonus_dd', 0)
+    if doubles_count >= 3:
+        fp += scoring.get('bonus_td', 0)
+    
+    for bonus_key, stat_key, threshold in THRESHOLD_BONUSES:
+        if stat.get(stat_key, 0) >= threshold:
+            fp += scoring.get(bonus_key, 0)
+    
+    return fp
+
+def stats_to_columns(stats):
+    """Turns a list of box-score dicts into {stat: np.ndarray} for the columns score_table reads."""
+    import numpy as np
+
+    keys = set(stat_mapping) | set(DOUBLE_STATS)
+    return {key: np.fromiter((stat.get(key, 0) for stat in stats), dtype=np.float64, count=len(stats))
+            for key in keys}
+
+def score_table(table, scoring):
+    """Scores every row of a columnar stat table at once.
+
+    table is anything indexable by box-score column name (a DataFrame, or a dict of arrays);
+    missing columns and NaNs count as 0. The weights and bonuses are applied in the same order
+    as calculate_fantasy_points, so each row matches it exactly.
+    """
+    import numpy as np  # deferred so the per-row scorer can be imported without NumPy's startup cost
+
+    columns = {key: np.nan_to_num(np.asarray(table[key], dtype=np.float64))
+               for key in set(stat_mapping) | set(DOUBLE_STATS) if key in table}
+    rows = len(next(iter(columns.values()))) if columns else len(table)
+    zeros = np.zeros(rows)
+
+    fp = np.zeros(rows)
+    for box_key, score_key in stat_mapping.items():
+        if box_key in columns and score_key in scoring:
+            fp += columns[box_key] * scoring[score_key]
+
+    doubles_count = sum((columns.get(key, zeros) >= 10).astype(np.int8) for key in DOUBLE_STATS)
+    fp += np.where(doubles_count >= 2, scoring.get('bonus_dd', 0), 0.0)
+    fp += np.where(doubles_count >= 3, scoring.get('bonus_td', 0), 0.0)
+
+    for bonus_key, stat_key, threshold in THRESHOLD_BONUSES:
+        fp += np.where(columns.get(stat_key, zeros) >= threshold, scoring.get(bonus_key, 0), 0.0)
+
+    return fp
+
+def score_rows(stats, scoring):
+    """score_table for a list of box-score dicts; returns plain floats in row order."""
+    if not stats:
+        return []
+    return score_table(stats_to_columns(stats), scoring).tolist()
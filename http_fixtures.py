@@ -0,0 +1,194 @@
+"""Record every HTTP response the pipeline receives, and replay them from a local stand-in server.
+
+Everything the scripts fetch (Sleeper through SleeperClient, Basketball-Reference through
+ScrapeClient, FantasyPros through requests.get) ends in requests.Session.send, so that is the
+one place both modes hook:
+
+- record: responses are passed through unchanged and saved to a fixture directory.
+- replay: a StandInServer on 127.0.0.1 serves the fixtures, and each outgoing request is
+  rewritten from https://<host>/<path> to http://127.0.0.1:<port>/<host>/<path>. Requests
+  still go over real sockets, so connection pooling and concurrency behave as they do live.
+
+Use it through the CLI: python ballknowers.py --record fixtures/ league
+                        python ballknowers.py --replay fixtures/ --latency 40 league
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+FIXTURES_DIR = 'fixtures'
+INDEX_FILENAME = 'index.json'
+KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Location', 'Retry-After')
+
+
+def fixture_key(method, url):
+    return f"{method.upper()} {url}"
+
+
+class FixtureStore:
+    """A directory of recorded responses: index.json maps 'METHOD url' to status, headers and a body file."""
+
+    def __init__(self, path=FIXTURES_DIR):
+        self.path = path
+        self.index_path = os.path.join(path, INDEX_FILENAME)
+        self._lock = threading.Lock()
+        try:
+            with open(self.index_path, 'r') as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+
+    def __len__(self):
+        return len(self.index)
+
+    def save(self, method, url, status, headers, body):
+        key = fixture_key(method, url)
+        body_name = hashlib.sha1(key.encode('utf-8')).hexdigest() + '.bin'
+        entry = {
+            'status': status,
+            'headers': {name: headers[name] for name in KEPT_HEADERS if name in headers},
+            'body': body_name,
+        }
+        with self._lock:
+            os.makedirs(os.path.join(self.path, 'bodies'), exist_ok=True)
+            with open(os.path.join(self.path, 'bodies', body_name), 'wb') as f:
+                f.write(body)
+            self.index[key] = entry
+            tmp_path = self.index_path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(self.index, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+
+    def load(self, method, url):
+        """(status, headers, body) recorded for url, or None."""
+        entry = self.index.get(fixture_key(method, url))
+        if entry is None:
+            return None
+        with open(os.path.join(self.path, 'bodies', entry['body']), 'rb') as f:
+            return entry['status'], entry['headers'], f.read()
+
+
+class StandInServer:
+    """Serves a FixtureStore over HTTP at /<host>/<path>, adding latency seconds to every response.
+
+    Conditional requests are honoured, so a recorded ETag answers a matching If-None-Match with
+    304 just as Sleeper would. Unrecorded URLs get a 404 and are listed in self.misses.
+    """
+
+    def __init__(self, store, latency=0.0, host='127.0.0.1', port=0):
+        self.store = store
+        self.latency = latency
+        self.misses = []
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive, so pooled connections are reused as they are live
+
+            def do_GET(self):
+                host, _, rest = self.path.lstrip('/').partition('/')
+                url = f"https://{host}/{rest}"
+                if stand_in.latency:
+                    time.sleep(stand_in.latency)
+                fixture = stand_in.store.load('GET', url)
+                if fixture is None:
+                    stand_in.misses.append(url)
+                    status, headers, body = 404, {'Content-Type': 'application/json'}, b'{"error": "no fixture"}'
+                else:
+                    status, headers, body = fixture
+                    etag = headers.get('ETag')
+                    if etag and self.headers.get('If-None-Match') == etag:
+                        status, body = 304, b''
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+_original_send = None
+
+
+def _original():
+    """requests.Session.send as it was before either mode was installed."""
+    import requests
+
+    global _original_send
+    if _original_send is None:
+        _original_send = requests.Session.send
+    return _original_send
+
+
+def uninstall():
+    """Restores requests.Session.send."""
+    import requests
+
+    global _original_send
+    if _original_send is not None:
+        requests.Session.send = _original_send
+        _original_send = None
+
+
+def record(store):
+    """Saves every response received from now on into store (304s are skipped: they carry no body)."""
+    import requests
+
+    original = _original()
+
+    def send(session, request, **kwargs):
+        response = original(session, request, **kwargs)
+        if response.status_code != 304:
+            store.save(request.method, request.url, response.status_code, response.headers, response.content)
+        return response
+
+    requests.Session.send = send
+
+
+def replay(server_url):
+    """Sends every request from now on to the stand-in server at server_url instead of its real host."""
+    import requests
+
+    original = _original()
+
+    def send(session, request, **kwargs):
+        if not request.url.startswith(server_url):
+            parts = urlsplit(request.url)
+            query = f"?{parts.query}" if parts.query else ''
+            request.url = f"{server_url}/{parts.netloc}{parts.path}{query}"
+        return original(session, request, **kwargs)
+
+    requests.Session.send = send
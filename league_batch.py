@@ -0,0 +1,212 @@
+import argparse
+import json
+import os
+import time
+
+import metrics
+from sleeper_client import DEFAULT_MAX_CONCURRENCY, SleeperClient
+
+LEAGUES_PATH = 'leagues.json'
+OUTPUT_DIR = 'league_reports'
+
+
+def load_leagues(path=LEAGUES_PATH):
+    """Reads the batch config: a JSON list of leagues.
+
+    Each entry is a league_id string or {"league_id", "name", "draft_id", "members"}; draft_id
+    defaults to the league's own draft and members (usernames) limits the members listed.
+    """
+    with open(path, 'r') as f:
+        entries = json.load(f)
+    leagues = []
+    for entry in entries:
+        league = {'league_id': entry} if isinstance(entry, str) else dict(entry)
+        league['league_id'] = str(league['league_id'])
+        leagues.append(league)
+    return leagues
+
+
+class UserCache:
+    """Sleeper users by user_id, shared by every league in a batch so each person is fetched once.
+
+    fetch() is called between stages rather than from the league workers, so there is never more
+    than one request in flight for the same user.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.users = {}
+
+    def fetch(self, user_ids):
+        """Fetches the users not already cached in one concurrent batch; returns how many were fetched."""
+        missing = sorted({user_id for user_id in user_ids if user_id and user_id not in self.users})
+        for user_id, response in zip(missing, self.client.get_many(f"/user/{user_id}" for user_id in missing)):
+            self.users[user_id] = response.json() if response.status_code == 200 else None
+        return len(missing)
+
+    def get(self, user_id):
+        return self.users.get(user_id)
+
+
+def fetch_league_bases(leagues, client):
+    """League settings, rosters and users for every league, as one get_many batch."""
+    paths = []
+    for league in leagues:
+        league_id = league['league_id']
+        paths += [f"/league/{league_id}", f"/league/{league_id}/rosters", f"/league/{league_id}/users"]
+    responses = client.get_many(paths)
+
+    bases = {}
+    for i, league in enumerate(leagues):
+        batch = responses[3 * i:3 * i + 3]
+        failed = [r for r in batch if r.status_code != 200]
+        if failed:
+            print(f"❌ Failed to fetch league {league['league_id']}, Status Code: {failed[0].status_code}")
+            continue
+        settings, rosters, users = batch
+        bases[league['league_id']] = (settings.json() or {}, rosters, users.json() or [])
+    return bases
+
+
+def process_league(league, base, user_cache, player_index, client, weeks=None):
+    """Builds one league's summary and draft report from data shared across the batch."""
+    from draft_report import build_report
+    from league_metrics import compute_awards
+    from main import enrich_member_data
+    from matchup_store import MatchupStore, fetch_season_matchups
+    from models.decoding import decode_rosters
+
+    league_id = league['league_id']
+    settings, rosters_response, league_users = base
+    rosters = decode_rosters(rosters_response.content)
+
+    members = {}
+    for user in league_users:
+        data = user_cache.get(user['user_id']) or user
+        username = data.get('username') or data.get('display_name')
+        if not league.get('members') or username in league['members']:
+            members[username] = data
+    members = enrich_member_data(members, rosters)
+    managers = {member.roster_id: username for username, member in members.items()}
+
+    draft_id = league.get('draft_id') or settings.get('draft_id')
+    picks = []
+    if draft_id:
+        response = client.get(f"/draft/{draft_id}/picks")
+        picks = response.json() if response.status_code == 200 else []
+    roster_owners = [{'roster_id': r.roster_id, 'owner_id': r.owner_id} for r in rosters]
+    draft = build_report(league_id, draft_id, picks, league_users, roster_owners)
+
+    season = fetch_season_matchups(league_id, weeks, client)
+    store = MatchupStore.from_weeks(season)
+    standings = [{'roster_id': roster_id, 'manager': managers.get(roster_id, f"Roster {roster_id}"), **row}
+                 for roster_id, row in store.standings().items()]
+    awards = {name: {'manager': managers.get(result[0], f"Roster {result[0]}"), 'value': result[1]} if result else None
+              for name, result in compute_awards(season).items()}
+    top_scorers = {}
+    for roster_id in store.roster_ids:
+        totals = store.player_totals(roster_id)
+        if totals:
+            player_id = max(totals, key=totals.get)
+            top_scorers[managers.get(roster_id, f"Roster {roster_id}")] = {
+                'player': player_index.name(player_id, player_id) if player_index else player_id,
+                'points': totals[player_id],
+            }
+
+    summary = {
+        'league_id': league_id,
+        'name': league.get('name') or settings.get('name') or league_id,
+        'draft_id': draft_id,
+        'weeks': store.played_weeks,
+        'members': [{'username': username, 'user_id': m.user_id, 'display_name': m.display_name,
+                     'roster_id': m.roster_id} for username, m in members.items()],
+        'standings': standings,
+        'awards': awards,
+        'top_scorers': top_scorers,
+    }
+    return summary, draft
+
+
+def run_batch(leagues, workers=8, output_dir=OUTPUT_DIR, client=None, weeks=None, players_ttl=24):
+    """Processes every league in parallel with one connection pool, user cache and player index.
+
+    Stages that can be shared run once for the whole batch: the league/roster/user requests go
+    out together, then every distinct user_id is looked up once, then each league's draft and
+    matchups are fetched and summarized on its own worker. Writes one JSON summary per league
+    and a combined draft CSV to output_dir; returns {league_id: summary}.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    import pandas as pd
+
+    from player_index import load_index
+
+    client = client or SleeperClient(max_concurrency=DEFAULT_MAX_CONCURRENCY)
+    with metrics.stage('fetch.league_bases', leagues=len(leagues)):
+        bases = fetch_league_bases(leagues, client)
+    user_cache = UserCache(client)
+    with metrics.stage('fetch.users') as timing:
+        fetched = user_cache.fetch(user['user_id'] for _, _, users in bases.values() for user in users)
+        timing['users'] = fetched
+    print(f"✓ Fetched {fetched} distinct users for {len(bases)} league(s)")
+
+    try:
+        with metrics.stage('players.load_index'):
+            player_index = load_index(ttl=players_ttl * 3600, client=client)
+    except Exception as e:
+        print(f"⚠️  Player index unavailable, top scorers will show player IDs: {e}")
+        player_index = None
+
+    leagues = [league for league in leagues if league['league_id'] in bases]
+    results = []
+
+    def run(league):
+        with metrics.stage('league.process', league_id=league['league_id']):
+            return process_league(league, bases[league['league_id']], user_cache, player_index, client, weeks)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(leagues)))) as pool:
+        futures = [pool.submit(run, league) for league in leagues]
+        for league, future in zip(leagues, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"❌ League {league['league_id']} failed: {e}")
+    if player_index is not None:
+        player_index.close()
+
+    os.makedirs(output_dir, exist_ok=True)
+    summaries = {}
+    for summary, _ in results:
+        with open(os.path.join(output_dir, f"{summary['league_id']}.json"), 'w') as f:
+            json.dump(summary, f, indent=4)
+        summaries[summary['league_id']] = summary
+    if results:
+        pd.concat([draft for _, draft in results], ignore_index=True).to_csv(
+            os.path.join(output_dir, 'draft_report.csv'), index=False)
+    return summaries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Nightly batch: summaries and draft reports for many leagues")
+    parser.add_argument('--config', type=str, default=LEAGUES_PATH, help='JSON list of leagues to process')
+    parser.add_argument('--output-dir', type=str, default=OUTPUT_DIR, help='Where summaries and the draft CSV go')
+    parser.add_argument('--workers', type=int, default=8, help='Leagues processed at once')
+    parser.add_argument('--weeks', type=int, help='Only scan matchup weeks 1..N (default: the whole season)')
+    parser.add_argument('--players-ttl', type=float, default=24,
+                        help='Hours to reuse the cached Sleeper player dump before revalidating')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    leagues = load_leagues(args.config)
+    weeks = list(range(1, args.weeks + 1)) if args.weeks else None
+    summaries = run_batch(leagues, workers=args.workers, output_dir=args.output_dir, weeks=weeks,
+                          players_ttl=args.players_ttl)
+    for summary in summaries.values():
+        leader = summary['standings'][0]['manager'] if summary['standings'] else 'n/a'
+        print(f"  {summary['name']}: {len(summary['members'])} members, "
+              f"{len(summary['weeks'])} weeks, leader {leader}")
+    print(f"✓ {len(summaries)}/{len(leagues)} league(s) in {time.perf_counter() - start:.1f}s -> {args.output_dir}/")
+
+
+if __name__ == "__main__":
+    main()
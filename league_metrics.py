@@ -0,0 +1,242 @@
+import argparse
+import json
+import os
+from abc import ABC, abstractmethod
+from collections import Counter, defaultdict
+
+from matchup_store import fetch_season_matchups, week_played
+from sleeper_client import get_client
+
+STATUS_HISTORY_PATH = os.path.join('.cache', 'status_history.json')
+TROUBLED_STATUSES = {'Out', 'Doubtful', 'Questionable', 'DTD', 'Day-To-Day', 'IR', 'Sus', 'Suspended'}
+
+
+class WeekContext:
+    """One week of matchups with the indexes every award reads, built once per week."""
+
+    def __init__(self, week, matchups, statuses=None):
+        self.week = week
+        self.matchups = matchups
+        self.points = {m['roster_id']: m.get('points') or 0.0 for m in matchups}
+        self.ranking = sorted(self.points, key=self.points.get, reverse=True)
+        self.rosters = {m['roster_id']: set(m.get('players') or ()) for m in matchups}
+        self.starter_points = {m['roster_id']: sum(m.get('starters_points') or ()) for m in matchups}
+        statuses = statuses or {}
+        self.status_counts = {
+            roster_id: Counter(statuses[pid] for pid in players if statuses.get(pid))
+            for roster_id, players in self.rosters.items()
+        }
+
+
+class Award(ABC):
+    name = ''
+    description = ''
+
+    @abstractmethod
+    def observe(self, ctx):
+        """Folds one week's WeekContext into the award's running state."""
+
+    @abstractmethod
+    def result(self):
+        """Returns (roster_id, value) for the winner, or None if there is nothing to award."""
+
+
+class CountingAward(Award):
+    """Winner is the roster with the highest running total."""
+
+    def __init__(self):
+        self.totals = Counter()
+
+    def result(self):
+        if not self.totals:
+            return None
+        return self.totals.most_common(1)[0]
+
+
+class LongestHold(Award):
+    name = 'Jabari Smith Award'
+    description = 'Held the target player for the longest unbroken run of weeks'
+
+    def __init__(self, player_id):
+        self.player_id = str(player_id)
+        self.weeks = defaultdict(set)
+
+    def observe(self, ctx):
+        for roster_id, players in ctx.rosters.items():
+            if self.player_id in players:
+                self.weeks[roster_id].add(int(ctx.week))
+
+    @staticmethod
+    def longest_run(weeks):
+        longest = run = 0
+        previous = None
+        for week in sorted(weeks):
+            run = run + 1 if previous is not None and week == previous + 1 else 1
+            longest = max(longest, run)
+            previous = week
+        return longest
+
+    def result(self):
+        runs = {roster_id: self.longest_run(weeks) for roster_id, weeks in self.weeks.items()}
+        if not runs:
+            return None
+        return max(runs.items(), key=lambda item: item[1])
+
+
+class Observatory(CountingAward):
+    name = 'Observatory Award'
+    description = 'Most weekly top-3 finishes'
+
+    def __init__(self, top_n=3):
+        super().__init__()
+        self.top_n = top_n
+
+    def observe(self, ctx):
+        for roster_id in ctx.ranking[:self.top_n]:
+            self.totals[roster_id] += 1
+
+
+class BoxOfScraps(Award):
+    name = 'Box of Scraps Award'
+    description = 'Lowest locked-in starting lineup total in a single week'
+
+    def __init__(self):
+        self.lowest = None
+
+    def observe(self, ctx):
+        for roster_id, points in ctx.starter_points.items():
+            if self.lowest is None or points < self.lowest[1]:
+                self.lowest = (roster_id, points)
+
+    def result(self):
+        return self.lowest
+
+
+class DomesticDisturbance(Award):
+    name = 'Domestic Disturbance Award'
+    description = 'Most troubled players on a roster at one point'
+
+    def __init__(self):
+        self.worst = None
+
+    def observe(self, ctx):
+        for roster_id, counts in ctx.status_counts.items():
+            troubled = sum(n for status, n in counts.items() if status in TROUBLED_STATUSES)
+            if troubled and (self.worst is None or troubled > self.worst[1]):
+                self.worst = (roster_id, troubled)
+
+    def result(self):
+        return self.worst
+
+
+class JoelEmbiid(CountingAward):
+    name = 'Joel Embiid Injury Award'
+    description = "Most 'Out' statuses on a roster across the season"
+
+    def observe(self, ctx):
+        for roster_id, counts in ctx.status_counts.items():
+            if counts['Out']:
+                self.totals[roster_id] += counts['Out']
+
+
+def default_awards(hold_player_id=None):
+    awards = [Observatory(), BoxOfScraps(), DomesticDisturbance(), JoelEmbiid()]
+    if hold_player_id:
+        awards.insert(0, LongestHold(hold_player_id))
+    return awards
+
+
+def compute_awards(weeks, awards=None, status_history=None):
+    """Runs every award over the season in one pass.
+
+    weeks is an iterable of (week, matchups) in any order; status_history maps week to
+    {player_id: injury_status}. Each week's WeekContext is built once and shared, so adding
+    an award adds work per week rather than another scan of the season. Weeks nobody has
+    scored in yet are skipped.
+    """
+    awards = awards if awards is not None else default_awards()
+    status_history = status_history or {}
+    for week, matchups in weeks:
+        if not week_played(matchups):
+            continue
+        ctx = WeekContext(week, matchups, status_history.get(week, status_history.get(str(week))))
+        for award in awards:
+            award.observe(ctx)
+    return {award.name: award.result() for award in awards}
+
+
+def fetch_roster_names(league_id, client=None):
+    """Maps roster_id to the owner's display name."""
+    client = client or get_client()
+    rosters, users = client.get_many([f"/league/{league_id}/rosters", f"/league/{league_id}/users"])
+    if rosters.status_code != 200 or users.status_code != 200:
+        return {}
+    user_names = {u['user_id']: u.get('display_name', 'Unknown') for u in users.json()}
+    return {r['roster_id']: user_names.get(r['owner_id'], 'Unknown') for r in rosters.json()}
+
+
+def load_status_history(path=STATUS_HISTORY_PATH):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def record_status_snapshot(week, player_ids, player_index, path=STATUS_HISTORY_PATH):
+    """Saves the current injury status of player_ids as week's entry in the status history.
+
+    Sleeper only exposes current statuses, so history is built up by recording a snapshot each week.
+    """
+    history = load_status_history(path)
+    snapshot = {}
+    for pid in player_ids:
+        record = player_index.get(pid)
+        if record and record.injury_status:
+            snapshot[pid] = record.injury_status
+    history[str(week)] = snapshot
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(history, f, indent=4)
+    return snapshot
+
+
+def print_awards(results, roster_names=None):
+    roster_names = roster_names or {}
+    print(f"\n{'='*60}")
+    print("🏆 Season Awards")
+    print(f"{'='*60}")
+    for name, result in results.items():
+        if result is None:
+            print(f"{name}: no data")
+            continue
+        roster_id, value = result
+        value = f"{value:.2f}" if isinstance(value, float) else value
+        print(f"{name}: {roster_names.get(roster_id, f'Roster {roster_id}')} ({value})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Season awards for a Sleeper league")
+    parser.add_argument('league_id', help='Sleeper league ID')
+    parser.add_argument('--weeks', type=int, default=25, help='Number of matchup weeks to scan')
+    parser.add_argument('--hold-player', type=str, help='Sleeper player_id for the longest-hold award')
+    parser.add_argument('--status-history', type=str, default=STATUS_HISTORY_PATH,
+                        help='JSON of {week: {player_id: injury_status}} snapshots')
+    parser.add_argument('--record-week', type=int,
+                        help="Save current injury statuses of this week's rostered players to the status history")
+    args = parser.parse_args(argv)
+
+    weeks = fetch_season_matchups(args.league_id, list(range(1, args.weeks + 1)))
+    if args.record_week:
+        from player_index import load_index
+        rostered = {pid for week, matchups in weeks if week == args.record_week
+                    for m in matchups for pid in m.get('players') or ()}
+        with load_index() as player_index:
+            snapshot = record_status_snapshot(args.record_week, rostered, player_index, args.status_history)
+        print(f"✓ Recorded {len(snapshot)} injury statuses for week {args.record_week}")
+    results = compute_awards(weeks, default_awards(args.hold_player), load_status_history(args.status_history))
+    print_awards(results, fetch_roster_names(args.league_id))
+
+
+if __name__ == "__main__":
+    main()
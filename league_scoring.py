@@ -0,0 +1,139 @@
+import glob
+import json
+import os
+
+import numpy as np
+
+from fantasy_scoring import DOUBLE_STATS, THRESHOLD_BONUSES, scoring as default_scoring, stat_mapping
+from sleeper_client import get_client
+
+# Sleeper's scoring_settings keys that differ from the ones our scoring dicts use
+SLEEPER_KEY_ALIASES = {
+    'dd': 'bonus_dd',
+    'td': 'bonus_td',
+    'bonus_pt_40p': 'bonus_40p',
+    'bonus_pt_50p': 'bonus_50p',
+    'bonus_ast_15p': 'bonus_15a',
+    'bonus_reb_20p': 'bonus_20r',
+}
+
+# Linear stats beyond stat_mapping that league settings commonly weight
+EXTRA_LINEAR_STATS = {
+    'made_field_goals': 'fgm',
+    'attempted_field_goals': 'fga',
+    'made_free_throws': 'ftm',
+    'attempted_free_throws': 'fta',
+    'offensive_rebounds': 'oreb',
+    'defensive_rebounds': 'dreb',
+    'attempted_three_point_field_goals': 'fg3a',
+}
+# Missed shots, derived as attempts minus makes
+MISSED_STATS = {
+    'fgmi': ('attempted_field_goals', 'made_field_goals'),
+    'ftmi': ('attempted_free_throws', 'made_free_throws'),
+}
+
+
+def normalize_scoring(settings):
+    """Maps a scoring dict (ours or Sleeper's scoring_settings) onto our scoring keys."""
+    return {SLEEPER_KEY_ALIASES.get(key, key): float(value) for key, value in settings.items()
+            if isinstance(value, (int, float))}
+
+
+def load_scoring_file(path):
+    """Loads {name: scoring} from a JSON file holding either a scoring dict or {"name": ..., "scoring": {...}}."""
+    with open(path, 'r') as f:
+        data = json.load(f)
+    name = data.get('name') or os.path.splitext(os.path.basename(path))[0]
+    return {name: normalize_scoring(data.get('scoring', data))}
+
+
+def load_scoring_configs(paths):
+    """Loads every scoring file in paths; directories contribute all of their *.json files."""
+    configs = {}
+    for path in paths:
+        files = sorted(glob.glob(os.path.join(path, '*.json'))) if os.path.isdir(path) else [path]
+        for file in files:
+            configs.update(load_scoring_file(file))
+    return configs
+
+
+def fetch_league_scorings(league_ids, client=None):
+    """Returns {league name: scoring} from each Sleeper league's scoring_settings, fetched concurrently."""
+    client = client or get_client()
+    configs = {}
+    for response, league_id in zip(client.get_many(f"/league/{league_id}" for league_id in league_ids), league_ids):
+        response.raise_for_status()
+        league = response.json()
+        configs[league.get('name') or league_id] = normalize_scoring(league.get('scoring_settings', {}))
+    return configs
+
+
+def _doubles(cols):
+    """Per row, how many of DOUBLE_STATS reached double figures."""
+    return sum((cols[key] >= 10).astype(np.int8) for key in DOUBLE_STATS)
+
+
+def _features():
+    """(scoring key, column builder) pairs; every league's weights are laid out in this order."""
+    features = []
+    for box_key, score_key in {**stat_mapping, **EXTRA_LINEAR_STATS}.items():
+        features.append((score_key, lambda cols, k=box_key: cols[k]))
+    for score_key, (attempts, makes) in MISSED_STATS.items():
+        features.append((score_key, lambda cols, a=attempts, m=makes: cols[a] - cols[m]))
+
+    features.append(('bonus_dd', lambda cols: (_doubles(cols) >= 2).astype(np.float64)))
+    features.append(('bonus_td', lambda cols: (_doubles(cols) >= 3).astype(np.float64)))
+    for bonus_key, stat_key, threshold in THRESHOLD_BONUSES:
+        features.append((bonus_key, lambda cols, s=stat_key, t=threshold: (cols[s] >= t).astype(np.float64)))
+    return features
+
+
+FEATURES = _features()
+FEATURE_KEYS = [key for key, _ in FEATURES]
+SOURCE_COLUMNS = sorted(set(stat_mapping) | set(EXTRA_LINEAR_STATS) | set(DOUBLE_STATS))
+
+
+class ScoringMatrix:
+    """Many leagues' scoring settings compiled into one (feature x league) weight matrix.
+
+    score() builds the feature matrix for a stat table once and multiplies it by the weights,
+    so adding a league adds a column to a matrix product rather than another scoring pass.
+    """
+
+    def __init__(self, configs):
+        self.names = list(configs)
+        self.weights = np.array([[configs[name].get(key, 0.0) for name in self.names] for key in FEATURE_KEYS],
+                                dtype=np.float64).reshape(len(FEATURE_KEYS), len(self.names))
+        unsupported = {key for config in configs.values() for key, value in config.items()
+                       if value and key not in FEATURE_KEYS}
+        # Stats the box scores do not carry (e.g. flagrant or technical fouls) cannot be scored
+        self.unsupported = sorted(unsupported)
+
+    def feature_matrix(self, table):
+        cols = {}
+        rows = None
+        for key in SOURCE_COLUMNS:
+            if key in table:
+                cols[key] = np.nan_to_num(np.asarray(table[key], dtype=np.float64))
+                rows = len(cols[key])
+        rows = rows or 0
+        for key in SOURCE_COLUMNS:
+            cols.setdefault(key, np.zeros(rows))
+        return np.column_stack([build(cols) for _, build in FEATURES]) if rows else np.zeros((0, len(FEATURES)))
+
+    def score(self, table):
+        """Returns a (rows x leagues) array of fantasy points, columns in self.names order."""
+        return self.feature_matrix(table) @ self.weights
+
+    def score_rows(self, stats):
+        """Scores a list of box-score dicts; returns one {league name: points} dict per row."""
+        if not stats:
+            return []
+        table = {key: [stat.get(key, 0) for stat in stats] for key in SOURCE_COLUMNS}
+        return [dict(zip(self.names, row)) for row in self.score(table).tolist()]
+
+
+def default_matrix(extra_configs=None):
+    """ScoringMatrix for the built-in league scoring plus any extra {name: scoring} configs."""
+    return ScoringMatrix({'default': dict(default_scoring), **(extra_configs or {})})
@@ -0,0 +1,242 @@
+"""Live standings for game nights: poll the current week's matchups and print only what changed.
+
+Every watched league is one asyncio task sharing a single SleeperClient, so its keep-alive pool
+and concurrency limit cover all of them. Each poll is a conditional GET (If-None-Match when
+Sleeper sent an ETag), and a body identical to the previous one is dropped before it is
+decoded. When something did change, only the rosters whose points moved are re-projected and
+only their matchups' margins recomputed. Leagues with nothing happening back off from
+--min-interval to --max-interval and snap back on the next change, so watching many leagues
+keeps CPU and bandwidth flat.
+"""
+import argparse
+import json
+
+import metrics
+from sleeper_client import DEFAULT_MAX_CONCURRENCY, SleeperClient
+
+MIN_INTERVAL = 15.0
+MAX_INTERVAL = 120.0
+BACKOFF = 1.5  # interval multiplier after a poll with no changes
+
+
+class LiveLeague:
+    """One league's current-week matchups, updated in place from each poll.
+
+    A roster's projection is its points so far plus what each starter has left of their weekly
+    season average (average minus points already scored this week, never below zero), so a
+    starter who has played one of several games still counts for the rest; a matchup's
+    projected margin is the difference between its two rosters' projections.
+    """
+
+    def __init__(self, league_id, week, name=None, managers=None, averages=None):
+        self.league_id = league_id
+        self.week = week
+        self.name = name or league_id
+        self.managers = managers or {}  # roster_id -> display name
+        self.averages = averages or {}  # player_id -> average points per week
+        self.rosters = {}  # roster_id -> {'points', 'players_points', 'starters', 'matchup_id', 'projected'}
+        self.matchups = {}  # matchup_id -> [roster_id, ...]
+        self.margins = {}  # matchup_id -> margin dict, see margin()
+        self.etag = None
+        self.body = None
+
+    @property
+    def path(self):
+        return f"/league/{self.league_id}/matchups/{self.week}"
+
+    def manager(self, roster_id):
+        return self.managers.get(roster_id, f"Roster {roster_id}")
+
+    def project(self, points, players_points, starters):
+        remaining = sum(max(self.averages.get(pid, 0.0) - (players_points.get(pid) or 0.0), 0.0) for pid in starters)
+        return points + remaining
+
+    def margin(self, matchup_id):
+        """Current and projected margin of the first roster over the second, or None without two rosters."""
+        roster_ids = self.matchups.get(matchup_id, [])
+        if len(roster_ids) != 2:
+            return None
+        home, away = (self.rosters[roster_id] for roster_id in roster_ids)
+        return {
+            'matchup_id': matchup_id,
+            'home': roster_ids[0],
+            'away': roster_ids[1],
+            'points': [home['points'], away['points']],
+            'margin': home['points'] - away['points'],
+            'projected_margin': home['projected'] - away['projected'],
+        }
+
+    def update(self, matchups):
+        """Applies one poll; returns (changed rosters, changed margins), both empty when nothing moved."""
+        changes = []
+        touched = set()
+        for m in matchups:
+            roster_id = m['roster_id']
+            points = m.get('points') or 0.0
+            players_points = m.get('players_points') or {}
+            starters = m.get('starters') or []
+            matchup_id = m.get('matchup_id')
+            previous = self.rosters.get(roster_id)
+            if (previous and previous['points'] == points and previous['players_points'] == players_points
+                    and previous['starters'] == starters and previous['matchup_id'] == matchup_id):
+                continue
+
+            self.rosters[roster_id] = {
+                'points': points,
+                'players_points': players_points,
+                'starters': starters,
+                'matchup_id': matchup_id,
+                'projected': self.project(points, players_points, starters),
+            }
+            old_points = previous['players_points'] if previous else {}
+            changes.append({
+                'roster_id': roster_id,
+                'manager': self.manager(roster_id),
+                'points': points,
+                'delta': points - (previous['points'] if previous else 0.0),
+                'projected': self.rosters[roster_id]['projected'],
+                'players': {pid: pts for pid, pts in players_points.items() if old_points.get(pid) != pts},
+            })
+            if previous and previous['matchup_id'] not in (None, matchup_id):
+                self.matchups.get(previous['matchup_id'], []).remove(roster_id)
+                touched.add(previous['matchup_id'])
+            if matchup_id is not None:
+                pair = self.matchups.setdefault(matchup_id, [])
+                if roster_id not in pair:
+                    pair.append(roster_id)
+                    pair.sort()
+                touched.add(matchup_id)
+
+        margins = []
+        for matchup_id in touched:
+            margin = self.margin(matchup_id)
+            if margin is None:
+                self.margins.pop(matchup_id, None)
+                continue
+            if margin != self.margins.get(matchup_id):
+                self.margins[matchup_id] = margin
+                margins.append(margin)
+        return changes, sorted(margins, key=lambda margin: margin['matchup_id'])
+
+
+async def poll(league, client):
+    """Fetches league's matchups; returns update()'s result, or None when the response is unchanged or failed."""
+    import asyncio
+
+    from models.decoding import loads
+
+    headers = {'If-None-Match': league.etag} if league.etag else {}
+    response = await asyncio.to_thread(client.get, league.path, headers=headers)
+    metrics.count('live.polls')
+    if response.status_code == 304 or (response.status_code == 200 and response.content == league.body):
+        metrics.count('live.unchanged')
+        return None
+    if response.status_code != 200:
+        metrics.count('live.errors')
+        print(f"⚠️  {league.name}: matchups returned status {response.status_code}")
+        return None
+    league.etag = response.headers.get('ETag')
+    league.body = response.content
+    with metrics.stage('live.update', league_id=league.league_id) as timing:
+        changes, margins = league.update(loads(response.content) or [])
+        timing['rosters_changed'] = len(changes)
+    return changes, margins
+
+
+def print_update(league, changes, margins, as_json=False):
+    if as_json:
+        print(json.dumps({'league_id': league.league_id, 'week': league.week, 'rosters': changes,
+                          'matchups': margins}), flush=True)
+        return
+    print(f"\n🔴 {league.name}, week {league.week}")
+    for change in sorted(changes, key=lambda change: -change['points']):
+        print(f"  {change['manager']:20s} {change['points']:7.1f} ({change['delta']:+.1f})  "
+              f"proj {change['projected']:7.1f}")
+    for margin in margins:
+        home, away = league.manager(margin['home']), league.manager(margin['away'])
+        print(f"  ⚔️  {home} {margin['points'][0]:.1f} - {margin['points'][1]:.1f} {away}  "
+              f"margin {margin['margin']:+.1f}, projected {margin['projected_margin']:+.1f}")
+
+
+async def watch_league(league, client, min_interval=MIN_INTERVAL, max_interval=MAX_INTERVAL, polls=None,
+                       as_json=False):
+    """Polls one league until polls is reached (forever if None), backing off while nothing changes."""
+    import asyncio  # ~50 ms to import, so only once watching starts
+
+    interval = min_interval
+    done = 0
+    while polls is None or done < polls:
+        try:
+            update = await poll(league, client)
+        except Exception as e:  # a dropped connection should not end a night of watching
+            metrics.count('live.errors')
+            print(f"⚠️  {league.name}: poll failed: {e}")
+            update = None
+        if update and (update[0] or update[1]):
+            print_update(league, *update, as_json=as_json)
+            interval = min_interval
+        else:
+            interval = min(max_interval, interval * BACKOFF)
+        done += 1
+        if polls is None or done < polls:
+            await asyncio.sleep(interval)
+
+
+def setup_leagues(leagues, week, client):
+    """LiveLeague objects for the batch config entries, with manager names and prior weeks' player averages."""
+    from league_batch import fetch_league_bases
+    from league_metrics import fetch_roster_names
+    from matchup_store import MatchupStore, fetch_season_matchups
+
+    bases = fetch_league_bases(leagues, client)
+    live = []
+    for league in leagues:
+        league_id = league['league_id']
+        if league_id not in bases:
+            continue
+        settings = bases[league_id][0]
+        season = fetch_season_matchups(league_id, range(1, week), client) if week > 1 else []
+        averages = MatchupStore.from_weeks(season).player_averages() if season else {}
+        live.append(LiveLeague(league_id, week, name=league.get('name') or settings.get('name'),
+                               managers=fetch_roster_names(league_id, client), averages=averages))
+    return live
+
+
+async def watch(leagues, client, **kwargs):
+    import asyncio
+
+    await asyncio.gather(*(watch_league(league, client, **kwargs) for league in leagues))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Live standings for the current week, printing only what changed")
+    parser.add_argument('league_ids', nargs='*', help='Sleeper league IDs (default: every league in --config)')
+    parser.add_argument('--config', type=str, default='leagues.json', help='JSON list of leagues to watch')
+    parser.add_argument('--week', type=int, help="Matchup week to watch (default: Sleeper's current week)")
+    parser.add_argument('--min-interval', type=float, default=MIN_INTERVAL, help='Seconds between polls while scores move')
+    parser.add_argument('--max-interval', type=float, default=MAX_INTERVAL, help='Longest wait once scores stop moving')
+    parser.add_argument('--polls', type=int, help='Stop after this many polls per league (default: run until Ctrl-C)')
+    parser.add_argument('--json', action='store_true', help='Print each update as a JSON line')
+    args = parser.parse_args(argv)
+
+    import asyncio
+
+    from league_batch import load_leagues
+    from matchup_store import current_week
+
+    leagues = [{'league_id': league_id} for league_id in args.league_ids] or load_leagues(args.config)
+    client = SleeperClient(max_concurrency=DEFAULT_MAX_CONCURRENCY)
+    week = args.week or current_week(client)
+    live = setup_leagues(leagues, week, client)
+    print(f"✓ Watching {len(live)} league(s), week {week}. Ctrl-C to stop.")
+    try:
+        asyncio.run(watch(live, client, min_interval=args.min_interval, max_interval=args.max_interval,
+                          polls=args.polls, as_json=args.json))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
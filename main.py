@@ -1,13 +1,14 @@
-import requests
+import argparse
+import metrics
 from models.league_member import LeagueMember  # Import the class
-from models.draft_pick import DraftPick
 from models.user_draft_pick import UserDraftPick
-from models.roster import Roster
-from bs4 import BeautifulSoup
+from sleeper_client import SleeperClient, get_client
+from matchup_store import MatchupStore, fetch_season_matchups
 
 # Constants
 LEAGUE_ID = "1141438340626231296"
 DRAFT_ID = "1141438341108498432"
+MAX_CONCURRENCY = 16  # Max in-flight Sleeper requests
 
 league_members = [
     "popsharky",
@@ -24,33 +25,30 @@ league_members = [
     "GraftonCarlson"
 ]
 
-def fetch_league_members(members, rosters):
-    """Fetches user data for each league member and returns a dictionary."""
+def fetch_member_data(members, client=None):
+    """Fetches raw user data for every league member concurrently."""
+    client = client or get_client()
     members_data = {}
 
-    for member in members:
-        url = f"https://api.sleeper.app/v1/user/{member}"  
-        response = requests.get(url)  
-
-        if response.status_code == 200:  
-            members_data[member] = response.json()  
+    responses = client.get_many(f"/user/{member}" for member in members)
+    for member, response in zip(members, responses):
+        if response.status_code == 200:
+            members_data[member] = response.json()
         else:
             print(f"❌ Failed to fetch data for {member}, Status Code: {response.status_code}")
 
-    
-    return enrich_member_data(members_data, rosters)
+    return members_data
+
+def fetch_league_members(members, rosters, client=None):
+    """Fetches user data for each league member and returns a dictionary."""
+    return enrich_member_data(fetch_member_data(members, client), rosters)
 
 def enrich_member_data(members_data, rosters):
     enriched_members = {}
+    owner_to_roster = {roster.owner_id: roster.roster_id for roster in rosters}
 
     for member, data in members_data.items():
         user_id = data["user_id"]
-        roster_id = None  
-
-        for roster in rosters:
-            if roster.owner_id == user_id:
-                roster_id = roster.roster_id
-                break
 
         enriched_members[member] = LeagueMember(
             user_id = user_id,
@@ -58,20 +56,20 @@ def enrich_member_data(members_data, rosters):
             display_name = data.get("display_name", ""),
             avatar = data.get("avatar", ""),
             is_bot = data.get("is_bot", ""),
-            roster_id = roster_id
+            roster_id = owner_to_roster.get(user_id)
         )
 
     return enriched_members
 
-def fetch_draft_picks(draft_id):
+def fetch_draft_picks(draft_id, client=None):
     """Fetches draft picks and returns a dictionary of DraftPick objects."""
-    url = f"https://api.sleeper.app/v1/draft/{draft_id}/picks"
-    response = requests.get(url)
+    client = client or get_client()
+    response = client.get(f"/draft/{draft_id}/picks")
 
     if response.status_code == 200:
-        draft_picks_data = response.json()
-        draft_picks_dict = {pick["pick_no"]: DraftPick(**pick) for pick in draft_picks_data}
-        return draft_picks_dict
+        from models.decoding import decode_draft_picks
+
+        return decode_draft_picks(response.content)
     else:
         print(f"❌ Failed to fetch draft picks, Status Code: {response.status_code}")
         return {}
@@ -92,83 +90,74 @@ def match_users_to_draft_picks(league_members_data, draft_picks_dict):
     
     return user_draft_picks
 
-def fetch_matchups(league_id):
-    url = f"https://api.sleeper.app/v1/league/{league_id}/matchups/1"
-    response = requests.get(url)
+def fetch_matchups(league_id, weeks=None, client=None):
+    """Fetches every matchup week concurrently and returns them as a MatchupStore."""
+    return MatchupStore.from_weeks(fetch_season_matchups(league_id, weeks, client))
 
-    if response.status_code == 200:
-        matchupdata = response.json()
-        print(matchupdata)
+def print_standings(matchup_store, members_data):
+    """Prints standings with median records and luck from a season of matchups."""
+    roster_to_username = {member.roster_id: username for username, member in members_data.items()}
+    print("\n📊 Standings:")
+    for rank, (roster_id, row) in enumerate(matchup_store.standings().items(), 1):
+        name = roster_to_username.get(roster_id, f"Roster {roster_id}")
+        print(f"{rank:2d}. {name:20s} {row['wins']}-{row['losses']}-{row['ties']}  "
+              f"PF {row['points_for']:8.1f}  PA {row['points_against']:8.1f}  "
+              f"Median {row['median_wins']}-{row['median_losses']}  Luck {row['luck']:+.1f}")
 
-def fetch_rosters(league_id):
-    url = f"https://api.sleeper.app/v1/league/{league_id}/rosters"
-    response = requests.get(url)
+def fetch_rosters(league_id, client=None):
+    client = client or get_client()
+    response = client.get(f"/league/{league_id}/rosters")
 
     if response.status_code == 200:
-        roster_data = response.json()
-        return [
-            Roster(
-                roster_id=roster["roster_id"],
-                owner_id=roster["owner_id"],
-                league_id=roster["league_id"],
-                metadata=roster.get("metadata", {}),
-                players=roster.get("players", []),
-                starters=roster.get("starters", []),
-                reserve=roster.get("reserve", []),
-                settings=roster.get("settings", {})
-            )
-            for roster in roster_data
-        ]
+        from models.decoding import decode_rosters
+
+        return decode_rosters(response.content)
     else:
         print(f"Failed to fetch rosters. Status Code: {response.status_code}")
         return []
     
 def web_scrape():
-    # URL of the webpage
-    url = "https://www.fantasypros.com/nba/adp/overall.php"
-
-    # Send a request to fetch the HTML content
-    headers = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/110.0.0.0 Safari/537.36"
-    }
-    response = requests.get(url, headers=headers)
-
-    # Parse the HTML using BeautifulSoup
-    soup = BeautifulSoup(response.text, "html.parser")
-
-    # Find the table containing the ADP data
-    table = soup.find("table", {"id": "data"})  # Looking for table with the data
+    """Prints today's FantasyPros ADP, scraped at most once a day into the season store."""
+    from draft_value import adp_snapshot
+    from season_store import SeasonStore
 
-    # Extract player names and ADP
-    players = []
-    adp_values = []
+    with SeasonStore() as store:
+        _, rows = adp_snapshot(store)
 
-    if table:
-        rows = table.find_all("tr")[1:]  # Skip header row
+    for row in rows:
+        print(f"{row['name']}: {row['adp']}")
 
-        for row in rows:
-            cols = row.find_all("td")
-            if len(cols) >= 3:  # Ensure we have enough columns
-                player_name = cols[1].text.strip()
-                adp = cols[2].text.strip()
-                players.append(player_name)
-                adp_values.append(adp)
 
-    # Print results
-    for name, adp in zip(players, adp_values):
-        print(f"{name}: {adp}")
-
-
-def main():
+def main(argv=None):
     """Main function that runs the script."""
-
-    rosters = fetch_rosters(LEAGUE_ID)
-    league_members_data = fetch_league_members(league_members, rosters)
-    draft_picks_dict = fetch_draft_picks(DRAFT_ID)
+    parser = argparse.ArgumentParser(description="League overview: members, standings and draft picks")
+    parser.add_argument('--league-id', type=str, default=LEAGUE_ID, help='Sleeper league ID')
+    parser.add_argument('--draft-id', type=str, default=DRAFT_ID, help='Sleeper draft ID')
+    parser.add_argument('--no-adp', action='store_true', help='Skip scraping FantasyPros ADP')
+    args = parser.parse_args(argv)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    client = SleeperClient(max_concurrency=MAX_CONCURRENCY)
+
+    # Rosters, users and draft picks are independent, so fetch them all at once
+    with metrics.stage('fetch.league') as timing, ThreadPoolExecutor(max_workers=3) as stages:
+        rosters_future = stages.submit(fetch_rosters, args.league_id, client)
+        members_future = stages.submit(fetch_member_data, league_members, client)
+        picks_future = stages.submit(fetch_draft_picks, args.draft_id, client)
+        timing['picks'] = len(picks_future.result())
+
+    rosters = rosters_future.result()
+    league_members_data = enrich_member_data(members_future.result(), rosters)
+    draft_picks_dict = picks_future.result()
     user_draft_picks = match_users_to_draft_picks(league_members_data, draft_picks_dict)
-    fetch_matchups(LEAGUE_ID)
+    with metrics.stage('fetch.matchups') as timing:
+        matchup_store = fetch_matchups(args.league_id, client=client)
+        timing['weeks'] = len(matchup_store.played_weeks)
+    print_standings(matchup_store, league_members_data)
     print_league_members(league_members_data)
-    web_scrape()
+    if not args.no_adp:
+        web_scrape()
 
 
 def print_league_members(members_data):
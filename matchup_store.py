@@ -0,0 +1,161 @@
+from sleeper_client import get_client
+
+MAX_WEEKS = 25
+
+
+def week_played(matchups):
+    """True once any roster has scored; Sleeper returns future weeks as matchups with 0 points."""
+    return any((m.get('points') or 0) > 0 for m in matchups)
+
+
+def current_week(client=None):
+    """The NBA week Sleeper is currently scoring, from /state/nba."""
+    client = client or get_client()
+    response = client.get("/state/nba")
+    response.raise_for_status()
+    state = response.json()
+    return int(state.get('display_week') or state['week'])
+
+
+def fetch_season_matchups(league_id, weeks=None, client=None):
+    """Fetches every week's matchups concurrently; returns [(week, matchups)] for weeks with data."""
+    client = client or get_client()
+    weeks = list(weeks or range(1, MAX_WEEKS + 1))
+    responses = client.get_many(f"/league/{league_id}/matchups/{week}" for week in weeks)
+    season = []
+    for week, response in zip(weeks, responses):
+        matchups = response.json() if response.status_code == 200 else None
+        if matchups:
+            season.append((week, matchups))
+    return season
+
+
+class MatchupStore:
+    """A season of matchups as dense arrays indexed [week, roster] and [week, roster, player].
+
+    Season metrics are reductions over these arrays, so they cost the same handful of NumPy
+    calls whether the league has 8 rosters or 16 and the season 5 weeks or 25.
+    """
+
+    def __init__(self, weeks, roster_ids, player_ids, points, matchup_ids, player_points, starters):
+        self.weeks = weeks  # week numbers, one per row
+        self.roster_ids = roster_ids
+        self.player_ids = player_ids
+        self.points = points  # float64 [week, roster]
+        self.matchup_ids = matchup_ids  # int32 [week, roster], -1 when the roster had no matchup
+        self.player_points = player_points  # float32 [week, roster, player]
+        self.starters = starters  # bool [week, roster, player]
+        self.roster_index = {roster_id: i for i, roster_id in enumerate(roster_ids)}
+        self.player_index = {player_id: i for i, player_id in enumerate(player_ids)}
+
+    @classmethod
+    def from_weeks(cls, season):
+        """Builds the store from [(week, matchups)] as returned by fetch_season_matchups."""
+        import numpy as np  # deferred so fetch_season_matchups callers do not pay for NumPy
+
+        season = sorted(season, key=lambda item: item[0])
+        roster_ids = sorted({m['roster_id'] for _, matchups in season for m in matchups})
+        player_ids = sorted({pid for _, matchups in season for m in matchups for pid in (m.get('players_points') or {})})
+        roster_index = {roster_id: i for i, roster_id in enumerate(roster_ids)}
+        player_index = {player_id: i for i, player_id in enumerate(player_ids)}
+
+        shape = (len(season), len(roster_ids))
+        points = np.zeros(shape)
+        matchup_ids = np.full(shape, -1, dtype=np.int32)
+        player_points = np.zeros(shape + (len(player_ids),), dtype=np.float32)
+        starters = np.zeros(shape + (len(player_ids),), dtype=bool)
+
+        for w, (_, matchups) in enumerate(season):
+            for m in matchups:
+                r = roster_index[m['roster_id']]
+                points[w, r] = m.get('points') or 0.0
+                if m.get('matchup_id') is not None:
+                    matchup_ids[w, r] = m['matchup_id']
+                scored = m.get('players_points') or {}
+                if scored:
+                    cols = [player_index[pid] for pid in scored]
+                    player_points[w, r, cols] = list(scored.values())
+                cols = [player_index[pid] for pid in (m.get('starters') or ()) if pid in player_index]
+                starters[w, r, cols] = True
+
+        return cls([week for week, _ in season], roster_ids, player_ids, points, matchup_ids, player_points, starters)
+
+    @property
+    def played(self):
+        """bool [week]: weeks where any roster has scored, as week_played() decides for one week."""
+        return (self.points > 0).any(axis=1)
+
+    @property
+    def played_weeks(self):
+        return [week for week, played in zip(self.weeks, self.played) if played]
+
+    def opponent_points(self):
+        """float [week, roster]: points scored against each roster, NaN when it had no opponent."""
+        import numpy as np
+
+        same = (self.matchup_ids[:, :, None] == self.matchup_ids[:, None, :]) & (self.matchup_ids[:, :, None] >= 0)
+        same &= ~np.eye(len(self.roster_ids), dtype=bool)
+        has_opponent = same.any(axis=2)
+        opponent = same.argmax(axis=2)
+        against = np.take_along_axis(self.points, opponent, axis=1)
+        return np.where(has_opponent, against, np.nan)
+
+    def standings(self):
+        """Per-roster season totals as {roster_id: dict}, sorted by wins then points for."""
+        import numpy as np
+
+        played = self.played
+        points = self.points[played]
+        against = self.opponent_points()[played]
+        decided = ~np.isnan(against)
+        wins = ((points > against) & decided).sum(axis=0)
+        losses = ((points < against) & decided).sum(axis=0)
+        ties = ((points == against) & decided).sum(axis=0)
+
+        # Median record: one extra win or loss each week against the league's median score
+        median = np.median(points, axis=1, keepdims=True) if len(points) else np.zeros((0, 1))
+        median_wins = (points > median).sum(axis=0)
+        median_losses = (points < median).sum(axis=0)
+
+        # All-play: how many rosters each one outscored every week; its share is the expected win rate
+        others = max(len(self.roster_ids) - 1, 1)
+        all_play_wins = (points[:, :, None] > points[:, None, :]).sum(axis=2)
+        all_play_losses = (points[:, :, None] < points[:, None, :]).sum(axis=2)
+        expected_wins = (all_play_wins / others * decided).sum(axis=0)
+
+        table = {
+            roster_id: {
+                'wins': int(wins[r]),
+                'losses': int(losses[r]),
+                'ties': int(ties[r]),
+                'points_for': float(points[:, r].sum()),
+                'points_against': float(np.nansum(against[:, r])),
+                'median_wins': int(median_wins[r]),
+                'median_losses': int(median_losses[r]),
+                'all_play_wins': int(all_play_wins[:, r].sum()),
+                'all_play_losses': int(all_play_losses[:, r].sum()),
+                'expected_wins': float(expected_wins[r]),
+                'luck': float(wins[r] - expected_wins[r]),
+            }
+            for r, roster_id in enumerate(self.roster_ids)
+        }
+        return dict(sorted(table.items(), key=lambda item: (-item[1]['wins'], -item[1]['points_for'])))
+
+    def bench_points(self):
+        """float [week, roster]: points left on the bench."""
+        return (self.player_points * ~self.starters).sum(axis=2)
+
+    def player_totals(self, roster_id=None):
+        """{player_id: season points}, for one roster or across the league."""
+        pts = self.player_points[self.played]
+        if roster_id is not None:
+            pts = pts[:, self.roster_index[roster_id]]
+        totals = pts.reshape(-1, len(self.player_ids)).sum(axis=0)
+        return {pid: float(totals[i]) for i, pid in enumerate(self.player_ids) if totals[i]}
+
+    def player_averages(self):
+        """{player_id: average points per played week}, counting only weeks the player scored."""
+        pts = self.player_points[self.played].reshape(-1, len(self.player_ids))
+        totals = pts.sum(axis=0)
+        weeks = (pts != 0).sum(axis=0)
+        return {pid: float(totals[i] / weeks[i]) for i, pid in enumerate(self.player_ids) if weeks[i]}
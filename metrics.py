@@ -0,0 +1,97 @@
+"""Stage timers, counters and byte sizes, emitted as JSON lines.
+
+    with metrics.stage('parse.box_scores') as s:
+        rows = parse(page)
+        s['rows'] = len(rows)
+    metrics.count('http.retries')
+
+Each finished stage is written as one line, e.g.
+{"event": "stage", "stage": "parse.box_scores", "seconds": 0.0031, "rows": 254, "ts": ...}, and
+flush() writes the run's counter totals. Nothing is written until configure() is given a path
+('-' for stderr) or BALLKNOWERS_METRICS is set, and when disabled a stage costs two clock reads.
+"""
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+_lock = threading.Lock()
+_counters = Counter()
+_sink = None
+_flushed = None
+
+
+def configure(path):
+    """Starts emitting to path (appending), or to stderr for '-'; None turns emitting off."""
+    global _sink
+    with _lock:
+        if _sink not in (None, sys.stderr):
+            _sink.close()
+        if path is None:
+            _sink = None
+        elif path == '-':
+            _sink = sys.stderr
+        else:
+            _sink = open(path, 'a', buffering=1, encoding='utf-8')
+
+
+def enabled():
+    return _sink is not None
+
+
+def emit(event, **fields):
+    if _sink is None:
+        return
+    line = json.dumps({'event': event, **fields, 'ts': round(time.time(), 3)}, default=str)
+    with _lock:
+        _sink.write(line + '\n')
+
+
+@contextmanager
+def stage(name, **fields):
+    """Times the block and emits it as a stage; the yielded dict adds fields (row counts, bytes...)."""
+    start = time.perf_counter()
+    error = None
+    try:
+        yield fields
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            error = f"SystemExit({e.code})"
+        raise
+    except BaseException as e:
+        error = type(e).__name__
+        raise
+    finally:
+        if _sink is not None:
+            if error:
+                fields['error'] = error
+            emit('stage', stage=name, seconds=round(time.perf_counter() - start, 6), thread=threading.current_thread().name,
+                 **fields)
+
+
+def count(name, n=1):
+    with _lock:
+        _counters[name] += n
+
+
+def counters():
+    with _lock:
+        return dict(_counters)
+
+
+def flush():
+    """Emits the counter totals so far (also done at exit), unless they are unchanged since the last flush."""
+    global _flushed
+    totals = counters()
+    if _sink is not None and totals and totals != _flushed:
+        _flushed = totals
+        emit('counters', **totals)
+
+
+atexit.register(flush)
+if os.environ.get('BALLKNOWERS_METRICS'):
+    configure(os.environ['BALLKNOWERS_METRICS'])
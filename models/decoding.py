@@ -0,0 +1,69 @@
+"""Builds the slotted models straight from Sleeper response bytes.
+
+Unknown keys in the payload are ignored and missing ones default to None, so new Sleeper fields
+do not break decoding the way DraftPick(**pick) would.
+"""
+import json
+
+try:
+    import orjson
+    loads = orjson.loads
+except ImportError:  # orjson is optional; the stdlib parser gives the same result, only slower
+    loads = json.loads
+
+from models.draft_pick import DraftPick, PlayerMetadata
+from models.matchup import Matchup
+from models.roster import Roster
+
+
+def _new(cls, data, fields):
+    """Creates cls without running __init__ and fills its slots from data."""
+    obj = cls.__new__(cls)
+    get = data.get
+    for field in fields:
+        setattr(obj, field, get(field))
+    return obj
+
+
+def _metadata(data):
+    return _new(PlayerMetadata, data or {}, PlayerMetadata.__slots__)
+
+
+_PICK_FIELDS = tuple(f for f in DraftPick.__slots__ if f != 'metadata')
+
+
+def decode_draft_picks(payload):
+    """Decodes /draft/<id>/picks into {pick_no: DraftPick}."""
+    picks = {}
+    for pick in loads(payload):
+        draft_pick = _new(DraftPick, pick, _PICK_FIELDS)
+        draft_pick.metadata = _metadata(pick.get('metadata'))
+        picks[draft_pick.pick_no] = draft_pick
+    return picks
+
+
+def decode_rosters(payload):
+    """Decodes /league/<id>/rosters into a list of Roster."""
+    rosters = []
+    for data in loads(payload):
+        roster = _new(Roster, data, Roster.__slots__)
+        roster.metadata = roster.metadata or {}
+        roster.players = roster.players or []
+        roster.starters = roster.starters or []
+        roster.reserve = roster.reserve or []
+        roster.settings = roster.settings or {}
+        rosters.append(roster)
+    return rosters
+
+
+_MATCHUP_FIELDS = tuple(f for f in Matchup.__slots__ if f != 'players_id')
+
+
+def decode_matchups(payload):
+    """Decodes /league/<id>/matchups/<week> into a list of Matchup."""
+    matchups = []
+    for data in loads(payload):
+        matchup = _new(Matchup, data, _MATCHUP_FIELDS)
+        matchup.players_id = data.get('players')
+        matchups.append(matchup)
+    return matchups
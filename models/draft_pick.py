@@ -1,4 +1,6 @@
 class PlayerMetadata:
+    __slots__ = ('first_name', 'last_name', 'injury_status', 'news_updated', 'number', 'player_id', 'position', 'sport', 'status', 'team', 'team_abbr', 'team_changed_at', 'years_exp')
+
     def __init__(self, first_name, last_name, injury_status, news_updated, number, player_id, position, sport, status, team, team_abbr, team_changed_at, years_exp):
         self.first_name = first_name
         self.last_name = last_name
@@ -18,6 +20,8 @@ class PlayerMetadata:
         return f"{self.first_name} {self.last_name} ({self.team})"
 
 class DraftPick:
+    __slots__ = ('draft_id', 'draft_slot', 'is_keeper', 'metadata', 'pick_no', 'picked_by', 'player_id', 'reactions', 'roster_id', 'round')
+
     def __init__(self, draft_id, draft_slot, is_keeper, metadata, pick_no, picked_by, player_id, reactions, roster_id, round):
         self.draft_id = draft_id
         self.draft_slot = draft_slot
@@ -35,33 +39,34 @@ class DraftPick:
 
 
     
-# Example Usage:
-draft_data = {
-    "draft_id": "1141438341108498432",
-    "draft_slot": 1,
-    "is_keeper": None,
-    "metadata": {
-        "first_name": "Victor",
-        "injury_status": "DTD",
-        "last_name": "Wembanyama",
-        "news_updated": "1728750357037",
-        "number": "1",
+if __name__ == "__main__":
+    # Example Usage:
+    draft_data = {
+        "draft_id": "1141438341108498432",
+        "draft_slot": 1,
+        "is_keeper": None,
+        "metadata": {
+            "first_name": "Victor",
+            "injury_status": "DTD",
+            "last_name": "Wembanyama",
+            "news_updated": "1728750357037",
+            "number": "1",
+            "player_id": "2577",
+            "position": "C",
+            "sport": "nba",
+            "status": "ACT",
+            "team": "SAS",
+            "team_abbr": "",
+            "team_changed_at": "",
+            "years_exp": "1"
+        },
+        "pick_no": 1,
+        "picked_by": "1130198569467789312",
         "player_id": "2577",
-        "position": "C",
-        "sport": "nba",
-        "status": "ACT",
-        "team": "SAS",
-        "team_abbr": "",
-        "team_changed_at": "",
-        "years_exp": "1"
-    },
-    "pick_no": 1,
-    "picked_by": "1130198569467789312",
-    "player_id": "2577",
-    "reactions": None,
-    "roster_id": 7,
-    "round": 1
-}
+        "reactions": None,
+        "roster_id": 7,
+        "round": 1
+    }
 
-# Create an instance of the class
-draft_pick = DraftPick(**draft_data)
+    # Create an instance of the class
+    draft_pick = DraftPick(**draft_data)
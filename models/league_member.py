@@ -1,4 +1,6 @@
 class LeagueMember:
+    __slots__ = ('username', 'user_id', 'avatar', 'display_name', 'is_bot', 'roster_id')
+
     def __init__(self, username, user_id, avatar, display_name, is_bot, roster_id):
         self.username = username
         self.user_id = user_id
@@ -1,4 +1,6 @@
 class Roster:
+    __slots__ = ('roster_id', 'owner_id', 'league_id', 'metadata', 'players', 'starters', 'reserve', 'settings')
+
     def __init__(self, roster_id, owner_id, league_id, metadata, players, starters, reserve, settings):
         self.roster_id = roster_id
         self.owner_id = owner_id
@@ -1,4 +1,6 @@
 class UserDraftPick:
+    __slots__ = ('pick_no', 'username', 'draft_pick')
+
     def __init__(self, pick_no, username, draft_pick):
         self.pick_no = pick_no
         self.username = username
@@ -0,0 +1,137 @@
+import json
+import os
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+
+
+def normalize_name(name):
+    suffixes = [' Jr.', ' Sr.', ' II', ' III', ' IV', ' V', ' Jr', ' Sr', '.']
+    for suffix in suffixes:
+        if name.endswith(suffix):
+            name = name[:-len(suffix)].strip()
+    return name
+
+
+def name_key(name):
+    """Lowercased, suffix-stripped name used as the join key between data sources."""
+    return normalize_name(name).lower()
+
+
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """Maps normalized names to records, with a trigram index for fuzzy fallback.
+
+    Exact lookups are a dict hit. Fuzzy lookups only score the few names that share the
+    most trigrams with the query, instead of running difflib over every name.
+    """
+
+    def __init__(self, records=(), name=lambda record: record['name']):
+        self.name_of = name
+        self._by_key = {}
+        self._by_trigram = defaultdict(set)
+        for record in records:
+            self.add(record)
+
+    def add(self, record):
+        key = name_key(self.name_of(record))
+        if key not in self._by_key:
+            for gram in trigrams(key):
+                self._by_trigram[gram].add(key)
+        self._by_key.setdefault(key, []).append(record)
+
+    def __len__(self):
+        return len(self._by_key)
+
+    def get(self, name):
+        """Returns the first record whose normalized name matches exactly, or None."""
+        records = self._by_key.get(name_key(name))
+        return records[0] if records else None
+
+    def closest_key(self, name, cutoff=0.75, candidates=5):
+        """Returns the best fuzzy-matching key with a difflib ratio of at least cutoff, or None."""
+        return self.closest(name, cutoff, candidates)[0]
+
+    def closest(self, name, cutoff=0.75, candidates=5):
+        """(key, difflib ratio) of the best match at or above cutoff, or (None, 0.0); an exact key scores 1.0."""
+        key = name_key(name)
+        if key in self._by_key:
+            return key, 1.0
+        shared = Counter()
+        for gram in trigrams(key):
+            shared.update(self._by_trigram.get(gram, ()))
+        best_key, best_ratio = None, cutoff
+        matcher = SequenceMatcher(b=key)
+        for candidate, _ in shared.most_common(candidates):
+            matcher.set_seq1(candidate)
+            ratio = matcher.ratio()
+            if ratio >= best_ratio:
+                best_key, best_ratio = candidate, ratio
+        return best_key, (best_ratio if best_key else 0.0)
+
+    def match(self, name, cutoff=0.75):
+        """Exact lookup with fuzzy fallback; returns a record or None."""
+        key = self.closest_key(name, cutoff)
+        return self._by_key[key][0] if key else None
+
+
+CROSSWALK_PATH = os.path.join('.cache', 'name_crosswalk.json')
+LEARN_RATIO = 0.95  # fuzzy matches below this are used for the day but not remembered
+
+
+class Crosswalk:
+    """Persisted Sleeper player_id -> Basketball-Reference name mapping learned from past matches."""
+
+    def __init__(self, path=CROSSWALK_PATH):
+        self.path = path
+        self.names = {}
+        self._dirty = False
+        try:
+            with open(path, 'r') as f:
+                self.names = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def get(self, player_id):
+        return self.names.get(str(player_id))
+
+    def learn(self, player_id, name):
+        if self.names.get(str(player_id)) != name:
+            self.names[str(player_id)] = name
+            self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.names, f, indent=4, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def resolve(self, index, player_id, sleeper_name, cutoff=0.75, learn_ratio=LEARN_RATIO):
+        """Finds player_id's record in a NameIndex: exact name first, then the crosswalk, then fuzzy.
+
+        An exact match always wins, so a remembered guess can never shadow the right player
+        (Jalen vs Jaylin Williams). Only exact and near-certain fuzzy matches are learned.
+        """
+        record = index.get(sleeper_name)
+        if record is not None:
+            self.learn(player_id, index.name_of(record))
+            return record
+        known = self.get(player_id)
+        if known:
+            record = index.get(known)
+            if record is not None:
+                return record
+        key, ratio = index.closest(sleeper_name, cutoff)
+        if key is None:
+            return None
+        record = index.get(key)
+        if ratio >= learn_ratio:
+            self.learn(player_id, index.name_of(record))
+        return record
@@ -0,0 +1,236 @@
+import bisect
+import json
+import os
+from collections import defaultdict
+
+from matchup_store import current_week
+from sleeper_client import get_client
+
+OWNERSHIP_PATH = os.path.join('.cache', 'ownership_{league_id}.json')
+
+
+class _Intervals:
+    """Sorted, non-overlapping [start, end) week intervals with running totals for O(log n) sums."""
+    __slots__ = ('starts', 'ends', 'rosters', 'prefix')
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.rosters = []
+        self.prefix = [0]  # prefix[i] = total weeks of the first i intervals
+
+    def append(self, start, end, roster_id):
+        self.starts.append(start)
+        self.ends.append(end)
+        self.rosters.append(roster_id)
+        self.prefix.append(self.prefix[-1] + end - start)
+
+    def find(self, week):
+        """Index of the interval containing week, or None."""
+        i = bisect.bisect_right(self.starts, week) - 1
+        if i >= 0 and week < self.ends[i]:
+            return i
+        return None
+
+    def total(self, through_week=None):
+        """Weeks covered up to and including through_week (all weeks if None)."""
+        if through_week is None:
+            return self.prefix[-1]
+        # Intervals ending by through_week count fully; at most one more is cut off part way
+        i = bisect.bisect_right(self.ends, through_week + 1)
+        total = self.prefix[i]
+        if i < len(self.starts) and self.starts[i] <= through_week:
+            total += through_week + 1 - self.starts[i]
+        return total
+
+
+class OwnershipIndex:
+    """Maps each player_id to the sorted (roster_id, start_week, end_week) intervals it was rostered.
+
+    Weeks are half-open: a player added in week 5 and dropped in week 9 was held in weeks 5-8.
+    Players still rostered have an open interval. Updates must arrive in week order, which keeps
+    every interval list sorted by appending, so lookups stay O(log n) as weeks are added.
+
+    complete_week is the last week whose transactions are final. Later weeks may be applied
+    again as more transactions arrive; transactions already applied are skipped by their id.
+    """
+
+    def __init__(self):
+        self._open = {}  # player_id -> (roster_id, start_week)
+        self._closed = defaultdict(_Intervals)  # player_id -> intervals
+        self._by_holder = defaultdict(_Intervals)  # (player_id, roster_id) -> intervals
+        self.last_week = 0
+        self.complete_week = 0
+        self._applied = {}  # transaction_id -> week, for weeks after complete_week
+
+    def _close(self, player_id, week):
+        roster_id, start = self._open.pop(player_id)
+        if week > start:
+            self._closed[player_id].append(start, week, roster_id)
+            self._by_holder[(player_id, roster_id)].append(start, week, roster_id)
+
+    def add(self, player_id, roster_id, week):
+        player_id = str(player_id)
+        current = self._open.get(player_id)
+        if current and current[0] == roster_id:
+            return
+        if current:
+            self._close(player_id, week)
+        self._open[player_id] = (roster_id, week)
+        self.last_week = max(self.last_week, week)
+
+    def drop(self, player_id, roster_id, week):
+        player_id = str(player_id)
+        current = self._open.get(player_id)
+        if current and current[0] == roster_id:
+            self._close(player_id, week)
+        self.last_week = max(self.last_week, week)
+
+    def apply_transactions(self, week, transactions):
+        """Applies one week of Sleeper /transactions/<week> results in the order they happened.
+
+        Transactions already applied are skipped, so a week still in progress can be applied again.
+        """
+        for txn in sorted(transactions, key=lambda t: t.get('status_updated') or t.get('created') or 0):
+            if txn.get('status') != 'complete' or txn.get('transaction_id') in self._applied:
+                continue
+            if txn.get('transaction_id'):
+                self._applied[txn['transaction_id']] = week
+            for player_id, roster_id in (txn.get('drops') or {}).items():
+                self.drop(player_id, roster_id, week)
+            for player_id, roster_id in (txn.get('adds') or {}).items():
+                self.add(player_id, roster_id, week)
+
+    def complete(self, week):
+        """Marks week's transactions as final; its transaction ids are no longer needed."""
+        self.complete_week = max(self.complete_week, week)
+        self._applied = {txn_id: w for txn_id, w in self._applied.items() if w > self.complete_week}
+
+    def apply_snapshot(self, week, rosters):
+        """Reconciles the index with {roster_id: player_ids} as of week (a roster or matchup snapshot)."""
+        owners = {str(pid): roster_id for roster_id, players in rosters.items() for pid in players or ()}
+        for player_id in [pid for pid in self._open if pid not in owners]:
+            self._close(player_id, week)
+        for player_id, roster_id in owners.items():
+            self.add(player_id, roster_id, week)
+
+    def intervals(self, player_id):
+        """[(roster_id, start_week, end_week)] sorted by start; end_week is None while still rostered."""
+        player_id = str(player_id)
+        closed = self._closed.get(player_id)
+        result = list(zip(closed.rosters, closed.starts, closed.ends)) if closed else []
+        if player_id in self._open:
+            roster_id, start = self._open[player_id]
+            result.append((roster_id, start, None))
+        return result
+
+    def owner_at(self, player_id, week):
+        """roster_id holding player_id during week, or None."""
+        player_id = str(player_id)
+        current = self._open.get(player_id)
+        if current and current[1] <= week:
+            return current[0]
+        closed = self._closed.get(player_id)
+        i = closed.find(week) if closed else None
+        return closed.rosters[i] if i is not None else None
+
+    def weeks_held(self, player_id, roster_id=None, through_week=None):
+        """Weeks player_id was rostered (by roster_id, if given) up to and including through_week."""
+        player_id = str(player_id)
+        through = self.last_week if through_week is None else through_week
+        intervals = self._closed.get(player_id) if roster_id is None else self._by_holder.get((player_id, roster_id))
+        total = intervals.total(through) if intervals else 0
+        current = self._open.get(player_id)
+        if current and (roster_id is None or current[0] == roster_id) and current[1] <= through:
+            total += through + 1 - current[1]
+        return total
+
+    def longest_holder(self, player_id, through_week=None):
+        """(roster_id, weeks) for whoever rostered player_id the longest, or None."""
+        rosters = {roster_id for roster_id, _, _ in self.intervals(player_id)}
+        if not rosters:
+            return None
+        return max(((r, self.weeks_held(player_id, r, through_week)) for r in rosters), key=lambda item: item[1])
+
+    def to_dict(self):
+        return {
+            'last_week': self.last_week,
+            'complete_week': self.complete_week,
+            'applied': self._applied,
+            'open': self._open,
+            'closed': {pid: list(zip(iv.starts, iv.ends, iv.rosters)) for pid, iv in self._closed.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        index = cls()
+        index.last_week = data['last_week']
+        index.complete_week = data.get('complete_week', index.last_week)
+        index._applied = data.get('applied', {})
+        index._open = {pid: tuple(value) for pid, value in data['open'].items()}
+        for pid, intervals in data['closed'].items():
+            for start, end, roster_id in intervals:
+                index._closed[pid].append(start, end, roster_id)
+                index._by_holder[(pid, roster_id)].append(start, end, roster_id)
+        return index
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path, 'r') as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError):
+            return cls()
+
+
+def update_from_league(index, league_id, through_week=None, client=None):
+    """Brings index up to through_week (default and at most Sleeper's current week), fetching only weeks not yet final.
+
+    Week 1's matchup rosters seed the index; every week applies that week's transactions.
+    complete_week only advances past weeks that were fetched successfully and have ended, so a
+    failed week, or the week in progress, is fetched again on the next run.
+    """
+    client = client or get_client()
+    current = current_week(client)
+    through_week = min(through_week or current, current)
+    weeks = list(range(index.complete_week + 1, through_week + 1))
+    if not weeks:
+        return index
+    if index.last_week == 0:
+        response = client.get(f"/league/{league_id}/matchups/1")
+        if response.status_code == 200:
+            index.apply_snapshot(1, {m['roster_id']: m.get('players') for m in response.json()})
+    responses = client.get_many(f"/league/{league_id}/transactions/{week}" for week in weeks)
+    for week, response in zip(weeks, responses):
+        if response.status_code != 200:
+            print(f"⚠️  Transactions for week {week} returned status {response.status_code}, stopping at week {week - 1}")
+            break
+        index.apply_transactions(week, response.json())
+        index.last_week = max(index.last_week, week)
+        if week < current:
+            index.complete(week)
+    return index
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Who rostered a player, and for how long")
+    parser.add_argument('league_id', help='Sleeper league ID')
+    parser.add_argument('player_id', help='Sleeper player_id')
+    parser.add_argument('--through-week', type=int, help="Last week to ingest (default: Sleeper's current week)")
+    args = parser.parse_args()
+
+    path = OWNERSHIP_PATH.format(league_id=args.league_id)
+    index = update_from_league(OwnershipIndex.load(path), args.league_id, args.through_week)
+    index.save(path)
+    for roster_id, start, end in index.intervals(args.player_id):
+        print(f"Roster {roster_id}: week {start} - {end - 1 if end else 'now'}")
+    holder = index.longest_holder(args.player_id)
+    if holder:
+        print(f"\nLongest hold: Roster {holder[0]} ({holder[1]} weeks)")
@@ -0,0 +1,120 @@
+import json
+import os
+import time
+from functools import lru_cache
+
+import metrics
+from sleeper_client import get_client
+
+PLAYERS_PATH = "/players/nba"
+CACHE_DIR = ".cache"
+DEFAULT_TTL = 24 * 60 * 60  # Sleeper asks callers to pull the player dump at most once a day
+
+
+def cache_paths(cache_dir):
+    return (os.path.join(cache_dir, "players_nba.json"),
+            os.path.join(cache_dir, "players_nba.meta.json"))
+
+
+def read_meta(meta_path):
+    try:
+        with open(meta_path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _write_meta(meta_path, meta):
+    _write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+
+
+@lru_cache(maxsize=4)
+def _parse_payload(data_path, mtime_ns):
+    """Parses the cached dump once per file version; repeat loads in-process are free."""
+    with open(data_path, "rb") as f:
+        return json.loads(f.read())
+
+
+def _load_from_disk(data_path):
+    return _parse_payload(data_path, os.stat(data_path).st_mtime_ns)
+
+
+def refresh_players(cache_dir=CACHE_DIR, client=None):
+    """Revalidates the cached dump with ETag/Last-Modified, downloading only when it changed.
+
+    Returns True if a new payload was written, False if the server answered 304.
+    """
+    client = client or get_client()
+    data_path, meta_path = cache_paths(cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    meta = read_meta(meta_path) if os.path.exists(data_path) else {}
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    with metrics.stage('fetch.players_dump') as timing:
+        response = client.get(PLAYERS_PATH, headers=headers, timeout=30)
+        timing['status'] = response.status_code
+        timing['bytes'] = len(response.content)
+    if response.status_code == 304:
+        metrics.count('cache.players.revalidated')
+        meta["fetched_at"] = time.time()
+        _write_meta(meta_path, meta)
+        return False
+
+    response.raise_for_status()
+    metrics.count('cache.players.downloaded')
+    _write_atomic(data_path, response.content)
+    lookup_player.cache_clear()
+    _write_meta(meta_path, {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "fetched_at": time.time(),
+        "size": len(response.content),
+    })
+    return True
+
+
+def load_players(ttl=DEFAULT_TTL, cache_dir=CACHE_DIR, client=None, force_refresh=False):
+    """Returns the Sleeper /players/nba dump, reusing the on-disk copy while it is younger than ttl."""
+    data_path, meta_path = cache_paths(cache_dir)
+    meta = read_meta(meta_path)
+    age = time.time() - meta.get("fetched_at", 0)
+
+    if force_refresh or not os.path.exists(data_path) or age >= ttl:
+        metrics.count('cache.players.miss')
+        try:
+            refresh_players(cache_dir, client)
+        except Exception as e:
+            if not os.path.exists(data_path):
+                raise
+            print(f"⚠️  Could not refresh player dump ({e}), using cached copy from {age / 3600:.1f}h ago")
+    else:
+        metrics.count('cache.players.hit')
+
+    return _load_from_disk(data_path)
+
+
+@lru_cache(maxsize=8192)
+def lookup_player(player_id, cache_dir=CACHE_DIR):
+    """Returns the cached player record for a Sleeper player_id, or None."""
+    data_path, _ = cache_paths(cache_dir)
+    info = _load_from_disk(data_path).get(player_id)
+    return info if isinstance(info, dict) else None
+
+
+def id_to_name(ttl=DEFAULT_TTL, cache_dir=CACHE_DIR, client=None):
+    """Maps Sleeper player_id to full_name using the cached dump."""
+    players = load_players(ttl, cache_dir, client)
+    return {pid: info["full_name"] for pid, info in players.items()
+            if isinstance(info, dict) and "full_name" in info}
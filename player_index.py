@@ -0,0 +1,190 @@
+import mmap
+import os
+import struct
+import time
+import zlib
+from array import array
+from collections import namedtuple
+
+import player_cache
+from names import name_key
+
+# On-disk layout (native byte order, every section 4-byte aligned):
+#   header      MAGIC, version, column count, row count, hash table size
+#   directory   (offsets_pos, blob_pos) per column, then id_table_pos, name_table_pos
+#   columns     uint32 offsets[rows + 1] followed by a UTF-8 blob, one pair per column
+#   id_table    open-addressed uint32 row numbers keyed by player_id
+#   name_table  open-addressed uint32 row numbers keyed by normalized name
+MAGIC = b"BKPI"
+VERSION = 1
+HEADER = struct.Struct("=4sHHII")  # native order like the array columns, standard sizes, no padding
+EMPTY = 0xFFFFFFFF
+
+COLUMNS = ("player_id", "full_name", "name_key", "team", "position", "injury_status", "status")
+PlayerRecord = namedtuple("PlayerRecord", COLUMNS)
+
+INDEX_FILENAME = "players_nba.idx"
+
+
+def _slot(key, table_size):
+    return zlib.crc32(key.encode("utf-8")) & (table_size - 1)
+
+
+def _build_table(keys, table_size):
+    table = array("I", [EMPTY]) * table_size
+    for row, key in enumerate(keys):
+        if not key:
+            continue
+        slot = _slot(key, table_size)
+        while table[slot] != EMPTY:
+            slot = (slot + 1) & (table_size - 1)
+        table[slot] = row
+    return table
+
+
+def _pad(buf):
+    buf.extend(b"\0" * (-len(buf) % 4))
+
+
+def build_index(players, path):
+    """Writes a compact columnar index of a Sleeper /players/nba dump to path."""
+    rows = []
+    for pid, info in players.items():
+        if not isinstance(info, dict):
+            continue
+        full_name = info.get("full_name") or ""
+        rows.append((
+            str(pid),
+            full_name,
+            name_key(full_name) if full_name else "",
+            info.get("team") or "",
+            info.get("position") or "",
+            info.get("injury_status") or "",
+            info.get("status") or "",
+        ))
+
+    table_size = 1
+    while table_size < 2 * max(len(rows), 1):
+        table_size <<= 1
+
+    body = bytearray()
+    directory = []
+    header_len = HEADER.size + 4 * (2 * len(COLUMNS) + 2)
+    for col in range(len(COLUMNS)):
+        encoded = [row[col].encode("utf-8") for row in rows]
+        offsets = array("I", [0])
+        total = 0
+        for value in encoded:
+            total += len(value)
+            offsets.append(total)
+        offsets_pos = header_len + len(body)
+        body.extend(offsets.tobytes())
+        blob_pos = header_len + len(body)
+        body.extend(b"".join(encoded))
+        _pad(body)
+        directory.extend((offsets_pos, blob_pos))
+
+    id_table_pos = header_len + len(body)
+    body.extend(_build_table((row[0] for row in rows), table_size).tobytes())
+    name_table_pos = header_len + len(body)
+    body.extend(_build_table((row[2] for row in rows), table_size).tobytes())
+    directory.extend((id_table_pos, name_table_pos))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(COLUMNS), len(rows), table_size))
+        f.write(array("I", directory).tobytes())
+        f.write(body)
+    os.replace(tmp_path, path)
+    return len(rows)
+
+
+class PlayerIndex:
+    """Read-only, memory-mapped view of a player index file with O(1) lookups."""
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mm)
+        magic, version, ncols, self.size, self._table_size = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION or ncols != len(COLUMNS):
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} player index")
+
+        directory = view[HEADER.size:HEADER.size + 4 * (2 * ncols + 2)].cast("I")
+        self._columns = []
+        for col in range(ncols):
+            offsets_pos, blob_pos = directory[2 * col], directory[2 * col + 1]
+            offsets = view[offsets_pos:offsets_pos + 4 * (self.size + 1)].cast("I")
+            self._columns.append((offsets, blob_pos))
+        table_bytes = 4 * self._table_size
+        self._id_table = view[directory[-2]:directory[-2] + table_bytes].cast("I")
+        self._name_table = view[directory[-1]:directory[-1] + table_bytes].cast("I")
+
+    def __len__(self):
+        return self.size
+
+    def _value(self, col, row):
+        offsets, blob_pos = self._columns[col]
+        return self._mm[blob_pos + offsets[row]:blob_pos + offsets[row + 1]].decode("utf-8")
+
+    def _probe(self, table, col, key):
+        slot = _slot(key, self._table_size)
+        while True:
+            row = table[slot]
+            if row == EMPTY:
+                return
+            if self._value(col, row) == key:
+                yield row
+            slot = (slot + 1) & (self._table_size - 1)
+
+    def record(self, row):
+        return PlayerRecord(*(self._value(col, row) for col in range(len(COLUMNS))))
+
+    def get(self, player_id):
+        """Returns the PlayerRecord for a Sleeper player_id, or None."""
+        for row in self._probe(self._id_table, 0, str(player_id)):
+            return self.record(row)
+        return None
+
+    def __contains__(self, player_id):
+        return self.get(player_id) is not None
+
+    def name(self, player_id, default=None):
+        for row in self._probe(self._id_table, 0, str(player_id)):
+            return self._value(1, row)
+        return default
+
+    def find_by_name(self, name):
+        """Returns every PlayerRecord whose normalized name matches name."""
+        return [self.record(row) for row in self._probe(self._name_table, 2, name_key(name))]
+
+    def close(self):
+        self._id_table = self._name_table = self._columns = None
+        try:
+            self._mm.close()
+        except BufferError:
+            pass  # A caller still holds a slice; the map is released with it
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_index(ttl=player_cache.DEFAULT_TTL, cache_dir=player_cache.CACHE_DIR, client=None):
+    """Opens the player index, rebuilding it when the cached player dump is newer."""
+    index_path = os.path.join(cache_dir, INDEX_FILENAME)
+    data_path, meta_path = player_cache.cache_paths(cache_dir)
+    meta = player_cache.read_meta(meta_path)
+    dump_fresh = os.path.exists(data_path) and time.time() - meta.get("fetched_at", 0) < ttl
+
+    if dump_fresh and os.path.exists(index_path) and os.path.getmtime(index_path) >= os.path.getmtime(data_path):
+        return PlayerIndex(index_path)
+
+    players = player_cache.load_players(ttl, cache_dir, client)
+    if not os.path.exists(index_path) or os.path.getmtime(index_path) < os.path.getmtime(data_path):
+        build_index(players, index_path)
+    return PlayerIndex(index_path)
@@ -0,0 +1,308 @@
+"""Local read API over the stored results, for dashboards and bots: python ballknowers.py serve
+
+The season store's box scores and trending adds, the batch runner's league summaries and the
+draft report CSVs are loaded into memory once, with indexes built up front by player, team,
+date, league and roster, so a query is a dict lookup and a bisect. Encoded responses are cached
+per URL with an ETag, and an If-None-Match listing it (weak or strong) is answered with an
+empty 304.
+
+  GET /                                        what is loaded
+  GET /players/<name>?days=14                  a player's box scores over the last N stored days
+  GET /teams/<team>?days=14                    a team's box scores over the last N stored days
+  GET /dates/<YYYY-MM-DD>                      a day's box scores, best first, with trending adds
+  GET /leagues                                 leagues with a summary
+  GET /leagues/<id>/standings                  also /awards, /top-scorers and /members
+  GET /leagues/<id>/draft                      the league's draft picks
+  GET /leagues/<id>/rosters/<roster_id>        a roster's standing and draft picks
+
+"Last N days" counts back from the latest stored date, which is returned as as_of, and N must
+be between 1 and MAX_DAYS. Player names are matched like the trending report matches them:
+suffixes and case are ignored and near misses fall back to the closest name. The sources are
+checked for changes every RELOAD_INTERVAL seconds and reloaded when one changed.
+"""
+import argparse
+import bisect
+import csv
+import datetime
+import glob
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import metrics
+from names import NameIndex, name_key
+from season_store import STORE_PATH, SeasonStore
+
+DEFAULT_PORT = 8765
+DEFAULT_DAYS = 14
+MAX_DAYS = 366  # a full season and then some; larger windows return the same rows
+RELOAD_INTERVAL = 5.0
+MAX_CACHED_RESPONSES = 4096
+REPORTS_DIR = 'league_reports'  # league_batch.OUTPUT_DIR
+DRAFT_REPORTS = ('draft_report.csv', os.path.join(REPORTS_DIR, 'draft_report.csv'))
+LEAGUE_SECTIONS = {'standings': 'standings', 'awards': 'awards', 'top-scorers': 'top_scorers', 'members': 'members'}
+
+
+class DatedIndex:
+    """Rows grouped by key, each group in date order with a parallel list of dates to bisect."""
+
+    def __init__(self, rows, key):
+        self.rows = {}
+        for row in rows:
+            self.rows.setdefault(key(row), []).append(row)
+        self.dates = {k: [row['date'] for row in group] for k, group in self.rows.items()}
+
+    def __contains__(self, k):
+        return k in self.rows
+
+    def since(self, k, start):
+        """Rows for k dated start or later."""
+        return self.rows[k][bisect.bisect_left(self.dates[k], start):]
+
+
+class ReportData:
+    """An immutable in-memory snapshot of every source, with its indexes."""
+
+    def __init__(self, store_path=STORE_PATH, reports_dir=REPORTS_DIR, draft_paths=DRAFT_REPORTS):
+        box_scores, trending = [], []
+        if os.path.exists(store_path):  # SeasonStore would create an empty database
+            with SeasonStore(store_path) as store:
+                box_scores = store.read_box_scores()
+                trending = store.read_trending()
+        self.dates = sorted({row['date'] for row in box_scores})
+        self.as_of = self.dates[-1] if self.dates else None
+        self.by_player = DatedIndex(box_scores, lambda row: name_key(row['name']))
+        self.by_team = DatedIndex(box_scores, lambda row: (row['team'] or '').upper())
+        self.by_date = {}
+        for row in box_scores:
+            self.by_date.setdefault(row['date'], []).append(row)
+        for rows in self.by_date.values():
+            rows.sort(key=lambda row: -(row['fantasy_points'] or 0))
+        self.trending = {}
+        for row in trending:
+            self.trending.setdefault(row['date'], []).append({'player_id': row['player_id'], 'count': row['count']})
+        self.names = NameIndex(({'name': group[-1]['name']} for group in self.by_player.rows.values()))
+
+        self.leagues = {}
+        for path in sorted(glob.glob(os.path.join(reports_dir, '*.json'))):
+            with open(path, 'r') as f:
+                summary = json.load(f)
+            self.leagues[str(summary['league_id'])] = summary
+
+        self.drafts = {}
+        for path in draft_paths:
+            if os.path.exists(path):
+                self._load_draft(path)
+
+    def _load_draft(self, path):
+        from draft_report import LEAGUE_ID
+
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            for pick in csv.DictReader(f):
+                # Reports from before the league_id column were always for the default league
+                league_id = pick.get('league_id') or LEAGUE_ID
+                picks = self.drafts.setdefault(league_id, {})
+                picks[pick['pick_no']] = pick  # a pick in both CSVs is kept once, the newer copy winning
+
+    def draft(self, league_id, roster_id=None):
+        picks = sorted(self.drafts.get(league_id, {}).values(), key=lambda pick: int(pick['pick_no']))
+        if roster_id is not None:
+            picks = [pick for pick in picks if pick['roster_id'] == str(roster_id)]
+        return picks
+
+    def start_date(self, days):
+        as_of = datetime.date.fromisoformat(self.as_of)
+        return (as_of - datetime.timedelta(days=days - 1)).isoformat()
+
+    def player(self, name, days):
+        key = self.names.closest_key(name)
+        if key is None:
+            return None
+        rows = self.by_player.since(key, self.start_date(days))
+        return {'player': self.by_player.rows[key][-1]['name'], 'as_of': self.as_of, 'days': days,
+                'games': len(rows), 'fantasy_points': sum(row['fantasy_points'] or 0 for row in rows),
+                'box_scores': rows}
+
+    def team(self, team, days):
+        team = team.upper()
+        if team not in self.by_team:
+            return None
+        rows = self.by_team.since(team, self.start_date(days))
+        return {'team': team, 'as_of': self.as_of, 'days': days, 'box_scores': rows}
+
+
+def source_signature(store_path=STORE_PATH, reports_dir=REPORTS_DIR, draft_paths=DRAFT_REPORTS):
+    """(path, mtime, size) of every source file; a reload is due when it changes."""
+    paths = [store_path, store_path + '-wal', *draft_paths, *glob.glob(os.path.join(reports_dir, '*.json'))]
+    signature = []
+    for path in sorted(paths):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        signature.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def etag_matches(if_none_match, etag):
+    """Whether an If-None-Match header (a comma-separated list, possibly weak W/ tags, or *) covers etag."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in tags or etag in (tag[2:] if tag.startswith('W/') else tag for tag in tags)
+
+
+class ReadAPI:
+    """Routes GET requests to the current ReportData and caches encoded responses with their ETags."""
+
+    def __init__(self, store_path=STORE_PATH, reports_dir=REPORTS_DIR, draft_paths=DRAFT_REPORTS,
+                 reload_interval=RELOAD_INTERVAL):
+        self.sources = (store_path, reports_dir, draft_paths)
+        self.reload_interval = reload_interval
+        self._lock = threading.Lock()
+        self._checked_at = 0.0
+        self._signature = None
+        self._state = None  # (ReportData, version, response cache), swapped as one on reload
+        self.reload_if_changed(force=True)
+
+    @property
+    def data(self):
+        return self._state[0]
+
+    def reload_if_changed(self, force=False):
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.reload_interval:
+            return False
+        with self._lock:
+            self._checked_at = now
+            signature = source_signature(*self.sources)
+            if not force and signature == self._signature:
+                return False
+            with metrics.stage('api.load') as timing:
+                data = ReportData(*self.sources)
+                timing['box_scores'] = sum(len(rows) for rows in data.by_date.values())
+                timing['leagues'] = len(data.leagues)
+            version = hashlib.sha1(repr(signature).encode('utf-8')).hexdigest()[:12]
+            self._state, self._signature = (data, version, {}), signature
+            return True
+
+    @staticmethod
+    def route(data, path, query):
+        """(status, payload) for a request path and its parsed query string."""
+        parts = [unquote(part) for part in path.strip('/').split('/') if part]
+        try:
+            days = int(query.get('days', [DEFAULT_DAYS])[0])
+        except ValueError:
+            return 400, {'error': "days must be a whole number"}
+        if not 1 <= days <= MAX_DAYS:
+            return 400, {'error': f"days must be between 1 and {MAX_DAYS}"}
+        if not parts:
+            return 200, {'as_of': data.as_of, 'dates': len(data.dates), 'players': len(data.by_player.rows),
+                         'teams': sorted(data.by_team.rows), 'leagues': sorted(data.leagues),
+                         'drafts': sorted(data.drafts)}
+        kind, rest = parts[0], parts[1:]
+        if kind in ('players', 'teams') and len(rest) == 1:
+            if not data.as_of:
+                return 404, {'error': "no box scores stored"}
+            result = data.player(rest[0], days) if kind == 'players' else data.team(rest[0], days)
+            return (200, result) if result else (404, {'error': f"no box scores for {rest[0]}"})
+        if kind == 'dates' and len(rest) == 1:
+            if rest[0] not in data.by_date:
+                return 404, {'error': f"nothing stored for {rest[0]}"}
+            return 200, {'date': rest[0], 'box_scores': data.by_date[rest[0]], 'trending': data.trending.get(rest[0], [])}
+        if kind == 'leagues' and not rest:
+            return 200, [{'league_id': league_id, 'name': summary.get('name'), 'weeks': len(summary.get('weeks', []))}
+                         for league_id, summary in data.leagues.items()]
+        if kind == 'leagues' and len(rest) == 2 and rest[1] == 'draft':
+            picks = data.draft(rest[0])
+            return (200, picks) if picks else (404, {'error': f"no draft report for league {rest[0]}"})
+        if kind == 'leagues' and len(rest) == 2 and rest[1] in LEAGUE_SECTIONS:
+            summary = data.leagues.get(rest[0])
+            if summary is None:
+                return 404, {'error': f"no summary for league {rest[0]}"}
+            return 200, summary.get(LEAGUE_SECTIONS[rest[1]])
+        if kind == 'leagues' and len(rest) == 3 and rest[1] == 'rosters':
+            summary = data.leagues.get(rest[0], {})
+            standing = next((row for row in summary.get('standings', []) if str(row['roster_id']) == rest[2]), None)
+            picks = data.draft(rest[0], rest[2])
+            if standing is None and not picks:
+                return 404, {'error': f"no roster {rest[2]} in league {rest[0]}"}
+            return 200, {'league_id': rest[0], 'roster_id': rest[2], 'standing': standing, 'draft': picks}
+        return 404, {'error': f"unknown route {path}"}
+
+    def respond(self, url, if_none_match=None):
+        """(status, headers, body) for a GET of url, from the response cache when possible."""
+        self.reload_if_changed()
+        metrics.count('api.requests')
+        data, version, cache = self._state
+        cached = cache.get(url)
+        if cached is None:
+            parts = urlsplit(url)
+            status, payload = self.route(data, parts.path, parse_qs(parts.query))
+            body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+            etag = f'"{version}-{hashlib.sha1(body).hexdigest()[:16]}"'
+            cached = (status, etag, body)
+            if len(cache) >= MAX_CACHED_RESPONSES:
+                cache.clear()
+            cache[url] = cached
+        else:
+            metrics.count('api.cache_hits')
+        status, etag, body = cached
+        headers = {'Content-Type': 'application/json', 'ETag': etag, 'Cache-Control': 'no-cache'}
+        if status == 200 and etag_matches(if_none_match, etag):
+            metrics.count('api.not_modified')
+            return 304, headers, b''
+        return status, headers, body
+
+
+def make_server(api, host='127.0.0.1', port=DEFAULT_PORT):
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # ~30 ms, so not for --help
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # keep-alive, so a polling dashboard reuses its connection
+
+        def do_GET(self):
+            status, headers, body = api.respond(self.path, self.headers.get('If-None-Match'))
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local HTTP API over the stored box scores, league summaries and drafts")
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='Port to listen on')
+    parser.add_argument('--store', type=str, default=STORE_PATH, help='SQLite season store to serve')
+    parser.add_argument('--reports-dir', type=str, default=REPORTS_DIR, help='League summaries written by the batch runner')
+    args = parser.parse_args(argv)
+
+    draft_paths = ('draft_report.csv', os.path.join(args.reports_dir, 'draft_report.csv'))
+    api = ReadAPI(args.store, args.reports_dir, draft_paths)
+    data = api.data
+    print(f"✓ Loaded {len(data.dates)} day(s) of box scores, {len(data.leagues)} league summary(ies) "
+          f"and {len(data.drafts)} draft(s)")
+    server = make_server(api, args.host, args.port)
+    print(f"✓ Serving on http://{args.host}:{server.server_address[1]}/ (Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import metrics
+
+DEFAULT_MIN_INTERVAL = 3.0  # Basketball-Reference jails clients that exceed ~20 requests a minute
+BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'DNT': '1',
+    'Upgrade-Insecure-Requests': '1',
+}
+BLOCK_MARKERS = ('cf-browser-verification', 'Access Denied')
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class ScrapeError(Exception):
+    """A page could not be fetched after every retry."""
+
+
+class CircuitOpenError(ScrapeError):
+    """The host has blocked us repeatedly; requests are refused until the breaker's cool-down ends."""
+
+
+class TokenBucket:
+    """Allows rate requests per second on average, with bursts of up to capacity."""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a token is available and takes it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                wait = self._paused_until - now
+                if wait <= 0 and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                if wait <= 0:
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """Holds every caller for at least seconds (e.g. a 429's Retry-After) and drains saved-up bursts."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+
+
+class CircuitBreaker:
+    """Opens after failure_threshold consecutive blocks, then lets one trial request through per reset_timeout."""
+
+    def __init__(self, failure_threshold=5, reset_timeout=900.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        return 'half-open' if time.monotonic() - self.opened_at >= self.reset_timeout else 'open'
+
+    def before_request(self, host):
+        with self._lock:
+            state = self.state
+            if state == 'open' or (state == 'half-open' and self._trial_in_flight):
+                remaining = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+                raise CircuitOpenError(f"{host} circuit is open after {self.failures} blocked requests; "
+                                       f"retrying in {remaining:.0f}s")
+            if state == 'half-open':
+                self._trial_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """An error or 5xx: not a block, but a half-open trial it ends lets the next request try again."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_block(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class ScrapeClient:
+    """One reusable scraping session with per-host rate limiting, retries and circuit breaking.
+
+    The cloudscraper session (its Cloudflare clearance cookies and TLS connections) is created once
+    and shared by every caller and thread. Each host gets a token bucket refilling one request per
+    min_interval seconds. 429 and 5xx responses and connection errors are retried with full-jitter
+    exponential backoff; a 429's Retry-After also pauses the host's bucket for everyone. Blocks
+    (403, 429 or a challenge page) count towards the host's circuit breaker, and once it opens
+    get() raises CircuitOpenError immediately instead of digging the ban deeper.
+    """
+
+    def __init__(self, min_interval=DEFAULT_MIN_INTERVAL, burst=1, max_retries=4, backoff_base=2.0,
+                 backoff_max=120.0, failure_threshold=5, reset_timeout=900.0, timeout=30, session=None):
+        self.min_interval = min_interval
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.timeout = timeout
+        self._session = session
+        self._buckets = {}
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+
+    @staticmethod
+    def _create_session():
+        try:
+            import cloudscraper
+        except ImportError:  # cloudscraper is optional; a plain session with browser headers often suffices
+            import requests
+
+            session = requests.Session()
+            session.headers.update(BROWSER_HEADERS)
+            return session
+        return cloudscraper.create_scraper(browser={'browser': 'chrome', 'platform': 'windows', 'mobile': False})
+
+    def _host(self, host):
+        with self._lock:
+            if host not in self._buckets:
+                rate = 1.0 / self.min_interval if self.min_interval > 0 else float('inf')
+                self._buckets[host] = TokenBucket(rate, self.burst)
+                self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return self._buckets[host], self._breakers[host]
+
+    def breaker(self, url):
+        return self._host(urlparse(url).netloc)[1]
+
+    def backoff(self, attempt, retry_after=None):
+        """Seconds to wait before retry number attempt: full jitter, but never less than Retry-After."""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        return max(delay, retry_after or 0)
+
+    @staticmethod
+    def _retry_after(response):
+        try:
+            return float(response.headers.get('Retry-After', ''))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def is_blocked(response):
+        if response.status_code in (403, 429):
+            return True
+        return response.status_code == 200 and any(marker in response.text[:5000] for marker in BLOCK_MARKERS)
+
+    def get(self, url, **kwargs):
+        """GETs url and returns the response once it is neither blocked nor a retryable error.
+
+        Other error statuses (e.g. 404) are returned for the caller to handle. Raises
+        CircuitOpenError if the host's breaker is open and ScrapeError when retries run out.
+        """
+        host = urlparse(url).netloc
+        bucket, breaker = self._host(host)
+        kwargs.setdefault('timeout', self.timeout)
+        kwargs.setdefault('allow_redirects', True)
+        error = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                metrics.count('http.scrape.retries')
+                time.sleep(self.backoff(attempt - 1, retry_after))
+            try:
+                breaker.before_request(host)
+            except CircuitOpenError:
+                metrics.count('http.scrape.circuit_open')
+                raise
+            bucket.acquire()
+            retry_after = None
+            metrics.count('http.scrape.requests')
+            try:
+                response = self.session.get(url, **kwargs)
+            except Exception as e:  # connection resets and timeouts are worth another try
+                metrics.count('http.scrape.errors')
+                breaker.record_failure()
+                error = f"{type(e).__name__}: {e}"
+                continue
+
+            if self.is_blocked(response):
+                metrics.count('http.scrape.blocked')
+                breaker.record_block()
+                error = f"blocked ({response.status_code})"
+                if response.status_code == 429:
+                    retry_after = self._retry_after(response)
+                    bucket.pause(retry_after or self.backoff(attempt))
+                continue
+            if response.status_code in RETRY_STATUSES:
+                breaker.record_failure()
+                error = f"server error ({response.status_code})"
+                continue
+            breaker.record_success()
+            metrics.count('http.scrape.bytes', len(response.content))
+            return response
+        raise ScrapeError(f"{url} failed after {self.max_retries + 1} attempts: {error}")
+
+
+_default_scraper = None
+_default_lock = threading.Lock()
+
+
+def get_scraper():
+    """Returns the process-wide ScrapeClient, creating it on first use."""
+    global _default_scraper
+    with _default_lock:
+        if _default_scraper is None:
+            _default_scraper = ScrapeClient()
+        return _default_scraper
@@ -0,0 +1,263 @@
+import json
+import os
+import sqlite3
+import threading
+
+from names import name_key
+
+STORE_PATH = 'season_stats.db'
+
+TEXT_COLUMNS = ['name', 'team', 'location', 'opponent', 'outcome']
+INT_COLUMNS = [
+    'minutes_played', 'made_field_goals', 'attempted_field_goals', 'made_three_point_field_goals',
+    'attempted_three_point_field_goals', 'made_free_throws', 'attempted_free_throws',
+    'offensive_rebounds', 'defensive_rebounds', 'total_rebounds', 'assists', 'steals', 'blocks',
+    'turnovers', 'personal_fouls', 'points', 'plus_minus',
+]
+# In the parser's key order, so rows read back serialize exactly like the day's report
+BOX_SCORE_COLUMNS = TEXT_COLUMNS + INT_COLUMNS + ['fantasy_points']
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS box_scores (
+    date TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    {', '.join(f'{col} TEXT' for col in TEXT_COLUMNS)},
+    {', '.join(f'{col} INTEGER' for col in INT_COLUMNS)},
+    fantasy_points REAL,
+    league_fantasy_points TEXT,
+    page_order INTEGER,
+    PRIMARY KEY (date, name_key, team)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS box_scores_player ON box_scores (name_key, date);
+CREATE INDEX IF NOT EXISTS box_scores_team ON box_scores (team, date);
+
+CREATE TABLE IF NOT EXISTS trending (
+    date TEXT NOT NULL,
+    player_id TEXT NOT NULL,
+    count INTEGER,
+    PRIMARY KEY (date, player_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS adp (
+    date TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    name TEXT,
+    rank INTEGER,
+    adp REAL,
+    PRIMARY KEY (date, name_key)
+) WITHOUT ROWID;
+
+-- Player counts of days imported from legacy JSON reports, which only kept their top players
+CREATE TABLE IF NOT EXISTS report_totals (
+    date TEXT PRIMARY KEY,
+    total_players INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS manifest (
+    date TEXT NOT NULL,
+    source TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    ingested_at TEXT NOT NULL,
+    seq INTEGER NOT NULL DEFAULT 0,  -- increases with every record_hash; ingested_at is only to the second
+    PRIMARY KEY (date, source)
+) WITHOUT ROWID;
+"""
+
+
+class SeasonStore:
+    """SQLite store of every day's full box scores, Sleeper trending adds and ADP snapshots.
+
+    Rows are keyed by date with secondary indexes on player and team, so date-range,
+    player and team reads only touch the matching rows.
+    """
+
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(SCHEMA)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(box_scores)")}
+            if 'league_fantasy_points' not in columns:  # stores created before per-league scores were kept
+                self._conn.execute("ALTER TABLE box_scores ADD COLUMN league_fantasy_points TEXT")
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(manifest)")}
+            if 'seq' not in columns:  # stores created before manifest entries were numbered
+                self._conn.execute("ALTER TABLE manifest ADD COLUMN seq INTEGER NOT NULL DEFAULT 0")
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write_day(self, date, box_scores, trending=None, total_players=None):
+        """Replaces everything stored for date (a YYYY-MM-DD string) with box_scores and trending.
+
+        total_players is only for partial days (a legacy report's top players); otherwise the
+        day's player count is the number of rows stored.
+        """
+        rows = [
+            (date, name_key(stat['name']), *(stat.get(col) for col in BOX_SCORE_COLUMNS),
+             json.dumps(stat['league_fantasy_points']) if stat.get('league_fantasy_points') is not None else None,
+             page_order)
+            for page_order, stat in enumerate(box_scores)
+        ]
+        columns = ['date', 'name_key'] + BOX_SCORE_COLUMNS + ['league_fantasy_points', 'page_order']
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM box_scores WHERE date = ?", (date,))
+            self._conn.execute("DELETE FROM report_totals WHERE date = ?", (date,))
+            if total_players is not None:
+                self._conn.execute("INSERT INTO report_totals (date, total_players) VALUES (?, ?)",
+                                   (date, total_players))
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO box_scores ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                rows,
+            )
+            if trending is not None:
+                self._conn.execute("DELETE FROM trending WHERE date = ?", (date,))
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO trending (date, player_id, count) VALUES (?, ?, ?)",
+                    [(date, str(t['player_id']), t.get('count')) for t in trending],
+                )
+
+    def write_adp(self, date, rows):
+        """Replaces the ADP snapshot for date with rows of {'name', 'rank', 'adp'}."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM adp WHERE date = ?", (date,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO adp (date, name_key, name, rank, adp) VALUES (?, ?, ?, ?, ?)",
+                [(date, name_key(row['name']), row['name'], row.get('rank'), row['adp']) for row in rows],
+            )
+
+    def adp_dates(self):
+        """Every date with an ADP snapshot, oldest first."""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT DISTINCT date FROM adp ORDER BY date")]
+
+    def read_adp(self, date):
+        """The ADP snapshot taken on date, best ADP first."""
+        with self._lock:
+            cursor = self._conn.execute("SELECT name, rank, adp FROM adp WHERE date = ? ORDER BY adp", (date,))
+            return [dict(row) for row in cursor]
+
+    def content_hash(self, date, source):
+        """Returns the sha256 recorded for a date's source payload at its last ingestion, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT sha256 FROM manifest WHERE date = ? AND source = ?",
+                                     (date, source)).fetchone()
+        return row[0] if row else None
+
+    def record_hash(self, date, source, digest):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO manifest (date, source, sha256, ingested_at, seq) "
+                "VALUES (?, ?, ?, datetime('now'), (SELECT COALESCE(MAX(seq), 0) + 1 FROM manifest))",
+                (date, source, digest),
+            )
+
+    def ingested_since(self, seq=None, source=None):
+        """{date: seq} of manifest entries (of one source, if given) recorded after the entry numbered seq."""
+        clauses, params = [], []
+        if seq is not None:
+            clauses.append("seq > ?")
+            params.append(seq)
+        if source is not None:
+            clauses.append("source = ?")
+            params.append(source)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            cursor = self._conn.execute(f"SELECT date, MAX(seq) FROM manifest{where} GROUP BY date", params)
+            return dict(cursor.fetchall())
+
+    def dates(self):
+        """Every date with stored box scores, oldest first."""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT DISTINCT date FROM box_scores ORDER BY date")]
+
+    def _where(self, start, end, player, team):
+        clauses, params = [], []
+        if start:
+            clauses.append("date >= ?")
+            params.append(str(start))
+        if end:
+            clauses.append("date <= ?")
+            params.append(str(end))
+        if player:
+            clauses.append("name_key = ?")
+            params.append(name_key(player))
+        if team:
+            clauses.append("team = ?")
+            params.append(team.upper())
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def read_box_scores(self, start=None, end=None, player=None, team=None, columns=None, order_by='date, page_order'):
+        """Returns stored box scores as dicts, filtered by inclusive date range, player name and/or team."""
+        where, params = self._where(start, end, player, team)
+        selected = ['date'] + (columns or BOX_SCORE_COLUMNS)
+        with self._lock:
+            cursor = self._conn.execute(f"SELECT {', '.join(selected)} FROM box_scores{where} ORDER BY {order_by}",
+                                        params)
+            return [dict(row) for row in cursor]
+
+    def read_frame(self, start=None, end=None, player=None, team=None, columns=None):
+        """read_box_scores as a pandas DataFrame."""
+        import pandas as pd
+        return pd.DataFrame(self.read_box_scores(start, end, player, team, columns),
+                            columns=['date'] + (columns or BOX_SCORE_COLUMNS))
+
+    def read_trending(self, start=None, end=None):
+        where, params = self._where(start, end, None, None)
+        with self._lock:
+            cursor = self._conn.execute(f"SELECT date, player_id, count FROM trending{where} ORDER BY date, count DESC",
+                                        params)
+            return [dict(row) for row in cursor]
+
+    def export_json_report(self, date, path=None, top_n=20):
+        """Writes the legacy fantasy_report_YYYY-MM-DD.json for a stored date and returns the report.
+
+        Players keep the parser's field order and their per-league points, so the file matches
+        the one fantasy_report wrote for the day.
+        """
+        top_players = self.read_box_scores(date, date, columns=BOX_SCORE_COLUMNS + ['league_fantasy_points'],
+                                           order_by='fantasy_points DESC, page_order')
+        for player in top_players:
+            player.pop('date')
+            league_points = player.pop('league_fantasy_points')
+            if league_points is not None:
+                player['league_fantasy_points'] = json.loads(league_points)
+        # Sleeper's own key order for trending adds
+        trending = [{'count': t['count'], 'player_id': t['player_id']} for t in self.read_trending(date, date)]
+        with self._lock:
+            total = self._conn.execute("SELECT total_players FROM report_totals WHERE date = ?", (date,)).fetchone()
+        report = {
+            'date': date,
+            'top_players': top_players[:top_n],
+            'trending': trending,
+            'total_players': total[0] if total else len(top_players),
+        }
+        with open(path or f"fantasy_report_{date}.json", 'w') as f:
+            json.dump(report, f, indent=4)
+        return report
+
+
+def import_json_reports(store, paths):
+    """Loads legacy fantasy_report_*.json files into store (only their saved top players and player count survive)."""
+    for path in paths:
+        with open(path, 'r') as f:
+            report = json.load(f)
+        store.write_day(report['date'], report.get('top_players', []), report.get('trending'),
+                        total_players=report.get('total_players'))
+    return len(paths)
+
+
+if __name__ == "__main__":
+    import glob
+    import sys
+
+    paths = sys.argv[1:] or sorted(glob.glob('fantasy_report_*.json'))
+    with SeasonStore() as store:
+        print(f"✓ Imported {import_json_reports(store, paths)} report(s) into {os.path.abspath(store.path)}")
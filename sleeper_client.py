@@ -0,0 +1,65 @@
+import threading
+
+import metrics
+
+SLEEPER_API_URL = "https://api.sleeper.app/v1"
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+class SleeperClient:
+    """Shared keep-alive session for the Sleeper API with a concurrency limit."""
+
+    def __init__(self, max_concurrency=DEFAULT_MAX_CONCURRENCY, timeout=10):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        # requests costs ~100 ms to import, so it is loaded only once a client is actually needed
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+        # Size the connection pool to the concurrency limit so parallel requests reuse sockets
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_concurrency)
+        self.session.mount("https://", adapter)
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+
+    def get(self, path, **kwargs):
+        """GETs a Sleeper API path (e.g. '/user/foo') and returns the response."""
+        url = path if path.startswith("http") else f"{SLEEPER_API_URL}{path}"
+        kwargs.setdefault("timeout", self.timeout)
+        with self._slots:
+            response = self.session.get(url, **kwargs)
+        metrics.count('http.sleeper.requests')
+        metrics.count('http.sleeper.bytes', len(response.content))
+        return response
+
+    def get_many(self, paths):
+        """GETs every path concurrently and returns the responses in the same order."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        paths = list(paths)
+        if not paths:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(paths))) as pool:
+            return list(pool.map(self.get, paths))
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_default_client = None
+_default_lock = threading.Lock()
+
+
+def get_client():
+    """Returns the process-wide SleeperClient, creating it on first use."""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = SleeperClient()
+        return _default_client
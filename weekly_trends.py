@@ -0,0 +1,223 @@
+import argparse
+import datetime
+import heapq
+import json
+import os
+from collections import defaultdict, deque
+
+from names import name_key
+from season_store import STORE_PATH, SeasonStore
+
+WINDOWS = (7, 14, 30)
+STATE_PATH = os.path.join('.cache', 'trends_state.json')
+
+
+class RollingWindow:
+    """Running count, sum and sum of squares of one player's games in the last `days` days."""
+    __slots__ = ('days', 'games', 'total', 'total_sq')
+
+    def __init__(self, days):
+        self.days = days
+        self.games = deque()  # (date ordinal, fantasy points), oldest first
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def add(self, ordinal, fp):
+        self.games.append((ordinal, fp))
+        self.total += fp
+        self.total_sq += fp * fp
+
+    def expire(self, today):
+        """Drops games that fall outside the window ending on today (an ordinal)."""
+        while self.games and self.games[0][0] <= today - self.days:
+            _, fp = self.games.popleft()
+            self.total -= fp
+            self.total_sq -= fp * fp
+
+    @property
+    def count(self):
+        return len(self.games)
+
+    @property
+    def mean(self):
+        return self.total / len(self.games) if self.games else 0.0
+
+    @property
+    def variance(self):
+        if not self.games:
+            return 0.0
+        mean = self.mean
+        return max(self.total_sq / len(self.games) - mean * mean, 0.0)
+
+
+class TrendEngine:
+    """Per-player rolling fantasy point windows, updated one day at a time.
+
+    Each game is added once and scheduled to expire from each window on a known date, so
+    advancing a day touches only that day's games and the games that age out of a window,
+    never the player's full history.
+    """
+
+    def __init__(self, windows=WINDOWS):
+        self.windows = tuple(windows)
+        self.reset()
+
+    def reset(self):
+        """Forgets every game, so the store can be replayed from the start."""
+        self.players = {}  # name_key -> {days: RollingWindow}
+        self.names = {}  # name_key -> display name
+        self.last_ordinal = None
+        self.synced_seq = None  # highest manifest seq already reflected in the windows
+        self._expiry = defaultdict(list)  # ordinal -> [(name_key, days)] leaving a window that day
+
+    def advance(self, date):
+        """Moves the engine to date, expiring games that have aged out of each window."""
+        ordinal = date.toordinal()
+        if self.last_ordinal is not None:
+            for day in range(self.last_ordinal + 1, ordinal + 1):
+                for key, days in self._expiry.pop(day, ()):
+                    windows = self.players.get(key)
+                    if windows is None:
+                        continue  # Already dropped earlier in this day's expirations
+                    windows[days].expire(day)
+                    if windows[max(self.windows)].count == 0:
+                        del self.players[key]
+        self.last_ordinal = ordinal
+
+    def add_day(self, date, rows):
+        """Adds one day of {'name', 'fantasy_points'} rows. Days must arrive in date order."""
+        ordinal = date.toordinal()
+        if self.last_ordinal is not None and ordinal <= self.last_ordinal:
+            raise ValueError(f"{date} is not after the last day added ({datetime.date.fromordinal(self.last_ordinal)})")
+        self.advance(date)
+        for row in rows:
+            key = name_key(row['name'])
+            self.names[key] = row['name']
+            windows = self.players.get(key)
+            if windows is None:
+                windows = self.players[key] = {days: RollingWindow(days) for days in self.windows}
+            for days, window in windows.items():
+                window.add(ordinal, row['fantasy_points'])
+                self._expiry[ordinal + days].append((key, days))
+
+    def stats(self, player):
+        """Returns {days: {'games', 'sum', 'mean', 'variance'}} for a player name."""
+        windows = self.players.get(name_key(player), {})
+        return {days: {'games': w.count, 'sum': w.total, 'mean': w.mean, 'variance': w.variance}
+                for days, w in windows.items()}
+
+    def movers(self, k=10, short=7, long=30, min_games=3):
+        """Returns (risers, fallers): the k players whose short-window mean most exceeds, or most trails,
+        their long-window mean. Each entry is (name, delta, short mean, long mean)."""
+        deltas = []
+        for key, windows in self.players.items():
+            recent, baseline = windows[short], windows[long]
+            if recent.count >= min_games and baseline.count > recent.count:
+                deltas.append((recent.mean - baseline.mean, key))
+        entry = lambda item: (self.names[item[1]], item[0], self.players[item[1]][short].mean,
+                              self.players[item[1]][long].mean)
+        risers = [entry(item) for item in heapq.nlargest(k, deltas)]
+        fallers = [entry(item) for item in heapq.nsmallest(k, deltas)]
+        return risers, fallers
+
+    def to_dict(self):
+        return {
+            'windows': list(self.windows),
+            'last_ordinal': self.last_ordinal,
+            'synced_seq': self.synced_seq,
+            'names': self.names,
+            # Each window is a suffix of the longest one, so only the longest needs saving
+            'games': {key: list(windows[max(self.windows)].games) for key, windows in self.players.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        engine = cls(data['windows'])
+        engine.names = data['names']
+        engine.last_ordinal = data['last_ordinal']
+        engine.synced_seq = data.get('synced_seq')
+        for key, games in data['games'].items():
+            windows = engine.players[key] = {days: RollingWindow(days) for days in engine.windows}
+            for ordinal, fp in games:
+                for days, window in windows.items():
+                    if ordinal > engine.last_ordinal - days:
+                        window.add(ordinal, fp)
+                        engine._expiry[ordinal + days].append((key, days))
+        return engine
+
+    def save(self, path=STATE_PATH):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=STATE_PATH):
+        try:
+            with open(path, 'r') as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError):
+            return cls()
+
+
+def update_from_store(engine, store):
+    """Feeds the engine every stored day after the last one it has seen. Returns the number of days added.
+
+    Days at or before the last one seen that the manifest shows were re-ingested since the
+    previous update (a re-scraped or corrected day) cannot be patched into the windows, so the
+    engine is reset and the whole store replayed.
+    """
+    changed = store.ingested_since(engine.synced_seq, source='daily_leaders')
+    if engine.last_ordinal is not None:
+        stale = sorted(date for date in changed if datetime.date.fromisoformat(date).toordinal() <= engine.last_ordinal)
+        if stale:
+            print(f"🔄 {len(stale)} already-seen day(s) re-ingested since the last update ({stale[0]} first), rebuilding")
+            engine.reset()
+    if changed:
+        engine.synced_seq = max([engine.synced_seq or 0, *changed.values()])
+    start = None
+    if engine.last_ordinal is not None:
+        start = datetime.date.fromordinal(engine.last_ordinal + 1).isoformat()
+    by_date = defaultdict(list)
+    for row in store.read_box_scores(start=start, columns=['name', 'fantasy_points']):
+        by_date[row['date']].append(row)
+    for date in sorted(by_date):
+        engine.add_day(datetime.date.fromisoformat(date), by_date[date])
+    return len(by_date)
+
+
+def print_movers(risers, fallers, short=7, long=30):
+    print(f"\n{'='*60}")
+    print(f"Risers ({short}-day vs {long}-day average):")
+    print(f"{'='*60}")
+    for i, (name, delta, recent, baseline) in enumerate(risers, 1):
+        print(f"{i:2d}. {name:25s} {delta:+6.2f} FP  ({recent:.1f} vs {baseline:.1f})")
+    print(f"\n{'='*60}")
+    print(f"Fallers ({short}-day vs {long}-day average):")
+    print(f"{'='*60}")
+    for i, (name, delta, recent, baseline) in enumerate(fallers, 1):
+        print(f"{i:2d}. {name:25s} {delta:+6.2f} FP  ({recent:.1f} vs {baseline:.1f})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Who's hot: rolling fantasy point trends")
+    parser.add_argument('--store', type=str, default=STORE_PATH, help='SQLite season store to read')
+    parser.add_argument('--state', type=str, default=STATE_PATH, help='Saved trend engine state')
+    parser.add_argument('--top', type=int, default=10, help='How many risers and fallers to show')
+    parser.add_argument('--min-games', type=int, default=3, help='Minimum games in the short window')
+    parser.add_argument('--rebuild', action='store_true', help='Ignore saved state and replay the whole store')
+    args = parser.parse_args(argv)
+
+    engine = TrendEngine() if args.rebuild else TrendEngine.load(args.state)
+    with SeasonStore(args.store) as store:
+        added = update_from_store(engine, store)
+    engine.save(args.state)
+    print(f"✓ Added {added} new day(s) to the trend engine")
+
+    risers, fallers = engine.movers(k=args.top, min_games=args.min_games)
+    print_movers(risers, fallers)
+
+
+if __name__ == "__main__":
+    main()